@@ -0,0 +1,82 @@
+"""Counting and filtering responses: columnar store versus scanning the
+FormResponse objects.
+
+Run with ``PYTHONPATH=src python benchmarks/columnar_filter.py``.
+"""
+
+import argparse
+import random
+import time
+
+from core.domain.columns import FormColumns
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+from core.domain.value_objects import AllOf, FieldEquals
+
+
+def best_of(repeat: int, function) -> float:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return min(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--responses", type=int, default=1_000_000)
+    parser.add_argument("--fields", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    form = Form.create(title="benchmark")
+    for _ in range(args.fields):
+        form.add_field(BooleanField.create())
+    fields = form.get_ordered_fields()
+    responses = []
+    for _ in range(args.responses):
+        response = FormResponse.create(for_form_uuid=form.uuid)
+        for field in fields:
+            if random.random() < 0.9:
+                value = random.random() < 0.5
+                response.add_field_response(
+                    FieldResponse.create(value, for_field=field.uuid)
+                )
+        responses.append(response)
+
+    columns = FormColumns(form)
+    started = time.perf_counter()
+    for response in responses:
+        columns.add(response)
+    appended = time.perf_counter() - started
+
+    a, b = fields[0].uuid, fields[1].uuid
+    condition = AllOf((FieldEquals(a, True), FieldEquals(b, False)))
+
+    def matches(response: FormResponse) -> bool:
+        answer_a, answer_b = response.get_response(a), response.get_response(b)
+        return (
+            answer_a is not None
+            and answer_a.value is True
+            and answer_b is not None
+            and answer_b.value is False
+        )
+
+    cases = {
+        "scan count": lambda: sum(1 for r in responses if matches(r)),
+        "columnar count": lambda: columns.count(condition),
+        "scan filter": lambda: [r.uuid for r in responses if matches(r)],
+        "columnar filter": lambda: columns.filter(condition),
+    }
+    assert cases["scan count"]() == cases["columnar count"]()
+    print(
+        f"{args.responses} responses, {args.fields} boolean fields, "
+        f"appending {appended / args.responses * 1e9:.0f} ns/response"
+    )
+    print("A is True and B is False")
+    for label, function in cases.items():
+        print(f"{label:<18} {best_of(args.repeat, function) * 1e3:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
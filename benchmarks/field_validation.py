@@ -0,0 +1,99 @@
+"""Validating 1M answers per field type: per-call checks versus the
+validator each field compiles once, called per value and in batch.
+
+Run with ``PYTHONPATH=src python benchmarks/field_validation.py``.
+"""
+
+import argparse
+import random
+import re
+import string
+import time
+from typing import Any
+
+from core.domain.entities import (
+    BooleanField,
+    EmailField,
+    Field,
+    SingleSelectField,
+    TextField,
+)
+
+_EMAIL_PATTERN = r"[^@\s]+@[^@\s.]+(?:\.[^@\s.]+)+"
+
+
+def best_of(repeat: int, function) -> float:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return min(durations)
+
+
+def word(length: int) -> str:
+    return "".join(random.choices(string.ascii_lowercase, k=length))
+
+
+def cases(options: int, count: int) -> list[tuple[Field, list[Any], Any]]:
+    # every case is a field, its answers and how a check built per call looks
+    text = TextField.create()
+    text.set_max_length(64)
+    select = SingleSelectField.create()
+    select.set_options(f"option-{i}" for i in range(options))
+    choices = [*select.options, "unknown", 1]
+    emails = [f"{word(8)}@{word(6)}.com" for _ in range(1000)] + ["no-at-sign"]
+    return [
+        (
+            BooleanField.create(),
+            [random.random() < 0.5 for _ in range(count)],
+            lambda value: isinstance(value, bool),
+        ),
+        (
+            text,
+            [word(random.randint(1, 80)) for _ in range(count)],
+            lambda value: isinstance(value, str) and len(value) <= text.max_length,
+        ),
+        (
+            EmailField.create(),
+            [random.choice(emails) for _ in range(count)],
+            lambda value: (
+                isinstance(value, str)
+                and re.fullmatch(_EMAIL_PATTERN, value) is not None
+            ),
+        ),
+        (
+            select,
+            [random.choice(choices) for _ in range(count)],
+            lambda value: value in list(select.options),
+        ),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--values", type=int, default=1_000_000)
+    parser.add_argument("--options", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.values} values, select fields with {args.options} options")
+    print(f"{'field':<18} {'per call':>10} {'is_valid':>10} {'is_valid_many':>14}")
+    for field, values, check in cases(args.options, args.values):
+        assert [check(value) for value in values] == field.is_valid_many(values)
+        timings = [
+            best_of(args.repeat, lambda: [check(value) for value in values]),
+            best_of(args.repeat, lambda: [field.is_valid(value) for value in values]),
+            best_of(args.repeat, lambda: field.is_valid_many(values)),
+        ]
+        print(
+            f"{type(field).__name__:<18}"
+            + "".join(
+                f" {timing * 1e9 / args.values:>7.0f} ns" for timing in timings[:2]
+            )
+            + f" {timings[2] * 1e9 / args.values:>11.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
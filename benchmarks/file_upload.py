@@ -0,0 +1,79 @@
+"""Streaming a file upload into LocalBlobStore: throughput, peak memory and
+how long the event loop is blocked at most meanwhile.
+
+Each upload runs in a fresh interpreter, so its peak RSS only covers that
+upload. A small and a large file are uploaded to show that memory does not
+grow with the file size.
+
+Run with ``PYTHONPATH=src python benchmarks/file_upload.py``.
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator
+
+from core.domain.value_objects import FileLimits
+from infrastructure.blobs import LocalBlobStore
+
+
+async def chunks(size: int, chunk_size: int) -> AsyncIterator[bytes]:
+    # a fresh chunk each time, as a server would hand out received data
+    for start in range(0, size, chunk_size):
+        yield os.urandom(min(chunk_size, size - start))
+
+
+async def upload(directory: str, size: int, chunk_size: int) -> None:
+    store = LocalBlobStore(directory)
+    stalls = [0.0]
+    is_uploading = True
+
+    async def watch_loop() -> None:
+        while is_uploading:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stalls.append(time.perf_counter() - started - 0.001)
+
+    watcher = asyncio.create_task(watch_loop())
+    started = time.perf_counter()
+    reference = await store.save(chunks(size, chunk_size), FileLimits(max_size=size))
+    elapsed = time.perf_counter() - started
+    is_uploading = False
+    await watcher
+    await store.close()
+    os.remove(store.get_path(reference))
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{size / 2**20:>6.0f} MiB {size / elapsed / 2**20:>7.1f} MiB/s "
+        f"peak RSS {peak:>6.1f} MiB, longest loop stall {max(stalls) * 1e3:>5.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 1024])
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    parser.add_argument("--directory", default=None)
+    parser.add_argument("--upload", type=int, metavar="MIB")
+    args = parser.parse_args()
+
+    if args.upload:
+        asyncio.run(upload(args.directory, args.upload * 2**20, args.chunk_size))
+        return
+
+    directory = args.directory or tempfile.mkdtemp()
+    for size in args.sizes:
+        subprocess.run(
+            [sys.executable, __file__, "--directory", directory]
+            + ["--chunk-size", str(args.chunk_size), "--upload", str(size)],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""P99 latency of listing forms: one page versus the whole catalogue.
+
+Run with ``PYTHONPATH=src python benchmarks/form_listing.py``.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from core.domain.entities import Form
+from core.domain.repositories import IRepository
+from infrastructure.repositories import InMemoryRepository, SqliteRepository
+
+
+def p99_ms(function, samples: int) -> float:
+    durations = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return statistics.quantiles(durations, n=100)[98] * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'backend':<10} {'forms':>8} {'page p99 ms':>12} {'all p99 ms':>11}")
+    for size in args.sizes:
+        forms = [Form.create(title=f"form {i}") for i in range(size)]
+        path = os.path.join(tempfile.mkdtemp(), "bench.sqlite3")
+        repositories: dict[str, IRepository] = {
+            "memory": InMemoryRepository(),
+            "sqlite": SqliteRepository(path),
+        }
+        for name, repository in repositories.items():
+            for form in forms:
+                repository.save_form(form)
+            afters = [random.choice(forms).uuid for _ in range(args.samples)]
+            page = p99_ms(
+                lambda: repository.get_forms_page(afters.pop(), args.limit),
+                args.samples,
+            )
+            full = p99_ms(repository.get_all_forms, min(args.samples, 20))
+            print(f"{name:<10} {size:>8} {page:>12.3f} {full:>11.1f}")
+            repository.close()
+
+
+if __name__ == "__main__":
+    main()
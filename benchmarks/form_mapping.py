@@ -0,0 +1,60 @@
+"""Mapping forms to list DTOs and serializing them: model_validate through
+the FromValueObjectType wrap validators versus the dict builders in
+core.application.mappers.
+
+Run with ``PYTHONPATH=src python benchmarks/form_mapping.py``.
+"""
+
+import argparse
+import time
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from core.application import mappers
+from core.application.queries import ListAllFormsQuery
+from core.domain.entities import Form
+
+FORM_LIST = TypeAdapter(list[ListAllFormsQuery.ResultDTO])
+FIELDS = frozenset({"uuid", "title"})
+
+
+def validated(forms: list[Form]) -> list[ListAllFormsQuery.ResultDTO]:
+    return [ListAllFormsQuery.ResultDTO.model_validate(form) for form in forms]
+
+
+def mapped(forms: list[Form]) -> list[mappers.FormListItem]:
+    return [mappers.to_form_list_item(form, FIELDS) for form in forms]
+
+
+def best_of(repeat: int, function) -> float:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return min(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--forms", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    forms = [Form.create(title=f"form {i}") for i in range(args.forms)]
+    cases = {
+        "model_validate": lambda: validated(forms),
+        "mappers": lambda: mapped(forms),
+        "model_validate + dump_json": lambda: FORM_LIST.dump_json(validated(forms)),
+        "mappers + to_json": lambda: to_json(mapped(forms)),
+    }
+    print(f"{args.forms} forms")
+    for label, function in cases.items():
+        elapsed = best_of(args.repeat, function)
+        per_form = elapsed / args.forms * 1e9
+        print(f"{label:<28} {elapsed * 1e3:>8.1f} ms {per_form:>6.0f} ns/form")
+
+
+if __name__ == "__main__":
+    main()
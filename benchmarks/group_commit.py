@@ -0,0 +1,76 @@
+"""Ingest rate of concurrent submitters on SQLite: one transaction per
+response versus the group-committing ResponseWriter.
+
+Run with ``PYTHONPATH=src python benchmarks/group_commit.py``.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from core.application.writers import ResponseWriter
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+from infrastructure.repositories import SqliteRepository, ThreadPoolRepository
+
+
+def make_response(form: Form) -> FormResponse:
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    for field in form.get_ordered_fields():
+        response.add_field_response(FieldResponse.create(True, for_field=field.uuid))
+    return response
+
+
+async def run(args: argparse.Namespace, label: str, is_grouped: bool) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        repository = ThreadPoolRepository(
+            SqliteRepository(os.path.join(directory, "bench.sqlite3")),
+            max_workers=args.workers,
+        )
+        form = Form.create(title="benchmark")
+        for _ in range(args.fields):
+            form.add_field(BooleanField.create())
+        await repository.save_form(form)
+        writer = ResponseWriter(
+            repository, max_batch_size=args.batch, max_delay=args.delay_ms / 1000
+        )
+        writer.start()
+
+        async def submitter() -> None:
+            for _ in range(args.responses // args.clients):
+                response = make_response(form)
+                if is_grouped:
+                    await writer.write(form, response)
+                else:
+                    await repository.save_form_response(response)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(submitter() for _ in range(args.clients)))
+        elapsed = time.perf_counter() - started
+        await writer.stop()
+        await repository.close()
+    batches = f"  ({writer.batches} batches)" if is_grouped else ""
+    print(f"{label:<26} {args.responses / elapsed:>10.0f} responses/s{batches}")
+
+
+async def benchmark(args: argparse.Namespace) -> None:
+    print(f"{args.clients} concurrent submitters, {args.fields} fields")
+    await run(args, "transaction per response", is_grouped=False)
+    await run(args, "group commit", is_grouped=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--responses", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--fields", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--delay-ms", type=float, default=2)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
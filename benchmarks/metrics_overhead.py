@@ -0,0 +1,96 @@
+"""What the metrics cost per request: the ASGI middleware, a handler timer
+and a repository timer, each against the same code without them.
+
+Run with ``PYTHONPATH=src python benchmarks/metrics_overhead.py``.
+"""
+
+import argparse
+import asyncio
+import time
+
+from core.application import metrics
+from core.domain.entities import Form
+from core.domain.repositories import IAsyncRepository
+from core.domain.value_objects import FormUUID
+from infrastructure.repositories import InstrumentedRepository
+from presentation.api.metrics import MetricsMiddleware
+
+_START = {"type": "http.response.start", "status": 200, "headers": []}
+_BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+class Route:
+    path = "/forms/{form_uuid}"
+
+
+async def app(scope, receive, send) -> None:
+    scope["route"] = Route
+    await send(_START)
+    await send(_BODY)
+
+
+async def receive() -> dict:
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message: dict) -> None:
+    pass
+
+
+class Repository(IAsyncRepository):
+    async def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
+        return None
+
+
+async def handle(query: object) -> None:
+    return None
+
+
+async def per_call(count: int, call) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        await call()
+    return (time.perf_counter() - started) / count
+
+
+async def benchmark(count: int, repeat: int) -> None:
+    instrumented_app = MetricsMiddleware(app)
+    timed_handle = metrics.timed_handler("BenchmarkQueryHandler", handle)
+    repository = Repository()
+    instrumented_repository = InstrumentedRepository(repository)
+    form_uuid = FormUUID()
+
+    def scope() -> dict:
+        return {"type": "http", "method": "GET", "path": "/forms/x"}
+
+    cases = {
+        "ASGI middleware": (
+            lambda: app(scope(), receive, send),
+            lambda: instrumented_app(scope(), receive, send),
+        ),
+        "handler timer": (lambda: handle(None), lambda: timed_handle(None)),
+        "repository timer": (
+            lambda: repository.get_form_by_uuid(form_uuid),
+            lambda: instrumented_repository.get_form_by_uuid(form_uuid),
+        ),
+    }
+    print(f"{'':<18} {'plain':>9} {'timed':>9} {'overhead':>9}")
+    for label, (plain, timed) in cases.items():
+        plain_time = min([await per_call(count, plain) for _ in range(repeat)])
+        timed_time = min([await per_call(count, timed) for _ in range(repeat)])
+        print(
+            f"{label:<18} {plain_time * 1e6:>6.2f} us {timed_time * 1e6:>6.2f} us"
+            f" {(timed_time - plain_time) * 1e6:>6.2f} us"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.count, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
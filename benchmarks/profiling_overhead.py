@@ -0,0 +1,81 @@
+"""What the profiler costs per request: installed but not choosing the
+request, and profiling it including writing the stats file, each against
+the same app without the middleware.
+
+Run with ``PYTHONPATH=src python benchmarks/profiling_overhead.py``.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from presentation.api.profiling import ProfilingMiddleware, ProfilingSettings
+
+_START = {"type": "http.response.start", "status": 200, "headers": []}
+_BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+async def app(scope, receive, send) -> None:
+    # stands in for a handler doing a little work
+    sum(range(200))
+    await send(_START)
+    await send(_BODY)
+
+
+async def receive() -> dict:
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message: dict) -> None:
+    pass
+
+
+async def per_call(count: int, call) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        await call()
+    return (time.perf_counter() - started) / count
+
+
+async def benchmark(count: int, repeat: int) -> None:
+    directory = tempfile.mkdtemp(prefix="custom_forms_profiles_")
+    sampled = ProfilingMiddleware(
+        app, ProfilingSettings(directory=directory, rate=0.01, token="secret")
+    )
+    profiled = ProfilingMiddleware(app, ProfilingSettings(directory=directory, rate=1))
+
+    def scope() -> dict:
+        return {"type": "http", "method": "GET", "path": "/forms/x", "headers": []}
+
+    cases = {
+        "not chosen": (lambda: sampled(scope(), receive, send), count),
+        # far fewer calls, every one writes a file
+        "profiled": (lambda: profiled(scope(), receive, send), count // 100),
+    }
+    print(f"{'':<12} {'plain':>9} {'with':>10} {'overhead':>10}")
+    for label, (call, calls) in cases.items():
+        plain_time = min(
+            [
+                await per_call(calls, lambda: app(scope(), receive, send))
+                for _ in range(repeat)
+            ]
+        )
+        with_time = min([await per_call(calls, call) for _ in range(repeat)])
+        print(
+            f"{label:<12} {plain_time * 1e6:>6.2f} us {with_time * 1e6:>7.2f} us"
+            f" {(with_time - plain_time) * 1e6:>7.2f} us"
+        )
+    print(f"{sampled.profiles + profiled.profiles} profiles written to {directory}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.count, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Handler throughput with a blocking repository, awaited directly or via threads.
+
+Run with ``PYTHONPATH=src python benchmarks/repository_concurrency.py``.
+"""
+
+import argparse
+import asyncio
+import time
+
+from core.application.caches import SerializedFormCache
+from core.application.handlers import GetSerializedFormQueryHandler
+from core.application.queries import GetFormQuery
+from core.domain.entities import Form
+from core.domain.value_objects import FormUUID
+from infrastructure.repositories import InMemoryRepository, ThreadPoolRepository
+
+
+class SlowRepository(InMemoryRepository):
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self._latency = latency
+
+    def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
+        time.sleep(self._latency)  # stands in for a database round trip
+        return super().get_form_by_uuid(form_uuid)
+
+
+class BlockingRepository:
+    # awaits the sync repository on the event loop, like the handlers used to
+    def __init__(self, repository: InMemoryRepository) -> None:
+        self._repository = repository
+
+    async def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
+        return self._repository.get_form_by_uuid(form_uuid)
+
+
+async def throughput(
+    handler: GetSerializedFormQueryHandler, query, clients: int, requests: int
+):
+    async def client() -> None:
+        for _ in range(requests):
+            await handler.handle(query)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return clients * requests / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16, 32])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--workers", type=int, default=32)
+    args = parser.parse_args()
+
+    repository = SlowRepository(args.latency)
+    form = Form.create(title="form")
+    repository.save_form(form)
+    query = GetFormQuery(uuid=form.uuid.value)
+    blocking = GetSerializedFormQueryHandler(
+        BlockingRepository(repository), SerializedFormCache()
+    )
+    pooled_repository = ThreadPoolRepository(repository, max_workers=args.workers)
+    pooled = GetSerializedFormQueryHandler(pooled_repository, SerializedFormCache())
+
+    print(f"{'clients':>8} {'blocking req/s':>15} {'thread pool req/s':>18}")
+    for clients in args.clients:
+        blocking_rate = await throughput(blocking, query, clients, args.requests)
+        pooled_rate = await throughput(pooled, query, clients, args.requests)
+        print(f"{clients:>8} {blocking_rate:>15.0f} {pooled_rate:>18.0f}")
+    await pooled_repository.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""Form lookup cost of the in-memory repository versus a linear scan.
+
+Run with ``PYTHONPATH=src python benchmarks/repository_lookup.py``.
+"""
+
+import argparse
+import random
+import timeit
+
+from core.domain.entities import Form
+from infrastructure.repositories import InMemoryRepository
+
+
+def linear_scan(forms: set[Form], form_uuid) -> Form | None:
+    return next(filter(lambda f: f.uuid == form_uuid, forms), None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument(
+        "--max-scan-size",
+        type=int,
+        default=100_000,
+        help="skip the linear scan above this size, it takes minutes",
+    )
+    args = parser.parse_args()
+
+    print(f"{'forms':>10} {'dict (ns/lookup)':>18} {'scan (ns/lookup)':>18}")
+    for size in args.sizes:
+        repository = InMemoryRepository()
+        forms = [Form.create(title=f"form {i}") for i in range(size)]
+        for form in forms:
+            repository.save_form(form)
+        targets = [random.choice(forms).uuid for _ in range(args.lookups)]
+
+        elapsed = timeit.timeit(
+            lambda: [repository.get_form_by_uuid(uuid) for uuid in targets], number=1
+        )
+        indexed = elapsed / args.lookups * 1e9
+
+        scan = "-"
+        if size <= args.max_scan_size:
+            as_set = set(forms)
+            scan_lookups = targets[: max(1, args.lookups * 10 // size)]
+            elapsed = timeit.timeit(
+                lambda: [linear_scan(as_set, uuid) for uuid in scan_lookups], number=1
+            )
+            scan = f"{elapsed / len(scan_lookups) * 1e9:.0f}"
+        print(f"{size:>10} {indexed:>18.0f} {scan:>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Streaming export of stored responses and the peak memory it needs.
+
+Each export runs in a fresh interpreter, so its peak RSS only covers the
+export and not seeding the database. A small and a large form are
+exported to show that memory does not grow with the number of responses.
+
+Run with ``PYTHONPATH=src python benchmarks/response_export.py``.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from uuid import UUID
+
+from core.application.handlers import ExportFormResponsesQueryHandler
+from core.application.queries import ExportFormResponsesQuery
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+from infrastructure.repositories import SqliteRepository, ThreadPoolRepository
+
+
+def seed(repository: SqliteRepository, responses: int, fields: int) -> Form:
+    form = Form.create(title="benchmark")
+    for _ in range(fields):
+        form.add_field(BooleanField.create())
+    repository.save_form(form)
+    ordered_fields = form.get_ordered_fields()
+    for start in range(0, responses, 1_000):
+        batch = []
+        for _ in range(min(1_000, responses - start)):
+            response = FormResponse.create(for_form_uuid=form.uuid)
+            for field in ordered_fields:
+                value = random.random() < 0.5
+                response.add_field_response(
+                    FieldResponse.create(value, for_field=field.uuid)
+                )
+            batch.append(response)
+        repository.save_form_responses(batch)
+    return form
+
+
+async def export(path: str, form_uuid: UUID, format: str) -> None:
+    repository = ThreadPoolRepository(SqliteRepository(path))
+    handler = ExportFormResponsesQueryHandler(repository)
+    query = ExportFormResponsesQuery(form_uuid=form_uuid, format=format)
+    started = time.perf_counter()
+    rows = size = 0
+    async for chunk in await handler.handle(query):
+        rows += chunk.count(b"\n")
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+    await repository.close()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{format:<7} {rows - (format == 'csv'):>9} responses "
+        f"{rows / elapsed:>10.0f} rows/s {size / elapsed / 2**20:>7.1f} MiB/s "
+        f"peak RSS {peak:>6.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--responses", type=int, default=1_000_000)
+    parser.add_argument("--fields", type=int, default=5)
+    parser.add_argument("--path", default=None)
+    parser.add_argument("--export", nargs=2, metavar=("FORM_UUID", "FORMAT"))
+    args = parser.parse_args()
+
+    if args.export:
+        form_uuid, format = args.export
+        asyncio.run(export(args.path, UUID(form_uuid), format))
+        return
+
+    path = args.path or os.path.join(tempfile.mkdtemp(), "bench.sqlite3")
+    repository = SqliteRepository(path)
+    forms = [
+        seed(repository, max(args.responses // 100, 1), args.fields),
+        seed(repository, args.responses, args.fields),
+    ]
+    repository.close()
+    for form in forms:
+        for format in ("csv", "ndjson"):
+            subprocess.run(
+                [sys.executable, __file__, "--path", path, "--export"]
+                + [str(form.uuid.value), format],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
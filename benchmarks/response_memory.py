@@ -0,0 +1,48 @@
+"""Memory held by FormResponse aggregates, in bytes per response.
+
+Run with ``PYTHONPATH=src python benchmarks/response_memory.py``.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--responses", type=int, default=10_000)
+    parser.add_argument("--fields", type=int, default=50)
+    args = parser.parse_args()
+
+    form = Form.create(title="benchmark")
+    for _ in range(args.fields):
+        form.add_field(BooleanField.create())
+    field_uuids = [field.uuid for field in form.get_ordered_fields()]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    responses = []
+    for i in range(args.responses):
+        response = FormResponse.create(for_form_uuid=form.uuid)
+        for field_uuid in field_uuids:
+            response.add_field_response(
+                FieldResponse.create(i % 2 == 0, for_field=field_uuid)
+            )
+        responses.append(response)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    per_response = used / args.responses
+    print(
+        f"{args.responses} responses, {args.fields} fields: "
+        f"{per_response:,.0f} bytes/response, "
+        f"{per_response / args.fields:,.0f} bytes/answer"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Read and submission-write throughput of SqliteRepository on a local file.
+
+Run with ``PYTHONPATH=src python benchmarks/sqlite_throughput.py``.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+from infrastructure.repositories import SqliteRepository
+
+
+def make_response(form: Form) -> FormResponse:
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    for field in form.get_ordered_fields():
+        value = random.random() < 0.5
+        response.add_field_response(FieldResponse.create(value, for_field=field.uuid))
+    return response
+
+
+def timed(label: str, count: int, function) -> None:
+    started = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<40} {count / elapsed:>12.0f} ops/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--responses", type=int, default=2_000_000)
+    parser.add_argument("--fields", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=1_000)
+    parser.add_argument("--samples", type=int, default=10_000)
+    parser.add_argument("--path", default=None)
+    args = parser.parse_args()
+
+    path = args.path or os.path.join(tempfile.mkdtemp(), "bench.sqlite3")
+    repository = SqliteRepository(path)
+    form = Form.create(title="benchmark")
+    for _ in range(args.fields):
+        form.add_field(BooleanField.create())
+    repository.save_form(form)
+
+    # building the domain objects is not what is measured, only saving them
+    sampled = []
+    elapsed = 0.0
+    for start in range(0, args.responses, args.batch):
+        batch = [
+            make_response(form) for _ in range(min(args.batch, args.responses - start))
+        ]
+        sampled.append(batch[0].uuid)
+        started = time.perf_counter()
+        repository.save_form_responses(batch)
+        elapsed += time.perf_counter() - started
+    label = f"bulk save, batches of {args.batch}"
+    print(f"{label:<40} {args.responses / elapsed:>12.0f} ops/s")
+
+    singles = [make_response(form) for _ in range(args.samples // 10)]
+    timed(
+        "save_form_response, one per transaction",
+        len(singles),
+        lambda: [repository.save_form_response(r) for r in singles],
+    )
+    timed(
+        "get_form_by_uuid",
+        args.samples,
+        lambda: [repository.get_form_by_uuid(form.uuid) for _ in range(args.samples)],
+    )
+    lookups = [random.choice(sampled) for _ in range(args.samples)]
+    timed(
+        "get_form_response_by_uuid (random)",
+        len(lookups),
+        lambda: [repository.get_form_response_by_uuid(uuid) for uuid in lookups],
+    )
+    print(f"database: {path} ({os.path.getsize(path) / 2**20:.0f} MiB)")
+    repository.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Submissions per second: compiled submission plan versus per-call validation.
+
+Run with ``PYTHONPATH=src python benchmarks/submission_validation.py``.
+"""
+
+import argparse
+import time
+
+from core.domain import exceptions
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+from core.domain.repositories import IRepository
+from core.domain.services import SubmitFormService
+from infrastructure.repositories import InMemoryRepository
+
+
+def submit_uncompiled(repository: IRepository, response: FormResponse) -> None:
+    # the submission path before plans were compiled and cached
+    form = repository.get_form_by_uuid(response.form_uuid)
+    if form is None:
+        raise exceptions.FormNotFound()
+
+    required_fields = form.get_required_fields()
+    responses_expected_for_fields = {field.uuid for field in required_fields}
+    if not response.has_all_required_fields(responses_expected_for_fields):
+        raise exceptions.FormDoesNotHaveAllRequiredFields
+
+    for field_response in response.field_responses:
+        is_valid = form.is_valid_input_for_field(
+            field_response.value, field_response.field_uuid
+        )
+        if not is_valid:
+            raise exceptions.InvalidFormSubmission()
+
+    repository.save_form_response(response)
+
+
+def build(field_count: int) -> tuple[InMemoryRepository, FormResponse]:
+    repository = InMemoryRepository()
+    form = Form.create(title=f"{field_count} fields")
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    for i in range(field_count):
+        field = BooleanField.create()
+        if i % 2:
+            field.mark_required()
+        form.add_field(field)
+        response.add_field_response(FieldResponse.create(True, for_field=field.uuid))
+    repository.save_form(form)
+    return repository, response
+
+
+def rate(submit, response: FormResponse, seconds: float) -> float:
+    count = 0
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            submit(response)
+        count += 100
+    return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fields", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"{'fields':>7} {'uncompiled/s':>14} {'compiled/s':>12} {'speedup':>8}")
+    for field_count in args.fields:
+        repository, response = build(field_count)
+        service = SubmitFormService(repository)
+        baseline = rate(
+            lambda r: submit_uncompiled(repository, r), response, args.seconds
+        )
+        compiled = rate(service.submit, response, args.seconds)
+        print(
+            f"{field_count:>7} {baseline:>14.0f} {compiled:>12.0f} "
+            f"{compiled / baseline:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
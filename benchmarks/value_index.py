@@ -0,0 +1,78 @@
+"""Fetching responses by answer value: the time of a page depends on the
+number of matches, not on how many responses the form has.
+
+Run with ``PYTHONPATH=src python benchmarks/value_index.py``.
+"""
+
+import argparse
+import tempfile
+import time
+
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+from infrastructure.repositories import InMemoryRepository, SqliteRepository
+
+
+def best_of(repeat: int, function) -> float:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return min(durations)
+
+
+def fill(repository, responses: int, matches: int) -> tuple[Form, BooleanField]:
+    form = Form.create(title="benchmark")
+    field = BooleanField.create()
+    form.add_field(field)
+    repository.save_form(form)
+    batch = []
+    for position in range(responses):
+        response = FormResponse.create(for_form_uuid=form.uuid)
+        # the rare value is spread evenly over the whole form
+        value = position % (responses // matches) == 0
+        response.add_field_response(FieldResponse.create(value, for_field=field.uuid))
+        batch.append(response)
+    repository.save_form_responses(batch)
+    return form, field
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'repository':>10} {'responses':>10} {'page of matches':>16} {'scan':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            repositories = {
+                "memory": InMemoryRepository(),
+                "sqlite": SqliteRepository(f"{directory}/forms.sqlite3"),
+            }
+            for name, repository in repositories.items():
+                form, field = fill(repository, size, args.matches)
+                by_value = best_of(
+                    args.repeat,
+                    lambda: repository.get_responses_by_value(
+                        form.uuid, field.uuid, True, None, args.matches
+                    ),
+                )
+                scan = best_of(
+                    args.repeat,
+                    lambda: [
+                        response
+                        for response in repository.get_responses_for_form(form.uuid)
+                        if response.get_response(field.uuid).value is True
+                    ],
+                )
+                print(
+                    f"{name:>10} {size:>10} {by_value * 1e3:>13.2f} ms"
+                    f" {scan * 1e3:>7.1f} ms"
+                )
+            repositories["sqlite"].close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Time to decide which fields are hidden on a form with many conditional fields.
+
+Run with ``PYTHONPATH=src python benchmarks/visibility_evaluation.py``.
+"""
+
+import argparse
+import random
+import timeit
+
+from core.domain.entities import BooleanField, Form
+from core.domain.value_objects import AllOf, AnyOf, FieldEquals
+from core.domain.visibility import VisibilityRules
+
+
+def build(plain: int, conditional: int) -> tuple[Form, dict]:
+    form = Form.create(title="conditional")
+    fields = []
+    for i in range(plain + conditional):
+        field = BooleanField.create()
+        if i >= plain:
+            # like "1 == Y AND (2 == Y OR 3 == Y)" over earlier fields
+            a, b, c = random.sample(fields, 3)
+            field.set_condition(
+                AllOf(
+                    (
+                        FieldEquals(a.uuid, True),
+                        AnyOf((FieldEquals(b.uuid, True), FieldEquals(c.uuid, True))),
+                    )
+                )
+            )
+        form.add_field(field)
+        fields.append(field)
+    values = {field.uuid: random.random() < 0.8 for field in fields}
+    return form, values
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--plain", type=int, default=50)
+    parser.add_argument("--conditional", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'conditional fields':>19} {'compile (ms)':>13} {'evaluate (us)':>14}")
+    for conditional in args.conditional:
+        form, values = build(args.plain, conditional)
+        compile_time = timeit.timeit(lambda: VisibilityRules.compile(form), number=5)
+        rules = VisibilityRules.compile(form)
+        evaluate = min(
+            timeit.repeat(
+                lambda: rules.get_hidden_fields(values), number=1, repeat=args.repeat
+            )
+        )
+        print(
+            f"{conditional:>19} {compile_time / 5 * 1e3:>13.2f} {evaluate * 1e6:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Incremental visibility change versus two full evaluations on a deep chain.
+
+Each field of the chain is only visible if the previous one is answered with
+True. Changing a field near the end touches few conditions, changing the
+first one touches all of them.
+
+Run with ``PYTHONPATH=src python benchmarks/visibility_incremental.py``.
+"""
+
+import argparse
+import timeit
+
+from core.domain.entities import BooleanField, Form
+from core.domain.value_objects import FieldEquals
+from core.domain.visibility import VisibilityRules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depth", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'depth':>6} {'changed at':>11} {'full (us)':>10} {'incremental (us)':>17}")
+    for depth in args.depth:
+        form = Form.create(title="chain")
+        fields = [BooleanField.create() for _ in range(depth)]
+        for previous, current in zip(fields, fields[1:]):
+            current.set_condition(FieldEquals(previous.uuid, True))
+        for field in fields:
+            form.add_field(field)
+        rules = VisibilityRules.compile(form)
+        answers = {field.uuid: True for field in fields}
+
+        for position in (depth - 5, depth // 2, 0):
+            changed = fields[position].uuid
+            rules.get_visibility_change(answers, changed, False)  # warm caches
+
+            def full() -> None:
+                before = rules.get_hidden_fields(answers)
+                after = rules.get_hidden_fields({**answers, changed: False})
+                before ^ after
+
+            def incremental() -> None:
+                rules.get_visibility_change(answers, changed, False)
+
+            full_time = min(timeit.repeat(full, number=1, repeat=args.repeat))
+            incremental_time = min(
+                timeit.repeat(incremental, number=1, repeat=args.repeat)
+            )
+            print(
+                f"{depth:>6} {position:>11} {full_time * 1e6:>10.1f} "
+                f"{incremental_time * 1e6:>17.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
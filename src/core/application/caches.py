@@ -0,0 +1,36 @@
+from collections import OrderedDict
+
+from core.domain.value_objects import FormUUID
+
+
+# JSON bodies of recently read forms, at most one version per form. The
+# least recently used form is evicted once `capacity` forms are cached.
+class SerializedFormCache:
+    def __init__(self, capacity: int = 1024) -> None:
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[FormUUID, tuple[int, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, form_uuid: FormUUID, version: int) -> bytes | None:
+        entry = self._entries.get(form_uuid)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(form_uuid)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, form_uuid: FormUUID, version: int, content: bytes) -> None:
+        self._entries[form_uuid] = (version, content)
+        self._entries.move_to_end(form_uuid)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, form_uuid: FormUUID) -> None:
+        self._entries.pop(form_uuid, None)
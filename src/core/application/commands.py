@@ -1,5 +1,50 @@
-from pydantic import BaseModel
+from collections.abc import AsyncIterable
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
 
 
 class Command(BaseModel):
     pass
+
+
+class SubmitFormResponsesCommand(Command):
+    class FieldResponseDTO(BaseModel):
+        field_uuid: UUID
+        value: Any
+
+    class FormResponseDTO(BaseModel):
+        uuid: UUID | None = None
+        field_responses: list["SubmitFormResponsesCommand.FieldResponseDTO"]
+
+    form_uuid: UUID
+    responses: list[FormResponseDTO]
+
+    class ResultDTO(BaseModel):
+        uuid: UUID
+        accepted: bool
+        error: str | None = None
+
+
+class SubmitFormCommand(Command):
+    form_uuid: UUID
+    uuid: UUID | None = None
+    idempotency_key: str | None = None
+    field_responses: list[SubmitFormResponsesCommand.FieldResponseDTO]
+
+    class ResultDTO(BaseModel):
+        uuid: UUID
+
+
+class UploadFileCommand(Command):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    form_uuid: UUID
+    field_uuid: UUID
+    content: AsyncIterable[bytes]
+
+    class ResultDTO(BaseModel):
+        sha256: str
+        size: int
+        media_type: str
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+from core.domain.entities import Form, FormResponse
+
+# rows are sent in chunks of roughly this many bytes, not one write per row
+CHUNK_SIZE = 64 * 1024
+
+
+async def export_csv(
+    form: Form, responses: AsyncIterable[FormResponse]
+) -> AsyncIterator[bytes]:
+    field_uuids = [form_field.uuid for form_field in form.get_ordered_fields()]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["uuid", *(field_uuid.value for field_uuid in field_uuids)])
+    async for response in responses:
+        values = response.get_values()
+        writer.writerow(
+            [
+                response.uuid.value,
+                *(_to_cell(values.get(field_uuid)) for field_uuid in field_uuids),
+            ]
+        )
+        if buffer.tell() >= CHUNK_SIZE:
+            yield _drain(buffer)
+    yield _drain(buffer)
+
+
+async def export_ndjson(
+    form: Form, responses: AsyncIterable[FormResponse]
+) -> AsyncIterator[bytes]:
+    field_uuids = [form_field.uuid for form_field in form.get_ordered_fields()]
+    keys = [str(field_uuid.value) for field_uuid in field_uuids]
+    buffer = io.StringIO()
+    async for response in responses:
+        values = response.get_values()
+        row = {"uuid": str(response.uuid.value)}
+        row.update(zip(keys, (values.get(field_uuid) for field_uuid in field_uuids)))
+        buffer.write(json.dumps(row))
+        buffer.write("\n")
+        if buffer.tell() >= CHUNK_SIZE:
+            yield _drain(buffer)
+    if buffer.tell():
+        yield _drain(buffer)
+
+
+def _to_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    chunk = buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
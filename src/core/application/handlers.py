@@ -1,8 +1,24 @@
+from collections.abc import AsyncIterator
 from typing import Generic, TypeVar, Any
 
-from core.application import commands, queries
-from core.domain.repositories import IRepository
-from core.domain.value_objects import FormUUID
+from pydantic_core import to_json
+
+from core.application import commands, exports, mappers, metrics, queries
+from core.application.caches import SerializedFormCache
+from core.domain import exceptions
+from core.domain.entities import FieldResponse, FormResponse
+from core.domain.repositories import IAsyncRepository
+from core.domain.services import SubmitFormService, UploadFileService
+from core.domain.columns import ResponseColumns
+from core.domain.summaries import ResponseSummaries
+from core.domain.validation import SubmissionPlanCache
+from core.domain.value_objects import (
+    AllOf,
+    FieldEquals,
+    FieldUUID,
+    FormResponseUUID,
+    FormUUID,
+)
 
 
 CommandType = TypeVar("CommandType", bound=commands.Command)
@@ -10,38 +26,288 @@ QueryType = TypeVar("QueryType", bound=queries.Query)
 
 
 class CommandHandler(Generic[CommandType]):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "handle" in cls.__dict__:
+            cls.handle = metrics.timed_handler(cls.__name__, cls.handle)
+
     async def handle(self, command: CommandType) -> Any:
         raise NotImplementedError
 
 
 class QueryHandler(Generic[QueryType]):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "handle" in cls.__dict__:
+            cls.handle = metrics.timed_handler(cls.__name__, cls.handle)
+
     async def handle(self, query: QueryType) -> Any:
         raise NotImplementedError
 
 
 class ListFormsQueryHandler(QueryHandler[queries.ListAllFormsQuery]):
-    def __init__(self, repository: IRepository) -> None:
+    def __init__(self, repository: IAsyncRepository) -> None:
         self._repository = repository
 
     async def handle(
         self, query: queries.ListAllFormsQuery
-    ) -> list[queries.ListAllFormsQuery.ResultDTO]:
-        all_forms = self._repository.get_all_forms()
-        return [
-            queries.ListAllFormsQuery.ResultDTO.model_validate(form)
-            for form in all_forms
-        ]
+    ) -> queries.ListAllFormsQuery.PageDTO:
+        # one extra form tells whether another page follows
+        after = FormUUID(query.after) if query.after is not None else None
+        forms = await self._repository.get_forms_page(after, query.limit + 1)
+        page = forms[: query.limit]
+        return queries.ListAllFormsQuery.PageDTO.model_construct(
+            items=[mappers.to_form_list_item(form, query.fields) for form in page],
+            next_after=page[-1].uuid.value if len(forms) > query.limit else None,
+        )
 
 
-class GetFormQueryHandler(QueryHandler[queries.GetFormQuery]):
-    def __init__(self, repository: IRepository) -> None:
+class GetSerializedFormQueryHandler(QueryHandler[queries.GetFormQuery]):
+    def __init__(
+        self, repository: IAsyncRepository, cache: SerializedFormCache
+    ) -> None:
         self._repository = repository
+        self._cache = cache
 
     async def handle(
         self, query: queries.GetFormQuery
-    ) -> queries.GetFormQuery.ResultDTO | None:
+    ) -> (
+        queries.GetFormQuery.SerializedDTO | queries.GetFormQuery.NotModifiedDTO | None
+    ):
         form_uuid = FormUUID(query.uuid)
-        form = self._repository.get_form_by_uuid(form_uuid)
+        form = await self._repository.get_form_by_uuid(form_uuid)
+        if form is None:
+            return None
+        # the client already has this version, so the form is not serialized at all
+        if form.version in query.known_versions:
+            return queries.GetFormQuery.NotModifiedDTO.model_construct(
+                version=form.version
+            )
+        content = self._cache.get(form_uuid, form.version)
+        if content is None:
+            content = to_json(mappers.to_form(form))
+            self._cache.put(form_uuid, form.version, content)
+        return queries.GetFormQuery.SerializedDTO.model_construct(
+            version=form.version, content=content
+        )
+
+
+class GetVisibilityChangeQueryHandler(QueryHandler[queries.GetVisibilityChangeQuery]):
+    def __init__(
+        self, repository: IAsyncRepository, plans: SubmissionPlanCache
+    ) -> None:
+        self._repository = repository
+        self._plans = plans
+
+    async def handle(
+        self, query: queries.GetVisibilityChangeQuery
+    ) -> queries.GetVisibilityChangeQuery.ResultDTO | None:
+        form = await self._repository.get_form_by_uuid(FormUUID(query.form_uuid))
+        if form is None:
+            return None
+        changed_field_uuid = FieldUUID(query.changed.field_uuid)
+        if not form.has_field(changed_field_uuid):
+            raise exceptions.FormDoesNotHaveThisField()
+
+        visibility = self._plans.get(form).visibility
+        change = visibility.get_visibility_change(
+            {FieldUUID(answer.field_uuid): answer.value for answer in query.answers},
+            changed_field_uuid,
+            query.changed.value,
+        )
+        return queries.GetVisibilityChangeQuery.ResultDTO(
+            shown=[field_uuid.value for field_uuid in change.shown],
+            hidden=[field_uuid.value for field_uuid in change.hidden],
+        )
+
+
+class GetFormSummaryQueryHandler(QueryHandler[queries.GetFormSummaryQuery]):
+    def __init__(
+        self, repository: IAsyncRepository, summaries: ResponseSummaries
+    ) -> None:
+        self._repository = repository
+        self._summaries = summaries
+
+    async def handle(
+        self, query: queries.GetFormSummaryQuery
+    ) -> queries.GetFormSummaryQuery.ResultDTO | None:
+        form_uuid = FormUUID(query.form_uuid)
+        form = await self._repository.get_form_by_uuid(form_uuid)
+        if form is None:
+            return None
+        summary = self._summaries.get(form)
+        if summary is None:
+            summary = await self._summaries.rebuild(
+                form, self._repository.get_responses_for_form(form_uuid)
+            )
+        return queries.GetFormSummaryQuery.ResultDTO(
+            form_uuid=form_uuid.value,
+            responses=summary.responses,
+            fields=[
+                queries.GetFormSummaryQuery.FieldSummaryDTO(
+                    field_uuid=field_uuid.value,
+                    counts=[
+                        queries.GetFormSummaryQuery.CountDTO(value=value, count=count)
+                        for value, count in tally.items()
+                    ],
+                )
+                for field_uuid, tally in summary.tallies.items()
+            ],
+        )
+
+
+class CountFormResponsesQueryHandler(QueryHandler[queries.CountFormResponsesQuery]):
+    def __init__(self, repository: IAsyncRepository, columns: ResponseColumns) -> None:
+        self._repository = repository
+        self._columns = columns
+
+    async def handle(
+        self, query: queries.CountFormResponsesQuery
+    ) -> queries.CountFormResponsesQuery.ResultDTO | None:
+        form_uuid = FormUUID(query.form_uuid)
+        form = await self._repository.get_form_by_uuid(form_uuid)
+        if form is None:
+            return None
+        columns = self._columns.get(form)
+        if columns is None:
+            columns = await self._columns.rebuild(
+                form, self._repository.get_responses_for_form(form_uuid)
+            )
+        condition = AllOf(
+            tuple(
+                FieldEquals(FieldUUID(dto.field_uuid), dto.value) for dto in query.where
+            )
+        )
+        return queries.CountFormResponsesQuery.ResultDTO(count=columns.count(condition))
+
+
+class ListFormResponsesQueryHandler(QueryHandler[queries.ListFormResponsesQuery]):
+    def __init__(self, repository: IAsyncRepository) -> None:
+        self._repository = repository
+
+    async def handle(
+        self, query: queries.ListFormResponsesQuery
+    ) -> queries.ListFormResponsesQuery.PageDTO | None:
+        form_uuid = FormUUID(query.form_uuid)
+        form = await self._repository.get_form_by_uuid(form_uuid)
         if form is None:
             return None
-        return queries.GetFormQuery.ResultDTO.model_validate(form)
+        field_uuid = FieldUUID(query.field_uuid)
+        if not form.has_field(field_uuid):
+            raise exceptions.FormDoesNotHaveThisField()
+
+        # one extra response tells whether another page follows
+        after = FormResponseUUID(query.after) if query.after is not None else None
+        responses = await self._repository.get_responses_by_value(
+            form_uuid, field_uuid, query.value, after, query.limit + 1
+        )
+        page = responses[: query.limit]
+        return queries.ListFormResponsesQuery.PageDTO.model_construct(
+            items=[mappers.to_form_response(response) for response in page],
+            next_after=page[-1].uuid.value if len(responses) > query.limit else None,
+        )
+
+
+class ExportFormResponsesQueryHandler(QueryHandler[queries.ExportFormResponsesQuery]):
+    _exporters = {
+        queries.ExportFormResponsesQuery.Format.CSV: exports.export_csv,
+        queries.ExportFormResponsesQuery.Format.NDJSON: exports.export_ndjson,
+    }
+
+    def __init__(self, repository: IAsyncRepository) -> None:
+        self._repository = repository
+
+    async def handle(
+        self, query: queries.ExportFormResponsesQuery
+    ) -> AsyncIterator[bytes] | None:
+        # the form is loaded up front so an unknown form is reported before
+        # anything is streamed, the responses are only read while streaming
+        form_uuid = FormUUID(query.form_uuid)
+        form = await self._repository.get_form_by_uuid(form_uuid)
+        if form is None:
+            return None
+        export = self._exporters[query.format]
+        return export(form, self._repository.get_responses_for_form(form_uuid))
+
+
+class SubmitFormResponsesCommandHandler(
+    CommandHandler[commands.SubmitFormResponsesCommand]
+):
+    def __init__(self, service: SubmitFormService) -> None:
+        self._service = service
+
+    async def handle(
+        self, command: commands.SubmitFormResponsesCommand
+    ) -> list[commands.SubmitFormResponsesCommand.ResultDTO]:
+        form_uuid = FormUUID(command.form_uuid)
+        responses = [self._to_domain(form_uuid, dto) for dto in command.responses]
+        results = await self._service.submit_many(responses)
+        return [
+            commands.SubmitFormResponsesCommand.ResultDTO(
+                uuid=result.response.uuid.value,
+                accepted=result.is_accepted,
+                error=None if result.is_accepted else type(result.error).__name__,
+            )
+            for result in results
+        ]
+
+    @staticmethod
+    def _to_domain(
+        form_uuid: FormUUID,
+        dto: commands.SubmitFormResponsesCommand.FormResponseDTO,
+    ) -> FormResponse:
+        response = FormResponse(
+            uuid=FormResponseUUID(dto.uuid) if dto.uuid else FormResponseUUID(),
+            form_uuid=form_uuid,
+        )
+        for field_response in dto.field_responses:
+            response.add_field_response(
+                FieldResponse.create(
+                    field_response.value,
+                    for_field=FieldUUID(field_response.field_uuid),
+                )
+            )
+        return response
+
+
+class SubmitFormCommandHandler(CommandHandler[commands.SubmitFormCommand]):
+    def __init__(self, service: SubmitFormService) -> None:
+        self._service = service
+
+    async def handle(
+        self, command: commands.SubmitFormCommand
+    ) -> commands.SubmitFormCommand.ResultDTO:
+        response = FormResponse(
+            uuid=FormResponseUUID(command.uuid) if command.uuid else FormResponseUUID(),
+            form_uuid=FormUUID(command.form_uuid),
+        )
+        for field_response in command.field_responses:
+            response.add_field_response(
+                FieldResponse.create(
+                    field_response.value,
+                    for_field=FieldUUID(field_response.field_uuid),
+                )
+            )
+        # a response uuid chosen by the client also makes retries idempotent
+        idempotency_key = command.idempotency_key
+        if idempotency_key is None and command.uuid is not None:
+            idempotency_key = str(command.uuid)
+        uuid = await self._service.submit(response, idempotency_key)
+        return commands.SubmitFormCommand.ResultDTO(uuid=uuid.value)
+
+
+class UploadFileCommandHandler(CommandHandler[commands.UploadFileCommand]):
+    def __init__(self, service: UploadFileService) -> None:
+        self._service = service
+
+    async def handle(
+        self, command: commands.UploadFileCommand
+    ) -> commands.UploadFileCommand.ResultDTO:
+        reference = await self._service.upload(
+            FormUUID(command.form_uuid), FieldUUID(command.field_uuid), command.content
+        )
+        return commands.UploadFileCommand.ResultDTO(
+            sha256=reference.sha256,
+            size=reference.size,
+            media_type=reference.media_type,
+        )
@@ -0,0 +1,58 @@
+from collections.abc import Collection
+from typing import Any, TypedDict
+from uuid import UUID
+
+from core.application import queries
+from core.domain.entities import Form, FormResponse
+
+# Domain objects are already valid, so the hot read paths skip pydantic
+# models entirely: these build the DTO-shaped dicts directly, and they are
+# serialized with pydantic_core.to_json. The dict keys mirror the ResultDTOs.
+
+
+class FormListItem(TypedDict, total=False):
+    uuid: UUID
+    title: str
+
+
+class FormItem(TypedDict):
+    uuid: UUID
+    version: int
+
+
+class FieldResponseItem(TypedDict):
+    field_uuid: UUID
+    value: Any
+
+
+class FormResponseItem(TypedDict):
+    uuid: UUID
+    field_responses: list[FieldResponseItem]
+
+
+def to_form_list_item(
+    form: Form, fields: Collection[queries.FormProjection]
+) -> FormListItem:
+    item: FormListItem = {}
+    if "uuid" in fields:
+        item["uuid"] = form.uuid.value
+    if "title" in fields:
+        item["title"] = form.title
+    return item
+
+
+def to_form(form: Form) -> FormItem:
+    return {"uuid": form.uuid.value, "version": form.version}
+
+
+def to_form_response(response: FormResponse) -> FormResponseItem:
+    return {
+        "uuid": response.uuid.value,
+        "field_responses": [
+            {
+                "field_uuid": field_response.field_uuid.value,
+                "value": field_response.value,
+            }
+            for field_response in response.field_responses
+        ],
+    }
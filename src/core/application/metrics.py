@@ -0,0 +1,194 @@
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterable
+from functools import wraps
+from time import perf_counter
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+FamilyType = TypeVar("FamilyType", bound="Family")
+
+# upper bounds in seconds, the last bucket is +Inf
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Labels = tuple[str, ...]
+
+
+# Metric families in the Prometheus text format. Updates are plain attribute
+# writes without locks, so they have to happen on the event loop thread.
+class Family:
+    kind = ""
+    # appended to the name of every sample, and of the family itself
+    suffix = ""
+
+    def __init__(self, name: str, help: str, label_names: Labels = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = label_names
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name}{self.suffix} {self.help}"
+        yield f"# TYPE {self.name}{self.suffix} {self.kind}"
+        yield from self._render_samples()
+
+    def _render_samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def _sample(self, suffix: str, labels: Labels, value: float, *extra: str) -> str:
+        pairs = [
+            f'{name}="{_escape(label)}"'
+            for name, label in zip(self.label_names, labels)
+        ]
+        pairs.extend(extra)
+        selector = "{" + ",".join(pairs) + "}" if pairs else ""
+        return f"{self.name}{self.suffix}{suffix}{selector} {_format(value)}"
+
+
+class Counter(Family):
+    kind = "counter"
+    suffix = "_total"
+
+    def __init__(self, name: str, help: str, label_names: Labels = ()) -> None:
+        super().__init__(name, help, label_names)
+        self.values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        values = self.values
+        values[labels] = values.get(labels, 0) + amount
+
+    def _render_samples(self) -> Iterable[str]:
+        for labels, value in self.values.items():
+            yield self._sample("", labels, value)
+
+
+class Gauge(Counter):
+    kind = "gauge"
+    suffix = ""
+
+    def set(self, labels: Labels, value: float) -> None:
+        self.values[labels] = value
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class HistogramFamily(Family):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Labels = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, label_names)
+        self.buckets = buckets
+        self.children: dict[Labels, Histogram] = {}
+
+    def labels(self, *labels: str) -> Histogram:
+        histogram = self.children.get(labels)
+        if histogram is None:
+            histogram = self.children[labels] = Histogram(self.buckets)
+        return histogram
+
+    def _render_samples(self) -> Iterable[str]:
+        for labels, histogram in self.children.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram.counts):
+                cumulative += count
+                yield self._sample(
+                    "_bucket", labels, cumulative, f'le="{_format(bound)}"'
+                )
+            cumulative += histogram.counts[-1]
+            yield self._sample("_bucket", labels, cumulative, 'le="+Inf"')
+            yield self._sample("_sum", labels, histogram.sum)
+            yield self._sample("_count", labels, cumulative)
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._families: list[Family] = []
+
+    def register(self, family: FamilyType) -> FamilyType:
+        self._families.append(family)
+        return family
+
+    def render(self, *families: Family) -> str:
+        # `families` are collected at scrape time by the caller
+        lines = []
+        for family in (*self._families, *families):
+            lines.extend(family.render())
+        lines.append("")
+        return "\n".join(lines)
+
+
+REGISTRY = Registry()
+
+HANDLER_SECONDS = REGISTRY.register(
+    HistogramFamily(
+        "custom_forms_handler_seconds",
+        "Time spent in query and command handlers.",
+        ("handler",),
+    )
+)
+HANDLER_ERRORS = REGISTRY.register(
+    Counter(
+        "custom_forms_handler_errors",
+        "Handler calls that raised.",
+        ("handler", "error"),
+    )
+)
+
+
+def timed_handler(
+    name: str, handle: Callable[..., Awaitable[T]]
+) -> Callable[..., Awaitable[T]]:
+    histogram = HANDLER_SECONDS.labels(name)
+
+    @wraps(handle)
+    async def timed(*args: Any, **kwargs: Any) -> T:
+        started = perf_counter()
+        try:
+            return await handle(*args, **kwargs)
+        except Exception as error:
+            HANDLER_ERRORS.inc((name, type(error).__name__))
+            raise
+        finally:
+            histogram.observe(perf_counter() - started)
+
+    return timed
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
@@ -1,6 +1,8 @@
+from enum import StrEnum
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from core.application.types import FromValueObjectType as _
 
@@ -14,13 +16,114 @@ class Query(BaseModel):
     pass
 
 
+FORMS_PAGE_LIMIT = 100
+MAX_FORMS_PAGE_LIMIT = 1000
+FormProjection = Literal["uuid", "title"]
+
+
 class ListAllFormsQuery(Query):
+    limit: int = Field(default=FORMS_PAGE_LIMIT, ge=1, le=MAX_FORMS_PAGE_LIMIT)
+    after: UUID | None = None
+    fields: frozenset[FormProjection] = frozenset({"uuid", "title"})
+
     class ResultDTO(BaseResultDTO):
-        uuid: _[UUID]
+        uuid: _[UUID] | None = None
+        title: str | None = None
+
+    class PageDTO(BaseModel):
+        # ResultDTO-shaped dicts from core.application.mappers
+        items: list[dict[str, Any]]
+        next_after: UUID | None
 
 
 class GetFormQuery(Query):
     uuid: UUID
+    known_versions: frozenset[int] = frozenset()
 
     class ResultDTO(BaseResultDTO):
         uuid: _[UUID]
+        version: int
+
+    class NotModifiedDTO(BaseModel):
+        version: int
+
+    class SerializedDTO(BaseModel):
+        version: int
+        content: bytes
+
+
+class GetVisibilityChangeQuery(Query):
+    class AnswerDTO(BaseModel):
+        field_uuid: UUID
+        value: Any
+
+    form_uuid: UUID
+    answers: list[AnswerDTO]
+    changed: AnswerDTO
+
+    class ResultDTO(BaseModel):
+        shown: list[UUID]
+        hidden: list[UUID]
+
+
+class GetFormSummaryQuery(Query):
+    form_uuid: UUID
+
+    class CountDTO(BaseModel):
+        value: Any
+        count: int
+
+    class FieldSummaryDTO(BaseModel):
+        field_uuid: UUID
+        counts: list["GetFormSummaryQuery.CountDTO"]
+
+    class ResultDTO(BaseModel):
+        form_uuid: UUID
+        responses: int
+        fields: list["GetFormSummaryQuery.FieldSummaryDTO"]
+
+
+class ExportFormResponsesQuery(Query):
+    class Format(StrEnum):
+        CSV = "csv"
+        NDJSON = "ndjson"
+
+    form_uuid: UUID
+    format: Format = Format.CSV
+
+
+class CountFormResponsesQuery(Query):
+    class ConditionDTO(BaseModel):
+        field_uuid: UUID
+        value: Any
+
+    form_uuid: UUID
+    where: list[ConditionDTO]
+
+    class ResultDTO(BaseModel):
+        count: int
+
+
+RESPONSES_PAGE_LIMIT = 100
+MAX_RESPONSES_PAGE_LIMIT = 1000
+
+
+class ListFormResponsesQuery(Query):
+    form_uuid: UUID
+    field_uuid: UUID
+    value: Any
+    limit: int = Field(default=RESPONSES_PAGE_LIMIT, ge=1, le=MAX_RESPONSES_PAGE_LIMIT)
+    after: UUID | None = None
+
+    class FieldResponseDTO(BaseModel):
+        field_uuid: UUID
+        value: Any
+
+    class ResultDTO(BaseModel):
+        uuid: UUID
+        field_responses: list["ListFormResponsesQuery.FieldResponseDTO"]
+
+    class PageDTO(BaseModel):
+        # ResultDTO-shaped dicts from core.application.mappers
+        items: list[dict[str, Any]]
+        next_after: UUID | None
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from core.domain import exceptions
+from core.domain.entities import Form, FormResponse
+from core.domain.repositories import IAsyncRepository
+from core.domain.services import IResponseWriter, ISubmissionListener
+from core.domain.value_objects import FormUUID
+
+_Pending = tuple[Form, FormResponse, asyncio.Future[None]]
+_STOP = None
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseWriterClosed(Exception):
+    pass
+
+
+# Group commit for accepted responses. Callers wait in `write` until the batch
+# holding their response is saved, a batch is saved once `max_batch_size`
+# responses are queued or the oldest of them waited `max_delay` seconds. At
+# most `max_pending` responses are queued, further callers wait for room.
+class ResponseWriter(IResponseWriter):
+    def __init__(
+        self,
+        repository: IAsyncRepository,
+        listeners: Iterable[ISubmissionListener] = (),
+        max_batch_size: int = 256,
+        max_delay: float = 0.002,
+        max_pending: int = 4096,
+    ) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.batches = 0
+        self.written = 0
+        self._repository = repository
+        self._listeners = list(listeners)
+        self._queue: asyncio.Queue[_Pending | None] = asyncio.Queue(max_pending)
+        self._task: asyncio.Task[None] | None = None
+        self._is_closed = False
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # everything queued before the stop is still saved
+        if self._is_closed:
+            return
+        self._is_closed = True
+        if self._task is not None and not self._task.done():
+            await self._queue.put(_STOP)
+            await self._task
+
+    async def write(self, form: Form, response: FormResponse) -> None:
+        if self._is_closed or self._task is None:
+            raise ResponseWriterClosed()
+        committed = asyncio.get_running_loop().create_future()
+        await self._queue.put((form, response, committed))
+        # a writer task that ended for any reason will never resolve it
+        await asyncio.wait((committed, self._task), return_when=asyncio.FIRST_COMPLETED)
+        if not committed.done():
+            raise ResponseWriterClosed()
+        committed.result()
+
+    async def _run(self) -> None:
+        try:
+            await self._consume()
+        except Exception:
+            logger.exception("Response writer failed, refusing further writes")
+        finally:
+            self._is_closed = True
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        is_stopping = False
+        while not is_stopping:
+            pending = await queue.get()
+            if pending is _STOP:
+                break
+            batch = [pending]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        pending = await asyncio.wait_for(queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                else:
+                    pending = queue.get_nowait()
+                if pending is _STOP:
+                    is_stopping = True
+                    break
+                batch.append(pending)
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[_Pending]) -> None:
+        try:
+            # responses are never saved over stored ones
+            saved = await self._repository.get_saved_response_uuids(
+                [response.uuid for _, response, _ in batch]
+            )
+            if saved:
+                for _, response, committed in batch:
+                    if response.uuid in saved and not committed.done():
+                        committed.set_exception(exceptions.AlreadySubmitted())
+                batch = [pending for pending in batch if pending[1].uuid not in saved]
+                if not batch:
+                    return
+            await self._repository.save_form_responses(
+                [response for _, response, _ in batch]
+            )
+        except Exception as error:
+            for _, _, committed in batch:
+                if not committed.done():
+                    committed.set_exception(error)
+            return
+        self.batches += 1
+        self.written += len(batch)
+        for _, _, committed in batch:
+            if not committed.done():
+                committed.set_result(None)
+
+        # listeners hear about every saved response, even when its caller
+        # has stopped waiting. A failing listener is logged, the responses
+        # are saved already and the writer keeps going.
+        if self._listeners:
+            forms: dict[FormUUID, Form] = {}
+            accepted: dict[FormUUID, list[FormResponse]] = {}
+            for form, response, _ in batch:
+                forms[form.uuid] = form
+                accepted.setdefault(form.uuid, []).append(response)
+            for form_uuid, responses in accepted.items():
+                for listener in self._listeners:
+                    try:
+                        listener.on_accepted(forms[form_uuid], responses)
+                    except Exception:
+                        logger.exception(
+                            "%s failed for form %s",
+                            type(listener).__name__,
+                            form_uuid.value,
+                        )
@@ -0,0 +1,195 @@
+from itertools import compress
+from typing import Any
+
+from core.domain import exceptions
+from core.domain.entities import Form, FormResponse
+from core.domain.projections import FormProjection, FormProjections
+from core.domain.value_objects import (
+    AllOf,
+    Condition,
+    FieldEquals,
+    FieldUUID,
+    FormResponseUUID,
+)
+
+# Row masks are Python ints with bit i set for row i, so filters combine
+# whole columns with C-level big integer operations instead of visiting
+# responses one by one.
+
+
+class BitColumn:
+    # answers of a two-valued field: one bit per row for "answered" (the
+    # null bitmap) and one for the answer being the second key
+    __slots__ = ("keys", "present", "values")
+
+    def __init__(self, keys: tuple[Any, Any], capacity: int) -> None:
+        self.keys = keys
+        self.present = bytearray(capacity // 8)
+        self.values = bytearray(capacity // 8)
+
+    def reserve(self, capacity: int) -> None:
+        grow = capacity // 8 - len(self.present)
+        self.present.extend(bytes(grow))
+        self.values.extend(bytes(grow))
+
+    def set(self, row: int, value: Any) -> None:
+        position = self._position(value)
+        if position is None:
+            return
+        index, bit = row >> 3, 1 << (row & 7)
+        self.present[index] |= bit
+        if position:
+            self.values[index] |= bit
+
+    def mask(self, value: Any) -> int:
+        if value is None:
+            return ~int.from_bytes(self.present, "little")
+        position = self._position(value)
+        if position is None:
+            return 0
+        values = int.from_bytes(self.values, "little")
+        if position:
+            return values
+        return int.from_bytes(self.present, "little") & ~values
+
+    def _position(self, value: Any) -> int | None:
+        # compared by type too, so 1 and 0 are not taken for True and False
+        for position, key in enumerate(self.keys):
+            if type(value) is type(key) and value == key:
+                return position
+        return None
+
+
+class CodeColumn:
+    # dictionary-encoded answers, one byte per row: 0 for no answer, else
+    # the position of the answer in `keys` plus one
+    __slots__ = ("keys", "codes", "_positions")
+
+    def __init__(self, keys: tuple[Any, ...], capacity: int) -> None:
+        self.keys = keys
+        self.codes = bytearray(capacity)
+        self._positions = {
+            (type(key), key): code for code, key in enumerate(keys, start=1)
+        }
+
+    def reserve(self, capacity: int) -> None:
+        self.codes.extend(bytes(capacity - len(self.codes)))
+
+    def set(self, row: int, value: Any) -> None:
+        if value is not None:
+            self.codes[row] = self._code(value) or 0
+
+    def mask(self, value: Any) -> int:
+        code = 0 if value is None else self._code(value)
+        if code is None or not self.codes:
+            return 0
+        # the matching rows become "1" digits of a little-endian bit string
+        table = bytearray(b"0" * 256)
+        table[code] = ord("1")
+        return int(self.codes.translate(table)[::-1], 2)
+
+    def _code(self, value: Any) -> int | None:
+        # filters carry any JSON value, lists and dicts are never an answer
+        try:
+            return self._positions.get((type(value), value))
+        except TypeError:
+            return None
+
+
+Column = BitColumn | CodeColumn
+
+# codes have to fit into one byte, fields with more answers are not stored
+MAX_CODES = 255
+# columns grow by this many rows at a time, a multiple of 8
+CAPACITY_STEP = 4096
+
+
+class FormColumns(FormProjection):
+    def __init__(self, form: Form) -> None:
+        self.version = form.version
+        self.rows = 0
+        self.capacity = 0
+        self.uuids: list[FormResponseUUID] = []
+        self.columns: dict[FieldUUID, Column] = {}
+        self._field_uuids: frozenset[FieldUUID] = frozenset()
+        self.reconcile(form)
+
+    def reconcile(self, form: Form) -> None:
+        # columns of new fields, or of fields with other answers, start out
+        # with no answer for every row stored so far
+        columns = {}
+        for form_field in form.get_ordered_fields():
+            keys = form_field.get_tally_keys()
+            if keys is None or len(keys) > MAX_CODES:
+                continue
+            column = self.columns.get(form_field.uuid)
+            if column is None or column.keys != keys:
+                column = _create_column(keys, self.capacity)
+            columns[form_field.uuid] = column
+        self.columns = columns
+        self._field_uuids = frozenset(
+            form_field.uuid for form_field in form.get_ordered_fields()
+        )
+        self.version = form.version
+
+    def add(self, response: FormResponse) -> None:
+        # reserved rows hold no answers, so only answered fields are written
+        row = self.rows
+        if row == self.capacity:
+            self.capacity += CAPACITY_STEP
+            for column in self.columns.values():
+                column.reserve(self.capacity)
+        columns = self.columns
+        for field_response in response.field_responses:
+            column = columns.get(field_response.field_uuid)
+            if column is not None:
+                column.set(row, field_response.value)
+        self.uuids.append(response.uuid)
+        self.rows = row + 1
+
+    def mask(self, condition: Condition) -> int:
+        return self._mask(condition) & ((1 << self.rows) - 1)
+
+    def _mask(self, condition: Condition) -> int:
+        # may have bits set for reserved rows past `rows`
+        if isinstance(condition, FieldEquals):
+            column = self.columns.get(condition.field_uuid)
+            if column is None:
+                if condition.field_uuid not in self._field_uuids:
+                    raise exceptions.FormDoesNotHaveThisField()
+                raise exceptions.FieldCannotBeFiltered()
+            return column.mask(condition.value)
+        masks = (self._mask(child) for child in condition.conditions)
+        if isinstance(condition, AllOf):
+            result = -1
+            for mask in masks:
+                result &= mask
+            return result
+        result = 0
+        for mask in masks:
+            result |= mask
+        return result
+
+    def count(self, condition: Condition) -> int:
+        return self.mask(condition).bit_count()
+
+    def filter(self, condition: Condition) -> list[FormResponseUUID]:
+        mask = self.mask(condition)
+        if not mask:
+            return []
+        selectors = f"{mask:0{self.rows}b}".encode()[::-1].translate(_SELECTORS)
+        return list(compress(self.uuids, selectors))
+
+
+class ResponseColumns(FormProjections[FormColumns]):
+    def _create(self, form: Form) -> FormColumns:
+        return FormColumns(form)
+
+
+_SELECTORS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _create_column(keys: tuple[Any, ...], capacity: int) -> Column:
+    if len(keys) == 2:
+        return BitColumn(keys, capacity)
+    return CodeColumn(keys, capacity)
@@ -1,4 +1,11 @@
-from .field import Field, BooleanField
+from .field import (
+    Field,
+    BooleanField,
+    EmailField,
+    FileField,
+    SingleSelectField,
+    TextField,
+)
 from .form import Form
 from .response import FormResponse, FieldResponse
 
@@ -9,4 +16,8 @@ __all__ = [
     "FormResponse",
     "FieldResponse",
     "BooleanField",
+    "EmailField",
+    "FileField",
+    "SingleSelectField",
+    "TextField",
 ]
@@ -1,6 +1,7 @@
+# Entities keep no per-instance __dict__, every subclass declares __slots__
 class Entity:
-    pass
+    __slots__ = ()
 
 
 class Aggregate:
-    pass
+    __slots__ = ()
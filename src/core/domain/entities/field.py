@@ -1,26 +1,54 @@
+import re
+from collections.abc import Callable, Iterable, Mapping
 from enum import Enum
 from typing import Any
 
+from core.domain import exceptions
 from core.domain.entities.base import Entity
-from core.domain.value_objects import FieldUUID
+from core.domain.value_objects import BlobReference, Condition, FieldUUID, FileLimits
+
+
+Validator = Callable[[Any], bool]
 
 
 class FieldType(Enum):
     BOOLEAN = "boolean"
+    FILE = "file"
+    TEXT = "text"
+    EMAIL = "email"
+    SINGLE_SELECT = "single_select"
 
 
 class Field(Entity):
+    # `type` is a class attribute of every concrete field class, not a slot
+    __slots__ = ("uuid", "_is_required", "_condition", "_listeners", "_validator")
     type: FieldType
+    _types: dict[FieldType, type["Field"]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "type" in cls.__dict__:
+            Field._types[cls.type] = cls
 
     def __init__(self, uuid: FieldUUID, type: FieldType) -> None:
+        if type is not self.type:
+            raise ValueError(
+                f"{self.__class__.__name__} fields are of type {self.type}"
+            )
         self.uuid = uuid
-        self.type = type
         self._is_required = False
+        self._condition: Condition | None = None
+        self._listeners: list[Callable[["Field"], None]] = []
+        self._validator: Validator | None = None
 
     @property
     def is_required(self) -> bool:
         return self._is_required
 
+    @property
+    def condition(self) -> Condition | None:
+        return self._condition
+
     @classmethod
     def create(cls) -> "Field":
         return cls(
@@ -28,29 +56,262 @@ class Field(Entity):
             type=cls.type,
         )
 
+    @classmethod
+    def for_type(cls, field_type: FieldType) -> type["Field"]:
+        return cls._types[field_type]
+
+    @property
+    def settings(self) -> dict[str, Any]:
+        # JSON-compatible options of the field type, restored by `configure`
+        return {}
+
+    def configure(self, settings: Mapping[str, Any]) -> None:
+        pass
+
+    def subscribe(self, listener: Callable[["Field"], None]) -> None:
+        self._listeners.append(listener)
+
     def mark_required(self) -> None:
+        if self._is_required:
+            return
         self._is_required = True
+        self._notify()
 
     def mark_not_required(self) -> None:
+        if not self._is_required:
+            return
         self._is_required = False
+        self._notify()
+
+    def set_condition(self, condition: Condition | None) -> None:
+        # a form refusing the condition leaves the field as it was
+        if condition == self._condition:
+            return
+        previous, self._condition = self._condition, condition
+        try:
+            self._notify()
+        except exceptions.DomainError:
+            self._condition = previous
+            self._notify()
+            raise
 
     def is_valid(self, value: Any) -> bool:
-        is_none = value is None
-        if is_none and self._is_required:
-            return False
-        return self._is_valid(value)
+        return self.compile_validator()(value)
+
+    def is_valid_many(self, values: Iterable[Any]) -> list[bool]:
+        return list(map(self.compile_validator(), values))
+
+    def compile_validator(self) -> Validator:
+        # built once and kept until the field changes
+        if self._validator is None:
+            validate = self._compile_validator()
+            if self._is_required:
+                validate = _required(validate)
+            self._validator = validate
+        return self._validator
+
+    def get_tally_keys(self) -> tuple[Any, ...] | None:
+        # the finite set of answers worth counting, None if answers are free-form
+        return None
 
     def _is_valid(self, value: Any) -> bool:
         raise NotImplementedError
 
+    def _compile_validator(self) -> Validator:
+        return self._is_valid
+
+    def _notify(self) -> None:
+        self._validator = None
+        for listener in self._listeners:
+            listener(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Field):
+            return NotImplemented
+        return self.uuid == other.uuid
+
     def __hash__(self) -> int:
         return hash(self.uuid)
 
 
+def _required(validate: Validator) -> Validator:
+    return lambda value: value is not None and validate(value)
+
+
 class BooleanField(Field):
+    __slots__ = ()
     type: FieldType = FieldType.BOOLEAN
 
     def _is_valid(self, value: Any) -> bool:
-        if not isinstance(value, bool):
-            return False
-        return True
+        return _is_boolean(value)
+
+    def _compile_validator(self) -> Validator:
+        return _is_boolean
+
+    def get_tally_keys(self) -> tuple[Any, ...]:
+        return (False, True)
+
+
+def _is_boolean(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024
+
+
+# Answered with the BlobReference of a file uploaded beforehand. Only its
+# shape and limits are checked here; submissions compare it with the blob
+# store, see SubmitFormService.
+class FileField(Field):
+    __slots__ = ("_limits",)
+    type: FieldType = FieldType.FILE
+
+    def __init__(
+        self, uuid: FieldUUID, type: FieldType, limits: FileLimits | None = None
+    ) -> None:
+        super().__init__(uuid, type)
+        self._limits = (
+            limits if limits is not None else FileLimits(DEFAULT_MAX_FILE_SIZE)
+        )
+
+    @property
+    def limits(self) -> FileLimits:
+        return self._limits
+
+    def set_limits(self, limits: FileLimits) -> None:
+        if limits == self._limits:
+            return
+        self._limits = limits
+        self._notify()
+
+    @property
+    def settings(self) -> dict[str, Any]:
+        return {
+            "max_size": self._limits.max_size,
+            "media_types": sorted(self._limits.media_types),
+        }
+
+    def configure(self, settings: Mapping[str, Any]) -> None:
+        self.set_limits(
+            FileLimits(settings["max_size"], frozenset(settings["media_types"]))
+        )
+
+    def _is_valid(self, value: Any) -> bool:
+        reference = BlobReference.from_value(value)
+        return (
+            reference is not None
+            and self._limits.allows_size(reference.size)
+            and self._limits.allows_media_type(reference.media_type)
+        )
+
+
+DEFAULT_MAX_TEXT_LENGTH = 1000
+
+
+class TextField(Field):
+    __slots__ = ("_max_length",)
+    type: FieldType = FieldType.TEXT
+
+    def __init__(
+        self,
+        uuid: FieldUUID,
+        type: FieldType,
+        max_length: int = DEFAULT_MAX_TEXT_LENGTH,
+    ) -> None:
+        super().__init__(uuid, type)
+        self._max_length = max_length
+
+    @property
+    def max_length(self) -> int:
+        return self._max_length
+
+    def set_max_length(self, max_length: int) -> None:
+        if max_length == self._max_length:
+            return
+        self._max_length = max_length
+        self._notify()
+
+    @property
+    def settings(self) -> dict[str, Any]:
+        return {"max_length": self._max_length}
+
+    def configure(self, settings: Mapping[str, Any]) -> None:
+        self.set_max_length(settings["max_length"])
+
+    def _compile_validator(self) -> Validator:
+        max_length = self._max_length
+        return lambda value: type(value) is str and len(value) <= max_length
+
+
+# local@domain.tld without whitespace; the longest address SMTP can deliver
+_EMAIL = re.compile(r"[^@\s]+@[^@\s.]+(?:\.[^@\s.]+)+")
+MAX_EMAIL_LENGTH = 254
+
+
+class EmailField(Field):
+    __slots__ = ()
+    type: FieldType = FieldType.EMAIL
+
+    def _is_valid(self, value: Any) -> bool:
+        return _is_email(value)
+
+    def _compile_validator(self) -> Validator:
+        return _is_email
+
+
+_match_email = _EMAIL.fullmatch
+
+
+def _is_email(value: Any) -> bool:
+    return (
+        type(value) is str
+        and len(value) <= MAX_EMAIL_LENGTH
+        and _match_email(value) is not None
+    )
+
+
+# Answered with the id of one of its options
+class SingleSelectField(Field):
+    __slots__ = ("_options", "_option_set")
+    type: FieldType = FieldType.SINGLE_SELECT
+
+    def __init__(
+        self, uuid: FieldUUID, type: FieldType, options: Iterable[str] = ()
+    ) -> None:
+        super().__init__(uuid, type)
+        self._options: tuple[str, ...] = ()
+        self._option_set: frozenset[str] = frozenset()
+        self._set_options(tuple(options))
+
+    @property
+    def options(self) -> tuple[str, ...]:
+        return self._options
+
+    def set_options(self, options: Iterable[str]) -> None:
+        options = tuple(options)
+        if options == self._options:
+            return
+        self._set_options(options)
+        self._notify()
+
+    def _set_options(self, options: tuple[str, ...]) -> None:
+        option_set = frozenset(options)
+        if len(option_set) != len(options):
+            raise ValueError("options of a select field have to be unique")
+        self._options = options
+        self._option_set = option_set
+
+    @property
+    def settings(self) -> dict[str, Any]:
+        return {"options": list(self._options)}
+
+    def configure(self, settings: Mapping[str, Any]) -> None:
+        self.set_options(settings["options"])
+
+    def get_tally_keys(self) -> tuple[Any, ...]:
+        return self._options
+
+    def _compile_validator(self) -> Validator:
+        # the type check first: lists or dicts cannot be looked up in a set
+        option_set = self._option_set
+        return lambda value: type(value) is str and value in option_set
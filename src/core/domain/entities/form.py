@@ -1,18 +1,39 @@
+from collections.abc import Iterable
+from graphlib import CycleError, TopologicalSorter
 from typing import Any
 
 from core.domain.entities.base import Aggregate
-from core.domain.value_objects import FormUUID, FieldUUID
+from core.domain.value_objects import AllOf, AnyOf, Condition, FormUUID, FieldUUID
 from dataclasses import dataclass, field
-from core.domain.entities.field import Field
+from core.domain.entities.field import Field, Validator
 from core.domain import exceptions
 
+# conditions nested deeper than this are refused: visibility rules compile
+# each level into nested parentheses, which Python's parser limits
+MAX_CONDITION_DEPTH = 32
+
 
 # AggregateRoot
-@dataclass
+@dataclass(slots=True)
 class Form(Aggregate):
     uuid: FormUUID
     title: str
     fields: set[Field] = field(default_factory=set)
+    version: int = field(default=0, compare=False)
+    _fields_by_uuid: dict[FieldUUID, Field] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _required_fields: set[Field] = field(
+        init=False, repr=False, compare=False, default_factory=set
+    )
+    _required_field_uuids: frozenset[FieldUUID] | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    def __post_init__(self) -> None:
+        self._check_new_fields(self.fields)
+        for form_field in self.fields:
+            self._index_field(form_field)
 
     @classmethod
     def create(cls, title: str) -> "Form":
@@ -22,29 +43,124 @@ class Form(Aggregate):
         )
 
     def add_field(self, form_field: Field) -> None:
-        if form_field in self.fields:
+        self.add_fields([form_field])
+
+    def add_fields(self, form_fields: list[Field]) -> None:
+        # checked together, so their conditions may read each other in any order
+        field_uuids = {form_field.uuid for form_field in form_fields}
+        if len(field_uuids) < len(form_fields) or any(
+            self.has_field(field_uuid) for field_uuid in field_uuids
+        ):
             raise exceptions.FormCanOnlyHaveUniqueFields()
-        self.fields.add(form_field)
+        self._check_new_fields(form_fields)
+        for form_field in form_fields:
+            self.fields.add(form_field)
+            self._index_field(form_field)
+        self.version += 1
+
+    def get_ordered_fields(self) -> list[Field]:
+        return list(self._fields_by_uuid.values())
 
     def get_required_fields(self) -> set[Field]:
-        required_fields = set()
-        for form_field in self.fields:
-            if not form_field.is_required:
-                continue
-            required_fields.add(form_field)
-        return required_fields
+        return set(self._required_fields)
+
+    def get_required_field_uuids(self) -> frozenset[FieldUUID]:
+        if self._required_field_uuids is None:
+            self._required_field_uuids = frozenset(
+                form_field.uuid for form_field in self._required_fields
+            )
+        return self._required_field_uuids
 
-    def _get_field(self, field_uuid: FieldUUID) -> Field | None:
-        return next(filter(lambda f: f.uuid == field_uuid, self.fields), None)
+    def has_field(self, field_uuid: FieldUUID) -> bool:
+        return field_uuid in self._fields_by_uuid
+
+    def get_field(self, field_uuid: FieldUUID) -> Field | None:
+        return self._fields_by_uuid.get(field_uuid)
 
     def is_valid_input_for_field(self, value: Any, field_uuid: FieldUUID) -> bool:
-        maybe_field = self._get_field(field_uuid)
+        maybe_field = self.get_field(field_uuid)
         if not maybe_field:
             raise exceptions.FormDoesNotHaveThisField()
         return maybe_field.is_valid(value)
 
+    def get_field_validators(self) -> dict[FieldUUID, Validator]:
+        return {
+            field_uuid: form_field.compile_validator()
+            for field_uuid, form_field in self._fields_by_uuid.items()
+        }
+
+    def _index_field(self, form_field: Field) -> None:
+        self._fields_by_uuid[form_field.uuid] = form_field
+        form_field.subscribe(self._on_field_changed)
+        self._track_requirement(form_field)
+
+    def _on_field_changed(self, form_field: Field) -> None:
+        self._check_condition(form_field)
+        self._track_requirement(form_field)
+        self.version += 1
+
+    def _check_new_fields(self, form_fields: Iterable[Field]) -> None:
+        # no condition in the form can read a field that is only being added,
+        # so a cycle can only run through the new fields themselves
+        new_uuids = {form_field.uuid for form_field in form_fields}
+        graph = {}
+        for form_field in form_fields:
+            if form_field.condition is None:
+                continue
+            _check_depth(form_field.condition)
+            field_uuids = form_field.condition.get_field_uuids()
+            if not all(
+                field_uuid in new_uuids or self.has_field(field_uuid)
+                for field_uuid in field_uuids
+            ):
+                raise exceptions.FormDoesNotHaveThisField()
+            graph[form_field.uuid] = field_uuids & new_uuids
+        try:
+            TopologicalSorter(graph).prepare()
+        except CycleError as error:
+            raise exceptions.FormHasCyclicConditions() from error
+
+    def _check_condition(self, form_field: Field) -> None:
+        # a condition may only read fields of this form and must not depend
+        # on its own field, directly or through other conditions
+        if form_field.condition is None:
+            return
+        _check_depth(form_field.condition)
+        pending = list(form_field.condition.get_field_uuids())
+        seen: set[FieldUUID] = set()
+        while pending:
+            field_uuid = pending.pop()
+            if field_uuid == form_field.uuid:
+                raise exceptions.FormHasCyclicConditions()
+            if field_uuid in seen:
+                continue
+            seen.add(field_uuid)
+            dependency = self._fields_by_uuid.get(field_uuid)
+            if dependency is None:
+                raise exceptions.FormDoesNotHaveThisField()
+            if dependency.condition is not None:
+                pending.extend(dependency.condition.get_field_uuids())
+
+    def _track_requirement(self, form_field: Field) -> None:
+        if form_field.is_required:
+            self._required_fields.add(form_field)
+        else:
+            self._required_fields.discard(form_field)
+        self._required_field_uuids = None
+
     def __str__(self) -> str:
         return self.title
 
     def __hash__(self) -> int:
         return hash(self.uuid)
+
+
+def _check_depth(condition: Condition) -> None:
+    # iterative, a condition too deep to compile may also be too deep to recurse
+    pending = [(condition, 1)]
+    while pending:
+        condition, depth = pending.pop()
+        if depth > MAX_CONDITION_DEPTH:
+            raise exceptions.ConditionIsTooDeep()
+        if isinstance(condition, (AllOf, AnyOf)):
+            pending.extend((child, depth + 1) for child in condition.conditions)
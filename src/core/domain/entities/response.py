@@ -5,11 +5,12 @@ from core.domain.value_objects import (
     FieldResponseUUID,
     FormResponseUUID,
 )
-from dataclasses import dataclass, field
+from collections.abc import Iterable, Set as AbstractSet, ValuesView
+from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldResponse(Entity):
     uuid: FieldResponseUUID
     value: Any
@@ -27,11 +28,24 @@ class FieldResponse(Entity):
         return hash(self.uuid)
 
 
-@dataclass
 class FormResponse(Aggregate):
-    uuid: FormResponseUUID
-    form_uuid: FormUUID
-    field_responses: set[FieldResponse] = field(default_factory=set)
+    __slots__ = ("uuid", "form_uuid", "_responses")
+
+    def __init__(
+        self,
+        uuid: FormResponseUUID,
+        form_uuid: FormUUID,
+        field_responses: Iterable[FieldResponse] = (),
+    ) -> None:
+        self.uuid = uuid
+        self.form_uuid = form_uuid
+        self._responses: dict[FieldUUID, FieldResponse] = {}
+        for field_response in field_responses:
+            self.add_field_response(field_response)
+
+    @property
+    def field_responses(self) -> ValuesView[FieldResponse]:
+        return self._responses.values()
 
     @classmethod
     def create(cls, for_form_uuid: FormUUID) -> "FormResponse":
@@ -41,24 +55,35 @@ class FormResponse(Aggregate):
         )
 
     def add_field_response(self, field_response: FieldResponse) -> None:
-        maybe_field = self.get_response(field_response.field_uuid)
-        if maybe_field:
-            self.field_responses.remove(maybe_field)
-        # todo: what if adding same response
-        self.field_responses.add(field_response)
+        # a later response for the same field replaces the previous one
+        self._responses[field_response.field_uuid] = field_response
 
     def get_response(self, for_field: FieldUUID) -> FieldResponse | None:
-        existing_response = next(
-            filter(lambda r: r.field_uuid == for_field, self.field_responses), None
+        return self._responses.get(for_field)
+
+    def get_values(self) -> dict[FieldUUID, Any]:
+        return {
+            field_uuid: field_response.value
+            for field_uuid, field_response in self._responses.items()
+        }
+
+    def has_all_required_fields(self, required_fields: AbstractSet[FieldUUID]) -> bool:
+        return self._responses.keys() >= required_fields
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FormResponse):
+            return NotImplemented
+        return (
+            self.uuid == other.uuid
+            and self.form_uuid == other.form_uuid
+            and self._responses == other._responses
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"FormResponse(uuid={self.uuid!r}, form_uuid={self.form_uuid!r}, "
+            f"field_responses={list(self._responses.values())!r})"
         )
-        return existing_response
-
-    def has_all_required_fields(self, required_fields: set[FieldUUID]) -> bool:
-        for response_field in required_fields:
-            response = self.get_response(for_field=response_field)
-            if not response:
-                return False
-        return True
 
     def __hash__(self) -> int:
         return hash(self.uuid)
@@ -22,5 +22,41 @@ class InvalidFormSubmission(DomainError):
     pass
 
 
+class AlreadySubmitted(DomainError):
+    pass
+
+
 class FormDoesNotHaveThisField(DomainError):
     pass
+
+
+class FormHasCyclicConditions(DomainError):
+    pass
+
+
+class ConditionIsTooDeep(DomainError):
+    pass
+
+
+class AnswerForHiddenField(DomainError):
+    pass
+
+
+class FieldCannotBeFiltered(DomainError):
+    pass
+
+
+class FieldDoesNotAcceptFiles(DomainError):
+    pass
+
+
+class FileTooLarge(DomainError):
+    pass
+
+
+class FileTypeNotAllowed(DomainError):
+    pass
+
+
+class FileNotUploaded(DomainError):
+    pass
@@ -0,0 +1,36 @@
+import codecs
+
+# enough of a file to recognise every type below
+SNIFF_SIZE = 512
+
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF-", "application/pdf"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"\x1f\x8b", "application/gzip"),
+)
+
+
+# The media type of a file from its first SNIFF_SIZE bytes. The type the
+# client declares is never trusted.
+def sniff_media_type(head: bytes) -> str:
+    for signature, media_type in _SIGNATURES:
+        if head.startswith(signature):
+            return media_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head and b"\x00" not in head and _is_utf8(head):
+        return "text/plain"
+    return "application/octet-stream"
+
+
+def _is_utf8(head: bytes) -> bool:
+    # the head may end in the middle of a multi-byte character
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
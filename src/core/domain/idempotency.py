@@ -0,0 +1,64 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from core.domain.value_objects import FormResponseUUID
+
+# the saved response's uuid, or the error a retry raises again
+Outcome = FormResponseUUID | Exception
+
+
+# Outcomes of recent submissions by idempotency key. A key is claimed before
+# the submission starts, so retries arriving while it runs wait for the same
+# outcome. Keys expire `ttl` seconds after their claim, and the oldest key is
+# dropped once `capacity` keys are held.
+class SubmissionOutcomes:
+    def __init__(
+        self,
+        capacity: int = 65536,
+        ttl: float = 24 * 60 * 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        # claim order is also expiry order, the ttl being the same for all
+        self._entries: OrderedDict[Hashable, tuple[float, asyncio.Future[Outcome]]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def claim(self, key: Hashable) -> tuple[asyncio.Future[Outcome], bool]:
+        now = self._clock()
+        self._expire(now)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry[1], False
+        self.misses += 1
+        outcome = asyncio.get_running_loop().create_future()
+        self._entries[key] = (now + self.ttl, outcome)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return outcome, True
+
+    def forget(self, key: Hashable, outcome: asyncio.Future[Outcome]) -> None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is outcome:
+            del self._entries[key]
+
+    def _expire(self, now: float) -> None:
+        entries = self._entries
+        while entries:
+            key = next(iter(entries))
+            if entries[key][0] > now:
+                break
+            del entries[key]
+            self.evictions += 1
@@ -0,0 +1,84 @@
+import asyncio
+from collections.abc import AsyncIterable
+from typing import Generic, TypeVar
+
+from core.domain.entities import Form, FormResponse
+from core.domain.services import ISubmissionListener
+from core.domain.value_objects import FormResponseUUID, FormUUID
+
+
+# Data derived from a form's responses, kept up to date as responses arrive
+class FormProjection:
+    version: int
+
+    def add(self, response: FormResponse) -> None:
+        raise NotImplementedError
+
+    def reconcile(self, form: Form) -> None:
+        raise NotImplementedError
+
+
+P = TypeVar("P", bound=FormProjection)
+
+
+class FormProjections(ISubmissionListener, Generic[P]):
+    def __init__(self) -> None:
+        self._projections: dict[FormUUID, P] = {}
+        self._rebuilding: dict[FormUUID, dict[FormResponseUUID, FormResponse]] = {}
+        self._rebuilds: dict[FormUUID, asyncio.Future[P]] = {}
+
+    def _create(self, form: Form) -> P:
+        raise NotImplementedError
+
+    def get(self, form: Form) -> P | None:
+        projection = self._projections.get(form.uuid)
+        if projection is not None and projection.version != form.version:
+            projection.reconcile(form)
+        return projection
+
+    def on_accepted(self, form: Form, responses: list[FormResponse]) -> None:
+        pending = self._rebuilding.get(form.uuid)
+        if pending is not None:
+            pending.update((response.uuid, response) for response in responses)
+        # forms without a projection yet get one from a rebuild, so responses
+        # stored before this process started are included too
+        projection = self.get(form)
+        if projection is None:
+            return
+        for response in responses:
+            projection.add(response)
+
+    async def rebuild(self, form: Form, responses: AsyncIterable[FormResponse]) -> P:
+        # concurrent callers share the first caller's scan, the responses of
+        # the others are never read
+        rebuild = self._rebuilds.get(form.uuid)
+        if rebuild is None:
+            rebuild = asyncio.ensure_future(self._rebuild(form, responses))
+            self._rebuilds[form.uuid] = rebuild
+            rebuild.add_done_callback(lambda _: self._rebuilds.pop(form.uuid, None))
+        else:
+            aclose = getattr(responses, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        # a cancelled caller does not cancel the scan the others wait for
+        return await asyncio.shield(rebuild)
+
+    async def _rebuild(self, form: Form, responses: AsyncIterable[FormResponse]) -> P:
+        # responses accepted while the stored ones are scanned are kept aside
+        # and added at the end unless the scan read them, whether before or
+        # after they were accepted
+        pending: dict[FormResponseUUID, FormResponse] = {}
+        scanned: set[FormResponseUUID] = set()
+        self._rebuilding[form.uuid] = pending
+        projection = self._create(form)
+        try:
+            async for response in responses:
+                scanned.add(response.uuid)
+                projection.add(response)
+            for response_uuid, response in pending.items():
+                if response_uuid not in scanned:
+                    projection.add(response)
+        finally:
+            del self._rebuilding[form.uuid]
+        self._projections[form.uuid] = projection
+        return projection
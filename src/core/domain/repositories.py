@@ -1,11 +1,28 @@
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from typing import Any
+
 from core.domain.entities import Form, FormResponse
-from core.domain.value_objects import FormUUID, FormResponseUUID
+from core.domain.value_objects import (
+    BlobReference,
+    FieldUUID,
+    FileLimits,
+    FormUUID,
+    FormResponseUUID,
+)
 
 
+# ThreadPoolRepository calls an implementation from several threads at once,
+# so those it wraps have to be thread-safe. InMemoryRepository (and so
+# MockedRepository) takes a lock, SqliteRepository gives each call its own
+# pooled connection, and NotifyingRepository is as safe as what it wraps.
 class IRepository:
     def get_all_forms(self) -> set[Form]:
         raise NotImplementedError
 
+    def get_forms_page(self, after: FormUUID | None, limit: int) -> list[Form]:
+        # at most `limit` forms ordered by uuid, starting right after `after`
+        raise NotImplementedError
+
     def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
         raise NotImplementedError
 
@@ -14,8 +31,102 @@ class IRepository:
     ) -> FormResponse | None:
         raise NotImplementedError
 
+    def get_responses_for_form(self, form_uuid: FormUUID) -> Iterator[FormResponse]:
+        raise NotImplementedError
+
+    def get_responses_by_value(
+        self,
+        form_uuid: FormUUID,
+        field_uuid: FieldUUID,
+        value: Any,
+        after: FormResponseUUID | None,
+        limit: int,
+    ) -> list[FormResponse]:
+        # at most `limit` responses answering `value` to the field, in the
+        # order they were first saved, starting right after `after`
+        raise NotImplementedError
+
+    def get_saved_response_uuids(
+        self, uuids: list[FormResponseUUID]
+    ) -> set[FormResponseUUID]:
+        # the ones of `uuids` that a saved response already has
+        raise NotImplementedError
+
     def save_form_response(self, form_response: FormResponse) -> None:
         raise NotImplementedError
 
+    def save_form_responses(self, form_responses: list[FormResponse]) -> None:
+        raise NotImplementedError
+
     def save_form(self, form: Form) -> None:
+        # sets `form.version` above that of the form saved before under its
+        # uuid, even when `form` is a new object counting from zero
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class IAsyncRepository:
+    async def get_all_forms(self) -> set[Form]:
+        raise NotImplementedError
+
+    async def get_forms_page(self, after: FormUUID | None, limit: int) -> list[Form]:
+        raise NotImplementedError
+
+    async def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
+        raise NotImplementedError
+
+    async def get_form_response_by_uuid(
+        self, form_uuid: FormResponseUUID
+    ) -> FormResponse | None:
+        raise NotImplementedError
+
+    def get_responses_for_form(
+        self, form_uuid: FormUUID
+    ) -> AsyncIterator[FormResponse]:
+        raise NotImplementedError
+
+    async def get_responses_by_value(
+        self,
+        form_uuid: FormUUID,
+        field_uuid: FieldUUID,
+        value: Any,
+        after: FormResponseUUID | None,
+        limit: int,
+    ) -> list[FormResponse]:
         raise NotImplementedError
+
+    async def get_saved_response_uuids(
+        self, uuids: list[FormResponseUUID]
+    ) -> set[FormResponseUUID]:
+        raise NotImplementedError
+
+    async def save_form_response(self, form_response: FormResponse) -> None:
+        raise NotImplementedError
+
+    async def save_form_responses(self, form_responses: list[FormResponse]) -> None:
+        raise NotImplementedError
+
+    async def save_form(self, form: Form) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class IBlobStore:
+    async def save(
+        self, chunks: AsyncIterable[bytes], limits: FileLimits
+    ) -> BlobReference:
+        # raises FileTooLarge or FileTypeNotAllowed as soon as the streamed
+        # content breaks the limits, nothing is stored then
+        raise NotImplementedError
+
+    async def get(self, sha256: str) -> BlobReference | None:
+        # the size and media type of the stored content itself, never what a
+        # client claims; None if no such blob is stored
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
@@ -1,27 +1,207 @@
-from core.domain.entities import FormResponse
-from core.domain.repositories import IRepository
+import asyncio
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass
+
+from core.domain.entities import FileField, Form, FormResponse
+from core.domain.idempotency import SubmissionOutcomes
+from core.domain.repositories import IAsyncRepository, IBlobStore
 from core.domain import exceptions
+from core.domain.validation import SubmissionPlan, SubmissionPlanCache
+from core.domain.value_objects import (
+    BlobReference,
+    FieldUUID,
+    FormResponseUUID,
+    FormUUID,
+)
+
+
+@dataclass
+class SubmissionResult:
+    response: FormResponse
+    error: exceptions.DomainError | None = None
+
+    @property
+    def is_accepted(self) -> bool:
+        return self.error is None
+
+
+class ISubmissionListener:
+    def on_accepted(self, form: Form, responses: list[FormResponse]) -> None:
+        raise NotImplementedError
+
+
+# Saves accepted responses and notifies the listeners once they are saved
+class IResponseWriter:
+    async def write(self, form: Form, response: FormResponse) -> None:
+        raise NotImplementedError
 
 
 class SubmitFormService:
-    def __init__(self, repository: IRepository) -> None:
+    def __init__(
+        self,
+        repository: IAsyncRepository,
+        plans: SubmissionPlanCache | None = None,
+        listeners: Iterable[ISubmissionListener] = (),
+        writer: IResponseWriter | None = None,
+        outcomes: SubmissionOutcomes | None = None,
+        blobs: IBlobStore | None = None,
+    ) -> None:
         self._repository = repository
+        self._blobs = blobs
+        self._plans = plans if plans is not None else SubmissionPlanCache()
+        self._listeners = list(listeners)
+        self._writer = writer
+        self._outcomes = outcomes if outcomes is not None else SubmissionOutcomes()
+        # response uuids being saved right now; a response is never saved over
+        # another one, so a uuid is refused while in flight or once stored
+        self._in_flight: set[FormResponseUUID] = set()
+
+    async def submit(
+        self, response: FormResponse, idempotency_key: str | None = None
+    ) -> FormResponseUUID:
+        # a retry with the same key gets the first outcome without validating
+        # or saving again; only domain errors are kept, any other failure
+        # lets the next retry start over
+        if idempotency_key is None:
+            await self._submit(response)
+            return response.uuid
+
+        key = (response.form_uuid, idempotency_key)
+        outcome, is_first = self._outcomes.claim(key)
+        if not is_first:
+            result = await asyncio.shield(outcome)
+            if isinstance(result, Exception):
+                raise result.with_traceback(None)
+            return result
+        try:
+            await self._submit(response)
+        except exceptions.DomainError as error:
+            outcome.set_result(error)
+            raise
+        except Exception as error:
+            self._outcomes.forget(key, outcome)
+            outcome.set_result(error)
+            raise
+        except BaseException:
+            self._outcomes.forget(key, outcome)
+            outcome.cancel()
+            raise
+        outcome.set_result(response.uuid)
+        return response.uuid
+
+    async def _submit(self, response: FormResponse) -> None:
+        form = await self.validate(response)
+        if response.uuid in self._in_flight:
+            raise exceptions.AlreadySubmitted()
+        self._in_flight.add(response.uuid)
+        try:
+            # the writer refuses stored uuids itself, once per batch
+            if self._writer is not None:
+                await self._writer.write(form, response)
+                return
+            if await self._repository.get_saved_response_uuids([response.uuid]):
+                raise exceptions.AlreadySubmitted()
+            await self._repository.save_form_response(response)
+        finally:
+            self._in_flight.discard(response.uuid)
+        self._notify(form, [response])
 
-    def submit(self, response: FormResponse) -> None:
-        form = self._repository.get_form_by_uuid(response.form_uuid)
+    async def validate(self, response: FormResponse) -> Form:
+        form = await self._repository.get_form_by_uuid(response.form_uuid)
         if form is None:
             raise exceptions.FormNotFound()
 
-        required_fields = form.get_required_fields()
-        responses_expected_for_fields = {field.uuid for field in required_fields}
-        if not response.has_all_required_fields(responses_expected_for_fields):
-            raise exceptions.FormDoesNotHaveAllRequiredFields
+        plan = self._plans.get(form)
+        plan.validate(response)
+        await self._check_files(plan, response)
+        return form
 
+    async def _check_files(self, plan: SubmissionPlan, response: FormResponse) -> None:
+        # a file answer must name a stored blob, and what the store knows
+        # about it must match the answer the field's limits were checked on
+        if not plan.file_field_uuids:
+            return
         for field_response in response.field_responses:
-            is_valid = form.is_valid_input_for_field(
-                field_response.value, field_response.field_uuid
-            )
-            if not is_valid:
-                raise exceptions.InvalidFormSubmission()
+            if field_response.field_uuid not in plan.file_field_uuids:
+                continue
+            claimed = BlobReference.from_value(field_response.value)
+            stored = None
+            if self._blobs is not None and claimed is not None:
+                stored = await self._blobs.get(claimed.sha256)
+            if stored is None or stored != claimed:
+                raise exceptions.FileNotUploaded()
 
-        self._repository.save_form_response(response)
+    async def submit_many(
+        self, responses: Iterable[FormResponse]
+    ) -> list[SubmissionResult]:
+        forms: dict[FormUUID, Form | None] = {}
+        results = []
+        uuids: set[FormResponseUUID] = set()
+        for response in responses:
+            if response.form_uuid not in forms:
+                forms[response.form_uuid] = await self._repository.get_form_by_uuid(
+                    response.form_uuid
+                )
+            result = await self._check(forms[response.form_uuid], response)
+            if result.is_accepted:
+                if response.uuid in uuids or response.uuid in self._in_flight:
+                    result.error = exceptions.AlreadySubmitted()
+                else:
+                    uuids.add(response.uuid)
+            results.append(result)
+
+        self._in_flight.update(uuids)
+        try:
+            saved = await self._repository.get_saved_response_uuids(list(uuids))
+            for result in results:
+                if result.is_accepted and result.response.uuid in saved:
+                    result.error = exceptions.AlreadySubmitted()
+            accepted = [result.response for result in results if result.is_accepted]
+            if accepted:
+                await self._repository.save_form_responses(accepted)
+        finally:
+            self._in_flight.difference_update(uuids)
+        if self._listeners:
+            accepted_by_form: dict[FormUUID, list[FormResponse]] = {}
+            for response in accepted:
+                accepted_by_form.setdefault(response.form_uuid, []).append(response)
+            for form_uuid, form_responses in accepted_by_form.items():
+                self._notify(forms[form_uuid], form_responses)
+        return results
+
+    def _notify(self, form: Form, responses: list[FormResponse]) -> None:
+        for listener in self._listeners:
+            listener.on_accepted(form, responses)
+
+    async def _check(
+        self, form: Form | None, response: FormResponse
+    ) -> SubmissionResult:
+        if form is None:
+            return SubmissionResult(response, exceptions.FormNotFound())
+        try:
+            plan = self._plans.get(form)
+            plan.validate(response)
+            await self._check_files(plan, response)
+        except exceptions.DomainError as error:
+            return SubmissionResult(response, error)
+        return SubmissionResult(response)
+
+
+class UploadFileService:
+    def __init__(self, repository: IAsyncRepository, blobs: IBlobStore) -> None:
+        self._repository = repository
+        self._blobs = blobs
+
+    async def upload(
+        self, form_uuid: FormUUID, field_uuid: FieldUUID, chunks: AsyncIterable[bytes]
+    ) -> BlobReference:
+        # the returned reference is then submitted as the field's answer
+        form = await self._repository.get_form_by_uuid(form_uuid)
+        if form is None:
+            raise exceptions.FormNotFound()
+        form_field = form.get_field(field_uuid)
+        if form_field is None:
+            raise exceptions.FormDoesNotHaveThisField()
+        if not isinstance(form_field, FileField):
+            raise exceptions.FieldDoesNotAcceptFiles()
+        return await self._blobs.save(chunks, form_field.limits)
@@ -0,0 +1,58 @@
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from core.domain.entities import Form, FormResponse
+from core.domain.projections import FormProjection, FormProjections
+from core.domain.value_objects import FieldUUID
+
+
+class FieldTally:
+    def __init__(self, keys: tuple[Any, ...]) -> None:
+        self.keys = keys
+        self._positions = {key: position for position, key in enumerate(keys)}
+        self.counts = array("q", bytes(8 * len(keys)))
+
+    def add(self, value: Any) -> None:
+        position = self._positions.get(value)
+        if position is not None:
+            self.counts[position] += 1
+
+    def items(self) -> Iterable[tuple[Any, int]]:
+        return zip(self.keys, self.counts)
+
+
+class FormSummary(FormProjection):
+    def __init__(self, form: Form) -> None:
+        self.form_uuid = form.uuid
+        self.version = form.version
+        self.responses = 0
+        self.tallies: dict[FieldUUID, FieldTally] = {}
+        self.reconcile(form)
+
+    def reconcile(self, form: Form) -> None:
+        # keeps the counts of fields whose countable answers did not change
+        tallies = {}
+        for form_field in form.get_ordered_fields():
+            keys = form_field.get_tally_keys()
+            if keys is None:
+                continue
+            tally = self.tallies.get(form_field.uuid)
+            if tally is None or tally.keys != keys:
+                tally = FieldTally(keys)
+            tallies[form_field.uuid] = tally
+        self.tallies = tallies
+        self.version = form.version
+
+    def add(self, response: FormResponse) -> None:
+        self.responses += 1
+        tallies = self.tallies
+        for field_response in response.field_responses:
+            tally = tallies.get(field_response.field_uuid)
+            if tally is not None:
+                tally.add(field_response.value)
+
+
+class ResponseSummaries(FormProjections[FormSummary]):
+    def _create(self, form: Form) -> FormSummary:
+        return FormSummary(form)
@@ -0,0 +1,74 @@
+from core.domain import exceptions
+from core.domain.entities import FileField, Form, FormResponse
+from core.domain.entities.field import Validator
+from core.domain.value_objects import FieldUUID, FormUUID
+from core.domain.visibility import VisibilityRules
+
+
+# Flat view of a form used to check submissions, compiled once per form version
+class SubmissionPlan:
+    def __init__(
+        self,
+        form_uuid: FormUUID,
+        version: int,
+        required_field_uuids: frozenset[FieldUUID],
+        validators: dict[FieldUUID, Validator],
+        visibility: VisibilityRules,
+        file_field_uuids: frozenset[FieldUUID] = frozenset(),
+    ) -> None:
+        self.form_uuid = form_uuid
+        self.version = version
+        self.required_field_uuids = required_field_uuids
+        self.validators = validators
+        self.visibility = visibility
+        # answers of these fields still have to be checked against the blobs
+        self.file_field_uuids = file_field_uuids
+
+    @classmethod
+    def compile(cls, form: Form) -> "SubmissionPlan":
+        return cls(
+            form_uuid=form.uuid,
+            version=form.version,
+            required_field_uuids=form.get_required_field_uuids(),
+            validators=form.get_field_validators(),
+            visibility=VisibilityRules.compile(form),
+            file_field_uuids=frozenset(
+                form_field.uuid
+                for form_field in form.get_ordered_fields()
+                if isinstance(form_field, FileField)
+            ),
+        )
+
+    def validate(self, response: FormResponse) -> None:
+        required_field_uuids = self.required_field_uuids
+        hidden: set[FieldUUID] = set()
+        if self.visibility.has_rules:
+            hidden = self.visibility.get_hidden_fields(response.get_values())
+            required_field_uuids = required_field_uuids - hidden
+        if not response.has_all_required_fields(required_field_uuids):
+            raise exceptions.FormDoesNotHaveAllRequiredFields()
+
+        validators = self.validators
+        for field_response in response.field_responses:
+            validate = validators.get(field_response.field_uuid)
+            if validate is None:
+                raise exceptions.FormDoesNotHaveThisField()
+            if field_response.field_uuid in hidden:
+                raise exceptions.AnswerForHiddenField()
+            if not validate(field_response.value):
+                raise exceptions.InvalidFormSubmission()
+
+
+class SubmissionPlanCache:
+    def __init__(self) -> None:
+        self._plans: dict[FormUUID, SubmissionPlan] = {}
+
+    def get(self, form: Form) -> SubmissionPlan:
+        plan = self._plans.get(form.uuid)
+        if plan is None or plan.version != form.version:
+            plan = SubmissionPlan.compile(form)
+            self._plans[form.uuid] = plan
+        return plan
+
+    def invalidate(self, form_uuid: FormUUID) -> None:
+        self._plans.pop(form_uuid, None)
@@ -1,22 +1,99 @@
+import re
 from dataclasses import dataclass, field
+from typing import Any
 from uuid import uuid4, UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldUUID:
     value: UUID = field(default_factory=uuid4)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FormUUID:
     value: UUID = field(default_factory=uuid4)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldResponseUUID:
     value: UUID = field(default_factory=uuid4)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FormResponseUUID:
     value: UUID = field(default_factory=uuid4)
+
+
+@dataclass(frozen=True, slots=True)
+class FieldEquals:
+    field_uuid: FieldUUID
+    value: Any
+
+    def get_field_uuids(self) -> frozenset[FieldUUID]:
+        return frozenset((self.field_uuid,))
+
+
+@dataclass(frozen=True, slots=True)
+class AllOf:
+    conditions: tuple["Condition", ...]
+
+    def get_field_uuids(self) -> frozenset[FieldUUID]:
+        return frozenset().union(*(c.get_field_uuids() for c in self.conditions))
+
+
+@dataclass(frozen=True, slots=True)
+class AnyOf:
+    conditions: tuple["Condition", ...]
+
+    def get_field_uuids(self) -> frozenset[FieldUUID]:
+        return frozenset().union(*(c.get_field_uuids() for c in self.conditions))
+
+
+Condition = FieldEquals | AllOf | AnyOf
+
+
+_SHA256 = re.compile(r"[0-9a-f]{64}")
+
+
+# Points to the content of an uploaded file, which is stored as a blob. The
+# answer of a file field is the reference in its JSON-compatible form.
+@dataclass(frozen=True, slots=True)
+class BlobReference:
+    sha256: str
+    size: int
+    media_type: str
+
+    def to_value(self) -> dict[str, Any]:
+        return {"sha256": self.sha256, "size": self.size, "media_type": self.media_type}
+
+    @classmethod
+    def from_value(cls, value: Any) -> "BlobReference | None":
+        if not isinstance(value, dict) or value.keys() != {
+            "sha256",
+            "size",
+            "media_type",
+        }:
+            return None
+        sha256, size, media_type = value["sha256"], value["size"], value["media_type"]
+        if (
+            not isinstance(sha256, str)
+            or not _SHA256.fullmatch(sha256)
+            or type(size) is not int
+            or size < 0
+            or not isinstance(media_type, str)
+        ):
+            return None
+        return cls(sha256, size, media_type)
+
+
+@dataclass(frozen=True, slots=True)
+class FileLimits:
+    max_size: int
+    # no media types means files of any type are accepted
+    media_types: frozenset[str] = frozenset()
+
+    def allows_size(self, size: int) -> bool:
+        return size <= self.max_size
+
+    def allows_media_type(self, media_type: str) -> bool:
+        return not self.media_types or media_type in self.media_types
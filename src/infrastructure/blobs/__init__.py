@@ -0,0 +1,5 @@
+from .local import LocalBlobStore
+
+__all__ = [
+    "LocalBlobStore",
+]
@@ -0,0 +1,118 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections.abc import AsyncIterable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from core.domain import exceptions
+from core.domain.files import SNIFF_SIZE, sniff_media_type
+from core.domain.repositories import IBlobStore
+from core.domain.value_objects import BlobReference, FileLimits
+
+T = TypeVar("T")
+
+
+# Stores blobs as files named by their SHA-256 under `directory`, so the same
+# content is only kept once. Uploads stream into a temporary file one chunk
+# at a time; hashing, sniffing and file I/O run in worker threads.
+class LocalBlobStore(IBlobStore):
+    def __init__(self, directory: str, max_workers: int = 4) -> None:
+        self._directory = Path(directory)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="blobs"
+        )
+
+    def get_path(self, reference: BlobReference) -> Path:
+        return self._get_path(reference.sha256)
+
+    def _get_path(self, sha256: str) -> Path:
+        return self._directory / sha256[:2] / sha256
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    async def save(
+        self, chunks: AsyncIterable[bytes], limits: FileLimits
+    ) -> BlobReference:
+        upload = await self._run(_Upload, self._directory / "uploads")
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                if not limits.allows_size(upload.size + len(chunk)):
+                    raise exceptions.FileTooLarge()
+                is_sniffed = upload.media_type is not None
+                await self._run(upload.write, chunk)
+                if not is_sniffed and upload.media_type is not None:
+                    _check_media_type(upload.media_type, limits)
+            await self._run(upload.finish)
+            _check_media_type(upload.media_type, limits)
+            reference = BlobReference(upload.sha256, upload.size, upload.media_type)
+            await self._run(upload.move_to, self.get_path(reference))
+        except BaseException:
+            await self._run(upload.discard)
+            raise
+        return reference
+
+    async def get(self, sha256: str) -> BlobReference | None:
+        return await self._run(_read_reference, sha256, self._get_path(sha256))
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+
+def _read_reference(sha256: str, path: Path) -> BlobReference | None:
+    # the stored head is sniffed again, it is the same head the upload sniffed
+    try:
+        with path.open("rb") as file:
+            head = file.read(SNIFF_SIZE)
+            size = os.fstat(file.fileno()).st_size
+    except FileNotFoundError:
+        return None
+    return BlobReference(sha256, size, sniff_media_type(head))
+
+
+def _check_media_type(media_type: str, limits: FileLimits) -> None:
+    if not limits.allows_media_type(media_type):
+        raise exceptions.FileTypeNotAllowed()
+
+
+class _Upload:
+    def __init__(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self._file = tempfile.NamedTemporaryFile(dir=directory, delete=False)
+        self._hash = hashlib.sha256()
+        self._head = b""
+        self.size = 0
+        self.sha256 = ""
+        self.media_type: str | None = None
+
+    def write(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+        if self.media_type is None:
+            self._head += chunk[: SNIFF_SIZE - len(self._head)]
+            if len(self._head) == SNIFF_SIZE:
+                self.media_type = sniff_media_type(self._head)
+
+    def finish(self) -> None:
+        if self.media_type is None:
+            self.media_type = sniff_media_type(self._head)
+        self.sha256 = self._hash.hexdigest()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def move_to(self, path: Path) -> None:
+        # identical content may already be stored, it is simply replaced
+        path.parent.mkdir(exist_ok=True)
+        os.replace(self._file.name, path)
+
+    def discard(self) -> None:
+        self._file.close()
+        Path(self._file.name).unlink(missing_ok=True)
@@ -1,3 +1,15 @@
+from .in_memory import InMemoryRepository
+from .instrumented import InstrumentedRepository
 from .mocked import MockedRepository
+from .notifying import NotifyingRepository
+from .sqlite import SqliteRepository
+from .thread_pool import ThreadPoolRepository
 
-__all__ = ["MockedRepository"]
+__all__ = [
+    "InMemoryRepository",
+    "InstrumentedRepository",
+    "MockedRepository",
+    "NotifyingRepository",
+    "SqliteRepository",
+    "ThreadPoolRepository",
+]
@@ -0,0 +1,151 @@
+import json
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterator
+from typing import Any
+from uuid import UUID
+
+from core.domain.entities import Form, FormResponse
+from core.domain.repositories import IRepository
+from core.domain.value_objects import FieldUUID, FormUUID, FormResponseUUID
+
+ValueKey = tuple[FormUUID, FieldUUID, str]
+
+
+# Safe to call from several threads: every method holds one lock, as saves
+# update several structures and reads walk them.
+class InMemoryRepository(IRepository):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._forms: dict[FormUUID, Form] = {}
+        # form uuids kept sorted, so a page is found by bisection
+        self._form_order: list[UUID] = []
+        self._form_responses: dict[FormResponseUUID, FormResponse] = {}
+        # secondary index: form -> its responses, in insertion order
+        self._responses_by_form: dict[
+            FormUUID, dict[FormResponseUUID, FormResponse]
+        ] = {}
+        # value index: (form, field, JSON of the answer) -> sorted sequence
+        # numbers of the responses giving that answer. A response keeps the
+        # number of its first save, which is the paging order. The keys each
+        # response was indexed under are kept, saved responses may be mutated.
+        self._sequences: dict[FormResponseUUID, int] = {}
+        self._responses_by_sequence: list[FormResponse] = []
+        self._value_keys_by_sequence: list[list[ValueKey]] = []
+        self._value_index: dict[ValueKey, list[int]] = {}
+
+    def get_all_forms(self) -> set[Form]:
+        with self._lock:
+            return set(self._forms.values())
+
+    def get_forms_page(self, after: FormUUID | None, limit: int) -> list[Form]:
+        with self._lock:
+            start = 0 if after is None else bisect_right(self._form_order, after.value)
+            return [
+                self._forms[FormUUID(uuid)]
+                for uuid in self._form_order[start : start + limit]
+            ]
+
+    def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
+        with self._lock:
+            return self._forms.get(form_uuid)
+
+    def get_form_response_by_uuid(
+        self, form_uuid: FormResponseUUID
+    ) -> FormResponse | None:
+        with self._lock:
+            return self._form_responses.get(form_uuid)
+
+    def get_responses_for_form(self, form_uuid: FormUUID) -> Iterator[FormResponse]:
+        with self._lock:
+            return iter(list(self._responses_by_form.get(form_uuid, {}).values()))
+
+    def get_responses_by_value(
+        self,
+        form_uuid: FormUUID,
+        field_uuid: FieldUUID,
+        value: Any,
+        after: FormResponseUUID | None,
+        limit: int,
+    ) -> list[FormResponse]:
+        with self._lock:
+            sequences = self._value_index.get(
+                (form_uuid, field_uuid, json.dumps(value))
+            )
+            if not sequences:
+                return []
+            start = 0
+            if after is not None:
+                if after not in self._sequences:
+                    return []
+                start = bisect_right(sequences, self._sequences[after])
+            return [
+                self._responses_by_sequence[sequence]
+                for sequence in sequences[start : start + limit]
+            ]
+
+    def get_saved_response_uuids(
+        self, uuids: list[FormResponseUUID]
+    ) -> set[FormResponseUUID]:
+        with self._lock:
+            return {uuid for uuid in uuids if uuid in self._form_responses}
+
+    def save_form_response(self, form_response: FormResponse) -> None:
+        with self._lock:
+            self._save_form_response(form_response)
+
+    def save_form_responses(self, form_responses: list[FormResponse]) -> None:
+        with self._lock:
+            for form_response in form_responses:
+                self._save_form_response(form_response)
+
+    def _save_form_response(self, form_response: FormResponse) -> None:
+        previous = self._form_responses.get(form_response.uuid)
+        if previous is not None and previous.form_uuid != form_response.form_uuid:
+            self._responses_by_form[previous.form_uuid].pop(previous.uuid, None)
+        self._form_responses[form_response.uuid] = form_response
+        self._responses_by_form.setdefault(form_response.form_uuid, {})[
+            form_response.uuid
+        ] = form_response
+
+        sequence = self._sequences.get(form_response.uuid)
+        if sequence is None:
+            sequence = len(self._responses_by_sequence)
+            self._sequences[form_response.uuid] = sequence
+            self._responses_by_sequence.append(form_response)
+            self._value_keys_by_sequence.append([])
+        else:
+            self._unindex_values(sequence)
+            self._responses_by_sequence[sequence] = form_response
+        self._index_values(form_response, sequence)
+
+    def _index_values(self, form_response: FormResponse, sequence: int) -> None:
+        keys = [
+            (
+                form_response.form_uuid,
+                field_response.field_uuid,
+                json.dumps(field_response.value),
+            )
+            for field_response in form_response.field_responses
+        ]
+        for key in keys:
+            sequences = self._value_index.setdefault(key, [])
+            if not sequences or sequences[-1] < sequence:
+                sequences.append(sequence)
+            else:
+                insort(sequences, sequence)
+        self._value_keys_by_sequence[sequence] = keys
+
+    def _unindex_values(self, sequence: int) -> None:
+        for key in self._value_keys_by_sequence[sequence]:
+            sequences = self._value_index[key]
+            del sequences[bisect_left(sequences, sequence)]
+
+    def save_form(self, form: Form) -> None:
+        with self._lock:
+            previous = self._forms.get(form.uuid)
+            if previous is None:
+                insort(self._form_order, form.uuid.value)
+            else:
+                form.version = max(previous.version + 1, form.version)
+            self._forms[form.uuid] = form
@@ -0,0 +1,122 @@
+from collections.abc import AsyncIterator, Awaitable
+from time import perf_counter
+from typing import Any, TypeVar
+
+from core.application.metrics import REGISTRY, Counter, HistogramFamily
+from core.domain.entities import Form, FormResponse
+from core.domain.repositories import IAsyncRepository
+from core.domain.value_objects import FieldUUID, FormUUID, FormResponseUUID
+
+T = TypeVar("T")
+
+REPOSITORY_SECONDS = REGISTRY.register(
+    HistogramFamily(
+        "custom_forms_repository_seconds",
+        "Time repository calls take, including the wait for a worker thread.",
+        ("method",),
+    )
+)
+REPOSITORY_ERRORS = REGISTRY.register(
+    Counter(
+        "custom_forms_repository_errors",
+        "Repository calls that raised.",
+        ("method", "error"),
+    )
+)
+
+
+# Records how long every call of the wrapped repository takes
+class InstrumentedRepository(IAsyncRepository):
+    def __init__(self, repository: IAsyncRepository) -> None:
+        self._repository = repository
+
+    async def _timed(self, method: str, call: Awaitable[T]) -> T:
+        started = perf_counter()
+        try:
+            return await call
+        except Exception as error:
+            REPOSITORY_ERRORS.inc((method, type(error).__name__))
+            raise
+        finally:
+            REPOSITORY_SECONDS.labels(method).observe(perf_counter() - started)
+
+    async def get_all_forms(self) -> set[Form]:
+        return await self._timed("get_all_forms", self._repository.get_all_forms())
+
+    async def get_forms_page(self, after: FormUUID | None, limit: int) -> list[Form]:
+        return await self._timed(
+            "get_forms_page", self._repository.get_forms_page(after, limit)
+        )
+
+    async def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
+        return await self._timed(
+            "get_form_by_uuid", self._repository.get_form_by_uuid(form_uuid)
+        )
+
+    async def get_form_response_by_uuid(
+        self, form_uuid: FormResponseUUID
+    ) -> FormResponse | None:
+        return await self._timed(
+            "get_form_response_by_uuid",
+            self._repository.get_form_response_by_uuid(form_uuid),
+        )
+
+    async def get_responses_for_form(
+        self, form_uuid: FormUUID
+    ) -> AsyncIterator[FormResponse]:
+        # only the time spent waiting for the next response is counted, not
+        # the time the caller takes between responses
+        responses = aiter(self._repository.get_responses_for_form(form_uuid))
+        elapsed = 0.0
+        try:
+            while True:
+                started = perf_counter()
+                try:
+                    response = await anext(responses)
+                except StopAsyncIteration:
+                    break
+                finally:
+                    elapsed += perf_counter() - started
+                yield response
+        finally:
+            REPOSITORY_SECONDS.labels("get_responses_for_form").observe(elapsed)
+
+    async def get_responses_by_value(
+        self,
+        form_uuid: FormUUID,
+        field_uuid: FieldUUID,
+        value: Any,
+        after: FormResponseUUID | None,
+        limit: int,
+    ) -> list[FormResponse]:
+        return await self._timed(
+            "get_responses_by_value",
+            self._repository.get_responses_by_value(
+                form_uuid, field_uuid, value, after, limit
+            ),
+        )
+
+    async def get_saved_response_uuids(
+        self, uuids: list[FormResponseUUID]
+    ) -> set[FormResponseUUID]:
+        return await self._timed(
+            "get_saved_response_uuids",
+            self._repository.get_saved_response_uuids(uuids),
+        )
+
+    async def save_form_response(self, form_response: FormResponse) -> None:
+        await self._timed(
+            "save_form_response", self._repository.save_form_response(form_response)
+        )
+
+    async def save_form_responses(self, form_responses: list[FormResponse]) -> None:
+        await self._timed(
+            "save_form_responses",
+            self._repository.save_form_responses(form_responses),
+        )
+
+    async def save_form(self, form: Form) -> None:
+        await self._timed("save_form", self._repository.save_form(form))
+
+    async def close(self) -> None:
+        await self._repository.close()
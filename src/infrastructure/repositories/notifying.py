@@ -0,0 +1,63 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from core.domain.entities import Form, FormResponse
+from core.domain.repositories import IRepository
+from core.domain.value_objects import FieldUUID, FormUUID, FormResponseUUID
+
+
+# Calls `on_form_saved` after every form saved through the wrapped repository,
+# e.g. to drop cached copies of it
+class NotifyingRepository(IRepository):
+    def __init__(
+        self, repository: IRepository, on_form_saved: Callable[[Form], None]
+    ) -> None:
+        self._repository = repository
+        self._on_form_saved = on_form_saved
+
+    def get_all_forms(self) -> set[Form]:
+        return self._repository.get_all_forms()
+
+    def get_forms_page(self, after: FormUUID | None, limit: int) -> list[Form]:
+        return self._repository.get_forms_page(after, limit)
+
+    def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
+        return self._repository.get_form_by_uuid(form_uuid)
+
+    def get_form_response_by_uuid(
+        self, form_uuid: FormResponseUUID
+    ) -> FormResponse | None:
+        return self._repository.get_form_response_by_uuid(form_uuid)
+
+    def get_responses_for_form(self, form_uuid: FormUUID) -> Iterator[FormResponse]:
+        return self._repository.get_responses_for_form(form_uuid)
+
+    def get_responses_by_value(
+        self,
+        form_uuid: FormUUID,
+        field_uuid: FieldUUID,
+        value: Any,
+        after: FormResponseUUID | None,
+        limit: int,
+    ) -> list[FormResponse]:
+        return self._repository.get_responses_by_value(
+            form_uuid, field_uuid, value, after, limit
+        )
+
+    def get_saved_response_uuids(
+        self, uuids: list[FormResponseUUID]
+    ) -> set[FormResponseUUID]:
+        return self._repository.get_saved_response_uuids(uuids)
+
+    def save_form_response(self, form_response: FormResponse) -> None:
+        self._repository.save_form_response(form_response)
+
+    def save_form_responses(self, form_responses: list[FormResponse]) -> None:
+        self._repository.save_form_responses(form_responses)
+
+    def save_form(self, form: Form) -> None:
+        self._repository.save_form(form)
+        self._on_form_saved(form)
+
+    def close(self) -> None:
+        self._repository.close()
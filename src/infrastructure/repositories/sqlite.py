@@ -0,0 +1,340 @@
+import json
+from collections.abc import Iterable, Iterator
+from itertools import groupby
+from typing import Any
+from uuid import UUID
+
+from core.domain.entities import FieldResponse, Form, FormResponse
+from core.domain.entities.field import Field, FieldType
+from core.domain.repositories import IRepository
+from core.domain.value_objects import (
+    AllOf,
+    AnyOf,
+    Condition,
+    FieldEquals,
+    FieldResponseUUID,
+    FieldUUID,
+    FormResponseUUID,
+    FormUUID,
+)
+from infrastructure.sqlite import ConnectionPool, migrate
+
+_SELECT_ALL_FORMS = "SELECT uuid, title, version FROM forms"
+_SELECT_ALL_FIELDS = (
+    "SELECT form_uuid, uuid, type, is_required, condition, settings FROM fields "
+    "ORDER BY form_uuid, position"
+)
+_SELECT_FORMS_PAGE = (
+    "SELECT uuid, title, version FROM forms WHERE uuid > ? ORDER BY uuid LIMIT ?"
+)
+_SELECT_FORMS_PAGE_FIELDS = (
+    "SELECT form_uuid, uuid, type, is_required, condition, settings FROM fields "
+    "WHERE form_uuid IN (SELECT uuid FROM forms WHERE uuid > ? ORDER BY uuid LIMIT ?) "
+    "ORDER BY form_uuid, position"
+)
+_SELECT_FORM = "SELECT uuid, title, version FROM forms WHERE uuid = ?"
+_SELECT_FORM_FIELDS = (
+    "SELECT form_uuid, uuid, type, is_required, condition, settings FROM fields "
+    "WHERE form_uuid = ? ORDER BY position"
+)
+_UPSERT_FORM = (
+    "INSERT INTO forms (uuid, title, version) VALUES (?, ?, ?) "
+    "ON CONFLICT (uuid) DO UPDATE SET title = excluded.title, "
+    "version = MAX(forms.version + 1, excluded.version) "
+    "RETURNING version"
+)
+_DELETE_FORM_FIELDS = "DELETE FROM fields WHERE form_uuid = ?"
+_INSERT_FIELD = (
+    "INSERT INTO fields "
+    "(uuid, form_uuid, position, type, is_required, condition, settings) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT_FORM_RESPONSE = "SELECT id, form_uuid FROM form_responses WHERE uuid = ?"
+_SELECT_FIELD_RESPONSES = (
+    "SELECT uuid, field_uuid, value FROM field_responses WHERE form_response_id = ?"
+)
+# one keyset page of a form's responses with all of their answers
+_SELECT_RESPONSES_FOR_FORM = (
+    "SELECT r.id, r.uuid, f.uuid, f.field_uuid, f.value "
+    "FROM (SELECT id, uuid FROM form_responses "
+    "WHERE form_uuid = ? AND id > ? ORDER BY id LIMIT ?) AS r "
+    "LEFT JOIN field_responses AS f ON f.form_response_id = r.id "
+    "ORDER BY r.id"
+)
+# field uuids belong to a single form, the join only guards against rows of
+# responses that were moved to another form
+_SELECT_RESPONSES_BY_VALUE = (
+    "SELECT r.id, r.uuid FROM field_responses AS v "
+    "JOIN form_responses AS r ON r.id = v.form_response_id "
+    "WHERE v.field_uuid = ? AND v.value = ? AND v.form_response_id > ? "
+    "AND r.form_uuid = ? ORDER BY v.form_response_id LIMIT ?"
+)
+_SELECT_SAVED_RESPONSE_UUIDS = "SELECT uuid FROM form_responses WHERE uuid IN ({})"
+# stays below SQLite's smallest default limit of bound parameters
+_MAX_PARAMETERS = 500
+_SELECT_RESPONSE_ID = "SELECT id FROM form_responses WHERE uuid = ?"
+_UPSERT_FORM_RESPONSE = (
+    "INSERT INTO form_responses (uuid, form_uuid) VALUES (?, ?) "
+    "ON CONFLICT (uuid) DO UPDATE SET form_uuid = excluded.form_uuid "
+    "RETURNING id"
+)
+_DELETE_FIELD_RESPONSES = "DELETE FROM field_responses WHERE form_response_id = ?"
+_INSERT_FIELD_RESPONSE = (
+    "INSERT INTO field_responses (form_response_id, field_uuid, uuid, value) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+
+class SqliteRepository(IRepository):
+    def __init__(self, path: str, pool_size: int = 4, page_size: int = 500) -> None:
+        self._pool = ConnectionPool(path, size=pool_size)
+        self._page_size = page_size
+        with self._pool.connection() as connection:
+            migrate(connection)
+
+    def get_all_forms(self) -> set[Form]:
+        with self._pool.connection() as connection:
+            form_rows = connection.execute(_SELECT_ALL_FORMS).fetchall()
+            field_rows = connection.execute(_SELECT_ALL_FIELDS).fetchall()
+        fields_by_form = {
+            form_uuid: list(rows)
+            for form_uuid, rows in groupby(field_rows, key=lambda row: row[0])
+        }
+        return {_to_form(row, fields_by_form.get(row[0], ())) for row in form_rows}
+
+    def get_forms_page(self, after: FormUUID | None, limit: int) -> list[Form]:
+        # an empty blob sorts before every uuid, so it starts at the first page
+        parameters = (b"" if after is None else after.value.bytes, limit)
+        with self._pool.connection() as connection:
+            form_rows = connection.execute(_SELECT_FORMS_PAGE, parameters).fetchall()
+            field_rows = connection.execute(
+                _SELECT_FORMS_PAGE_FIELDS, parameters
+            ).fetchall()
+        fields_by_form = {
+            form_uuid: list(rows)
+            for form_uuid, rows in groupby(field_rows, key=lambda row: row[0])
+        }
+        return [_to_form(row, fields_by_form.get(row[0], ())) for row in form_rows]
+
+    def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
+        key = form_uuid.value.bytes
+        with self._pool.connection() as connection:
+            form_row = connection.execute(_SELECT_FORM, (key,)).fetchone()
+            if form_row is None:
+                return None
+            field_rows = connection.execute(_SELECT_FORM_FIELDS, (key,)).fetchall()
+        return _to_form(form_row, field_rows)
+
+    def get_form_response_by_uuid(
+        self, form_uuid: FormResponseUUID
+    ) -> FormResponse | None:
+        with self._pool.connection() as connection:
+            row = connection.execute(
+                _SELECT_FORM_RESPONSE, (form_uuid.value.bytes,)
+            ).fetchone()
+            if row is None:
+                return None
+            response_id, for_form_uuid = row
+            field_rows = connection.execute(
+                _SELECT_FIELD_RESPONSES, (response_id,)
+            ).fetchall()
+        return FormResponse(
+            uuid=form_uuid,
+            form_uuid=FormUUID(UUID(bytes=for_form_uuid)),
+            field_responses=[_to_field_response(*row) for row in field_rows],
+        )
+
+    def get_responses_for_form(self, form_uuid: FormUUID) -> Iterator[FormResponse]:
+        # Read in keyset pages, a connection is only checked out while one
+        # page is fetched and never while the caller, e.g. a slow download,
+        # consumes it. Responses saved meanwhile show up in a later page.
+        key = form_uuid.value.bytes
+        after_id = 0
+        while True:
+            with self._pool.connection() as connection:
+                rows = connection.execute(
+                    _SELECT_RESPONSES_FOR_FORM, (key, after_id, self._page_size)
+                ).fetchall()
+            count = 0
+            for response_id, response_rows in groupby(rows, key=lambda row: row[0]):
+                count += 1
+                response_rows = list(response_rows)
+                yield FormResponse(
+                    uuid=FormResponseUUID(UUID(bytes=response_rows[0][1])),
+                    form_uuid=form_uuid,
+                    field_responses=[
+                        _to_field_response(uuid, field_uuid, value)
+                        for _, _, uuid, field_uuid, value in response_rows
+                        if uuid is not None
+                    ],
+                )
+            if count < self._page_size:
+                return
+            after_id = response_id
+
+    def get_responses_by_value(
+        self,
+        form_uuid: FormUUID,
+        field_uuid: FieldUUID,
+        value: Any,
+        after: FormResponseUUID | None,
+        limit: int,
+    ) -> list[FormResponse]:
+        with self._pool.connection() as connection:
+            after_id = 0
+            if after is not None:
+                row = connection.execute(
+                    _SELECT_RESPONSE_ID, (after.value.bytes,)
+                ).fetchone()
+                if row is None:
+                    return []
+                (after_id,) = row
+            response_rows = connection.execute(
+                _SELECT_RESPONSES_BY_VALUE,
+                (
+                    field_uuid.value.bytes,
+                    json.dumps(value),
+                    after_id,
+                    form_uuid.value.bytes,
+                    limit,
+                ),
+            ).fetchall()
+            return [
+                FormResponse(
+                    uuid=FormResponseUUID(UUID(bytes=uuid)),
+                    form_uuid=form_uuid,
+                    field_responses=[
+                        _to_field_response(*row)
+                        for row in connection.execute(
+                            _SELECT_FIELD_RESPONSES, (response_id,)
+                        )
+                    ],
+                )
+                for response_id, uuid in response_rows
+            ]
+
+    def get_saved_response_uuids(
+        self, uuids: list[FormResponseUUID]
+    ) -> set[FormResponseUUID]:
+        saved = set()
+        with self._pool.connection() as connection:
+            for start in range(0, len(uuids), _MAX_PARAMETERS):
+                keys = [
+                    uuid.value.bytes for uuid in uuids[start : start + _MAX_PARAMETERS]
+                ]
+                rows = connection.execute(
+                    _SELECT_SAVED_RESPONSE_UUIDS.format(", ".join("?" * len(keys))),
+                    keys,
+                )
+                saved.update(FormResponseUUID(UUID(bytes=uuid)) for (uuid,) in rows)
+        return saved
+
+    def save_form_response(self, form_response: FormResponse) -> None:
+        self.save_form_responses([form_response])
+
+    def save_form_responses(self, form_responses: list[FormResponse]) -> None:
+        with self._pool.connection() as connection, connection:
+            field_rows = []
+            for form_response in form_responses:
+                (response_id,) = connection.execute(
+                    _UPSERT_FORM_RESPONSE,
+                    (
+                        form_response.uuid.value.bytes,
+                        form_response.form_uuid.value.bytes,
+                    ),
+                ).fetchone()
+                connection.execute(_DELETE_FIELD_RESPONSES, (response_id,))
+                field_rows.extend(
+                    (
+                        response_id,
+                        field_response.field_uuid.value.bytes,
+                        field_response.uuid.value.bytes,
+                        json.dumps(field_response.value),
+                    )
+                    for field_response in form_response.field_responses
+                )
+            connection.executemany(_INSERT_FIELD_RESPONSE, field_rows)
+
+    def save_form(self, form: Form) -> None:
+        key = form.uuid.value.bytes
+        with self._pool.connection() as connection, connection:
+            (form.version,) = connection.execute(
+                _UPSERT_FORM, (key, form.title, form.version)
+            ).fetchone()
+            connection.execute(_DELETE_FORM_FIELDS, (key,))
+            connection.executemany(
+                _INSERT_FIELD,
+                (
+                    (
+                        form_field.uuid.value.bytes,
+                        key,
+                        position,
+                        form_field.type.value,
+                        form_field.is_required,
+                        _dump_condition(form_field.condition),
+                        json.dumps(form_field.settings)
+                        if form_field.settings
+                        else None,
+                    )
+                    for position, form_field in enumerate(form.get_ordered_fields())
+                ),
+            )
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+def _to_form(form_row: tuple[Any, ...], field_rows: Iterable[tuple[Any, ...]]) -> Form:
+    uuid, title, version = form_row
+    form = Form(uuid=FormUUID(UUID(bytes=uuid)), title=title)
+    form_fields = []
+    for _, field_uuid, field_type, is_required, condition, settings in field_rows:
+        field_class = Field.for_type(FieldType(field_type))
+        form_field = field_class(
+            uuid=FieldUUID(UUID(bytes=field_uuid)), type=field_class.type
+        )
+        if is_required:
+            form_field.mark_required()
+        form_field.set_condition(_load_condition(condition))
+        if settings is not None:
+            form_field.configure(json.loads(settings))
+        form_fields.append(form_field)
+    # all at once, a condition may read fields stored after its own
+    form.add_fields(form_fields)
+    form.version = version
+    return form
+
+
+def _to_field_response(uuid: bytes, field_uuid: bytes, value: str) -> FieldResponse:
+    return FieldResponse(
+        uuid=FieldResponseUUID(UUID(bytes=uuid)),
+        value=json.loads(value),
+        field_uuid=FieldUUID(UUID(bytes=field_uuid)),
+    )
+
+
+def _dump_condition(condition: Condition | None) -> str | None:
+    if condition is None:
+        return None
+    return json.dumps(_condition_to_dict(condition))
+
+
+def _condition_to_dict(condition: Condition) -> dict[str, Any]:
+    if isinstance(condition, FieldEquals):
+        return {"field": condition.field_uuid.value.hex, "equals": condition.value}
+    key = "all" if isinstance(condition, AllOf) else "any"
+    return {key: [_condition_to_dict(c) for c in condition.conditions]}
+
+
+def _load_condition(condition: str | None) -> Condition | None:
+    if condition is None:
+        return None
+    return _condition_from_dict(json.loads(condition))
+
+
+def _condition_from_dict(condition: dict[str, Any]) -> Condition:
+    if "field" in condition:
+        return FieldEquals(FieldUUID(UUID(condition["field"])), condition["equals"])
+    if "all" in condition:
+        return AllOf(tuple(_condition_from_dict(c) for c in condition["all"]))
+    return AnyOf(tuple(_condition_from_dict(c) for c in condition["any"]))
@@ -0,0 +1,95 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, TypeVar
+
+from core.domain.entities import Form, FormResponse
+from core.domain.repositories import IAsyncRepository, IRepository
+from core.domain.value_objects import FieldUUID, FormUUID, FormResponseUUID
+
+T = TypeVar("T")
+
+
+# Runs a blocking IRepository in a bounded pool of worker threads, which
+# has to be safe to call from several of them at once
+class ThreadPoolRepository(IAsyncRepository):
+    def __init__(
+        self,
+        repository: IRepository,
+        executor: ThreadPoolExecutor | None = None,
+        max_workers: int = 8,
+        batch_size: int = 500,
+    ) -> None:
+        self._repository = repository
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="repository"
+        )
+        self._batch_size = batch_size
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    async def get_all_forms(self) -> set[Form]:
+        return await self._run(self._repository.get_all_forms)
+
+    async def get_forms_page(self, after: FormUUID | None, limit: int) -> list[Form]:
+        return await self._run(self._repository.get_forms_page, after, limit)
+
+    async def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
+        return await self._run(self._repository.get_form_by_uuid, form_uuid)
+
+    async def get_form_response_by_uuid(
+        self, form_uuid: FormResponseUUID
+    ) -> FormResponse | None:
+        return await self._run(self._repository.get_form_response_by_uuid, form_uuid)
+
+    async def get_responses_for_form(
+        self, form_uuid: FormUUID
+    ) -> AsyncIterator[FormResponse]:
+        responses = await self._run(self._repository.get_responses_for_form, form_uuid)
+        while batch := await self._run(_take, responses, self._batch_size):
+            for response in batch:
+                yield response
+
+    async def get_responses_by_value(
+        self,
+        form_uuid: FormUUID,
+        field_uuid: FieldUUID,
+        value: Any,
+        after: FormResponseUUID | None,
+        limit: int,
+    ) -> list[FormResponse]:
+        return await self._run(
+            self._repository.get_responses_by_value,
+            form_uuid,
+            field_uuid,
+            value,
+            after,
+            limit,
+        )
+
+    async def get_saved_response_uuids(
+        self, uuids: list[FormResponseUUID]
+    ) -> set[FormResponseUUID]:
+        return await self._run(self._repository.get_saved_response_uuids, uuids)
+
+    async def save_form_response(self, form_response: FormResponse) -> None:
+        await self._run(self._repository.save_form_response, form_response)
+
+    async def save_form_responses(self, form_responses: list[FormResponse]) -> None:
+        await self._run(self._repository.save_form_responses, form_responses)
+
+    async def save_form(self, form: Form) -> None:
+        await self._run(self._repository.save_form, form)
+
+    async def close(self) -> None:
+        await self._run(self._repository.close)
+        if self._owns_executor:
+            await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+
+def _take(iterator: Iterator[T], count: int) -> list[T]:
+    return list(islice(iterator, count))
@@ -0,0 +1,4 @@
+from .migrations import migrate
+from .pool import ConnectionPool
+
+__all__ = ["ConnectionPool", "migrate"]
@@ -0,0 +1,66 @@
+import sqlite3
+
+# Each entry upgrades the schema by one version, tracked in PRAGMA user_version.
+# Only ever append to this list.
+MIGRATIONS: list[tuple[str, ...]] = [
+    (
+        """
+        CREATE TABLE forms (
+            uuid BLOB PRIMARY KEY,
+            title TEXT NOT NULL,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE fields (
+            uuid BLOB PRIMARY KEY,
+            form_uuid BLOB NOT NULL REFERENCES forms (uuid) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            is_required INTEGER NOT NULL
+        )
+        """,
+        "CREATE INDEX fields_form_uuid ON fields (form_uuid, position)",
+        """
+        CREATE TABLE form_responses (
+            id INTEGER PRIMARY KEY,
+            uuid BLOB NOT NULL UNIQUE,
+            form_uuid BLOB NOT NULL
+        )
+        """,
+        "CREATE INDEX form_responses_form_uuid ON form_responses (form_uuid, id)",
+        """
+        CREATE TABLE field_responses (
+            form_response_id INTEGER NOT NULL
+                REFERENCES form_responses (id) ON DELETE CASCADE,
+            field_uuid BLOB NOT NULL,
+            uuid BLOB NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (form_response_id, field_uuid)
+        ) WITHOUT ROWID
+        """,
+    ),
+    ("ALTER TABLE fields ADD COLUMN condition TEXT",),
+    (
+        "CREATE INDEX field_responses_value "
+        "ON field_responses (field_uuid, value, form_response_id)",
+    ),
+    ("ALTER TABLE fields ADD COLUMN settings TEXT",),
+]
+
+
+def migrate(connection: sqlite3.Connection) -> int:
+    # the version is read inside the write lock so concurrent processes
+    # starting against the same file apply each migration only once
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        (current,) = connection.execute("PRAGMA user_version").fetchone()
+        for version, statements in enumerate(MIGRATIONS[current:], start=current + 1):
+            for statement in statements:
+                connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {version}")
+    except BaseException:
+        connection.rollback()
+        raise
+    connection.commit()
+    return len(MIGRATIONS)
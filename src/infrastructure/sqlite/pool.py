@@ -0,0 +1,43 @@
+import queue
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class ConnectionPool:
+    def __init__(self, path: str, size: int = 4, cached_statements: int = 256) -> None:
+        self._path = path
+        self._cached_statements = cached_statements
+        self._connections: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._all: list[sqlite3.Connection] = []
+        for _ in range(size):
+            connection = self._connect()
+            self._all.append(connection)
+            self._connections.put(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 keeps up to `cached_statements` compiled statements per
+        # connection, so reusing the same SQL strings skips re-preparing them
+        connection = sqlite3.connect(
+            self._path,
+            check_same_thread=False,
+            cached_statements=self._cached_statements,
+        )
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA busy_timeout = 5000")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connections.get()
+        try:
+            yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close(self) -> None:
+        for connection in self._all:
+            connection.close()
+        self._all.clear()
@@ -1,15 +1,83 @@
+from fastapi import Depends, Request
+
 from core.application import handlers
-from core.domain.repositories import IRepository
-from infrastructure.repositories import MockedRepository
+from core.domain.repositories import IAsyncRepository
+from presentation.api.resources import Resources
+
+
+def get_resources(request: Request) -> Resources:
+    return request.app.state.resources
+
+
+def get_repository(resources: Resources = Depends(get_resources)) -> IAsyncRepository:
+    return resources.repository
+
+
+def list_all_forms_query_handler(
+    repository: IAsyncRepository = Depends(get_repository),
+) -> handlers.ListFormsQueryHandler:
+    return handlers.ListFormsQueryHandler(repository=repository)
+
+
+def get_serialized_form_query_handler(
+    resources: Resources = Depends(get_resources),
+) -> handlers.GetSerializedFormQueryHandler:
+    return handlers.GetSerializedFormQueryHandler(
+        repository=resources.repository, cache=resources.form_cache
+    )
+
+
+def get_visibility_change_query_handler(
+    resources: Resources = Depends(get_resources),
+) -> handlers.GetVisibilityChangeQueryHandler:
+    return handlers.GetVisibilityChangeQueryHandler(
+        repository=resources.repository, plans=resources.submission_plans
+    )
+
+
+def get_form_summary_query_handler(
+    resources: Resources = Depends(get_resources),
+) -> handlers.GetFormSummaryQueryHandler:
+    return handlers.GetFormSummaryQueryHandler(
+        repository=resources.repository, summaries=resources.response_summaries
+    )
+
+
+def count_form_responses_query_handler(
+    resources: Resources = Depends(get_resources),
+) -> handlers.CountFormResponsesQueryHandler:
+    return handlers.CountFormResponsesQueryHandler(
+        repository=resources.repository, columns=resources.response_columns
+    )
+
+
+def list_form_responses_query_handler(
+    repository: IAsyncRepository = Depends(get_repository),
+) -> handlers.ListFormResponsesQueryHandler:
+    return handlers.ListFormResponsesQueryHandler(repository=repository)
+
+
+def export_form_responses_query_handler(
+    repository: IAsyncRepository = Depends(get_repository),
+) -> handlers.ExportFormResponsesQueryHandler:
+    return handlers.ExportFormResponsesQueryHandler(repository=repository)
 
 
-def get_repository() -> IRepository:
-    return MockedRepository()
+def submit_form_responses_command_handler(
+    resources: Resources = Depends(get_resources),
+) -> handlers.SubmitFormResponsesCommandHandler:
+    return handlers.SubmitFormResponsesCommandHandler(
+        service=resources.submit_form_service
+    )
 
 
-def list_all_forms_query_handler() -> handlers.ListFormsQueryHandler:
-    return handlers.ListFormsQueryHandler(repository=get_repository())
+def submit_form_command_handler(
+    resources: Resources = Depends(get_resources),
+) -> handlers.SubmitFormCommandHandler:
+    return handlers.SubmitFormCommandHandler(service=resources.submit_form_service)
 
 
-def get_form_query_handler() -> handlers.GetFormQueryHandler:
-    return handlers.GetFormQueryHandler(repository=get_repository())
+def upload_file_command_handler(
+    resources: Resources = Depends(get_resources),
+) -> handlers.UploadFileCommandHandler:
+    return handlers.UploadFileCommandHandler(service=resources.upload_file_service)
@@ -1,32 +1,328 @@
 from presentation.api.forms import controllers
-from core.application import queries, handlers
-from fastapi import APIRouter, Depends, HTTPException, status
+from core.application import commands, queries, handlers
+from core.application.writers import ResponseWriterClosed
+from core.domain import exceptions
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+import json
+import re
+from typing import Any
 from uuid import UUID
 
 router = APIRouter(prefix="/forms", tags=["forms"])
 
+_ETAG = re.compile(r'(?:W/)?"([0-9]+)"')
+_EXPORT_MEDIA_TYPES = {
+    queries.ExportFormResponsesQuery.Format.CSV: "text/csv",
+    queries.ExportFormResponsesQuery.Format.NDJSON: "application/x-ndjson",
+}
 
-@router.get("")
+
+@router.get("", response_model=list[queries.ListAllFormsQuery.ResultDTO])
 async def list_all_forms(
+    request: Request,
+    limit: int = Query(
+        default=queries.FORMS_PAGE_LIMIT, ge=1, le=queries.MAX_FORMS_PAGE_LIMIT
+    ),
+    after: UUID | None = None,
+    fields: list[queries.FormProjection] = Query(default=["uuid", "title"]),
     handler: handlers.ListFormsQueryHandler = Depends(
         controllers.list_all_forms_query_handler
     ),
-) -> list[queries.ListAllFormsQuery.ResultDTO]:
-    query = queries.ListAllFormsQuery()
-
-    return await handler.handle(query)
+) -> Response:
+    query = queries.ListAllFormsQuery(limit=limit, after=after, fields=fields)
+    page = await handler.handle(query)
+    return _to_page_response(request, page.items, page.next_after)
 
 
-@router.get("/{form_uuid}")
+@router.get("/{form_uuid}", response_model=queries.GetFormQuery.ResultDTO)
 async def get_form_by_uuid(
     form_uuid: UUID,
-    handler: handlers.GetFormQueryHandler = Depends(controllers.get_form_query_handler),
-) -> queries.GetFormQuery.ResultDTO:
-    query = queries.GetFormQuery(uuid=form_uuid)
+    if_none_match: str | None = Header(default=None),
+    handler: handlers.GetSerializedFormQueryHandler = Depends(
+        controllers.get_serialized_form_query_handler
+    ),
+) -> Response:
+    query = queries.GetFormQuery(
+        uuid=form_uuid, known_versions=_parse_etags(if_none_match)
+    )
     form = await handler.handle(query)
     if form is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=[{"msg": "The requested form does not exist."}],
         )
-    return form
+    etag = _to_etag(form.version)
+    if isinstance(form, queries.GetFormQuery.NotModifiedDTO):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    # the body is already serialized, FastAPI must not validate it again
+    return Response(
+        content=form.content, media_type="application/json", headers={"ETag": etag}
+    )
+
+
+@router.get("/{form_uuid}/summary")
+async def get_form_summary(
+    form_uuid: UUID,
+    handler: handlers.GetFormSummaryQueryHandler = Depends(
+        controllers.get_form_summary_query_handler
+    ),
+) -> queries.GetFormSummaryQuery.ResultDTO:
+    query = queries.GetFormSummaryQuery(form_uuid=form_uuid)
+    summary = await handler.handle(query)
+    if summary is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=[{"msg": "The requested form does not exist."}],
+        )
+    return summary
+
+
+@router.get(
+    "/{form_uuid}/responses",
+    response_model=list[queries.ListFormResponsesQuery.ResultDTO],
+)
+async def list_form_responses(
+    request: Request,
+    form_uuid: UUID,
+    field: UUID,
+    value: str,
+    limit: int = Query(
+        default=queries.RESPONSES_PAGE_LIMIT,
+        ge=1,
+        le=queries.MAX_RESPONSES_PAGE_LIMIT,
+    ),
+    after: UUID | None = None,
+    handler: handlers.ListFormResponsesQueryHandler = Depends(
+        controllers.list_form_responses_query_handler
+    ),
+) -> Response:
+    query = queries.ListFormResponsesQuery(
+        form_uuid=form_uuid,
+        field_uuid=field,
+        value=_parse_value(value),
+        limit=limit,
+        after=after,
+    )
+    try:
+        page = await handler.handle(query)
+    except exceptions.DomainError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[{"msg": type(error).__name__}],
+        ) from error
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=[{"msg": "The requested form does not exist."}],
+        )
+    return _to_page_response(request, page.items, page.next_after)
+
+
+@router.get("/{form_uuid}/responses/export")
+async def export_form_responses(
+    form_uuid: UUID,
+    format: queries.ExportFormResponsesQuery.Format = (
+        queries.ExportFormResponsesQuery.Format.CSV
+    ),
+    handler: handlers.ExportFormResponsesQueryHandler = Depends(
+        controllers.export_form_responses_query_handler
+    ),
+) -> StreamingResponse:
+    query = queries.ExportFormResponsesQuery(form_uuid=form_uuid, format=format)
+    chunks = await handler.handle(query)
+    if chunks is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=[{"msg": "The requested form does not exist."}],
+        )
+    return StreamingResponse(
+        chunks,
+        media_type=_EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{form_uuid}.{format}"'},
+    )
+
+
+@router.post("/{form_uuid}/responses", status_code=status.HTTP_201_CREATED)
+async def submit_form(
+    form_uuid: UUID,
+    response: commands.SubmitFormResponsesCommand.FormResponseDTO,
+    idempotency_key: str | None = Header(default=None, max_length=255),
+    handler: handlers.SubmitFormCommandHandler = Depends(
+        controllers.submit_form_command_handler
+    ),
+) -> commands.SubmitFormCommand.ResultDTO:
+    command = commands.SubmitFormCommand(
+        form_uuid=form_uuid,
+        uuid=response.uuid,
+        idempotency_key=idempotency_key,
+        field_responses=response.field_responses,
+    )
+    try:
+        return await handler.handle(command)
+    except exceptions.NotFound as error:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=[{"msg": "The requested form does not exist."}],
+        ) from error
+    except exceptions.AlreadySubmitted as error:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=[{"msg": type(error).__name__}],
+        ) from error
+    except exceptions.DomainError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[{"msg": type(error).__name__}],
+        ) from error
+    except ResponseWriterClosed as error:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=[{"msg": "The service is shutting down."}],
+        ) from error
+
+
+@router.post(
+    "/{form_uuid}/fields/{field_uuid}/files", status_code=status.HTTP_201_CREATED
+)
+async def upload_file(
+    request: Request,
+    form_uuid: UUID,
+    field_uuid: UUID,
+    handler: handlers.UploadFileCommandHandler = Depends(
+        controllers.upload_file_command_handler
+    ),
+) -> commands.UploadFileCommand.ResultDTO:
+    # the raw request body is streamed to the blob store, never buffered
+    command = commands.UploadFileCommand(
+        form_uuid=form_uuid, field_uuid=field_uuid, content=request.stream()
+    )
+    try:
+        return await handler.handle(command)
+    except exceptions.NotFound as error:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=[{"msg": "The requested form does not exist."}],
+        ) from error
+    except exceptions.FileTooLarge as error:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=[{"msg": type(error).__name__}],
+        ) from error
+    except exceptions.DomainError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[{"msg": type(error).__name__}],
+        ) from error
+
+
+@router.post("/{form_uuid}/responses:batch")
+async def submit_form_responses(
+    form_uuid: UUID,
+    responses: list[commands.SubmitFormResponsesCommand.FormResponseDTO],
+    handler: handlers.SubmitFormResponsesCommandHandler = Depends(
+        controllers.submit_form_responses_command_handler
+    ),
+) -> list[commands.SubmitFormResponsesCommand.ResultDTO]:
+    command = commands.SubmitFormResponsesCommand(
+        form_uuid=form_uuid, responses=responses
+    )
+    return await handler.handle(command)
+
+
+@router.post("/{form_uuid}/responses:count")
+async def count_form_responses(
+    form_uuid: UUID,
+    where: list[queries.CountFormResponsesQuery.ConditionDTO] = Body(
+        default=[], embed=True
+    ),
+    handler: handlers.CountFormResponsesQueryHandler = Depends(
+        controllers.count_form_responses_query_handler
+    ),
+) -> queries.CountFormResponsesQuery.ResultDTO:
+    query = queries.CountFormResponsesQuery(form_uuid=form_uuid, where=where)
+    try:
+        result = await handler.handle(query)
+    except exceptions.DomainError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[{"msg": type(error).__name__}],
+        ) from error
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=[{"msg": "The requested form does not exist."}],
+        )
+    return result
+
+
+@router.post("/{form_uuid}/visibility")
+async def get_visibility_change(
+    form_uuid: UUID,
+    changed: queries.GetVisibilityChangeQuery.AnswerDTO,
+    answers: list[queries.GetVisibilityChangeQuery.AnswerDTO] = Body(default=[]),
+    handler: handlers.GetVisibilityChangeQueryHandler = Depends(
+        controllers.get_visibility_change_query_handler
+    ),
+) -> queries.GetVisibilityChangeQuery.ResultDTO:
+    query = queries.GetVisibilityChangeQuery(
+        form_uuid=form_uuid, answers=answers, changed=changed
+    )
+    try:
+        change = await handler.handle(query)
+    except exceptions.DomainError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[{"msg": type(error).__name__}],
+        ) from error
+    if change is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=[{"msg": "The requested form does not exist."}],
+        )
+    return change
+
+
+def _to_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def _parse_etags(header: str | None) -> frozenset[int]:
+    # weak and strong validators match alike, `*` and foreign tags never do
+    if header is None:
+        return frozenset()
+    matches = (_ETAG.fullmatch(tag.strip()) for tag in header.split(","))
+    return frozenset(int(match[1]) for match in matches if match)
+
+
+def _parse_value(value: str) -> Any:
+    # answers are matched as JSON, so `true` and `"true"` differ; anything
+    # that is not JSON is taken as a plain string
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _to_page_response(
+    request: Request, items: list[dict[str, Any]], next_after: UUID | None
+) -> Response:
+    # the items are already mapped, FastAPI must not validate them again
+    response = Response(content=to_json(items), media_type="application/json")
+    if next_after is not None:
+        next_url = request.url.include_query_params(after=next_after)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return response
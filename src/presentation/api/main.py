@@ -1,17 +1,49 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from presentation.api import forms
+from presentation.api.metrics import MetricsMiddleware, metrics
+from presentation.api.profiling import (
+    ProfilingMiddleware,
+    ProfilingSettings,
+    load_profiling_settings,
+)
+from presentation.api.resources import Resources, create_resources
 
 
-app = FastAPI(
-    title="Custom Forms",
-    description="Welcome to Custom Form's API documentation!",
-    root_path="/api/v1",
-)
+def create_app(
+    resources_factory: Callable[[], Resources] = create_resources,
+    profiling_factory: Callable[[], ProfilingSettings | None] = load_profiling_settings,
+) -> FastAPI:
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        app.state.resources = resources_factory()
+        await app.state.resources.start()
+        try:
+            yield
+        finally:
+            await app.state.resources.close()
+
+    app = FastAPI(
+        title="Custom Forms",
+        description="Welcome to Custom Form's API documentation!",
+        root_path="/api/v1",
+        lifespan=lifespan,
+    )
+    app.add_middleware(MetricsMiddleware)
+    profiling = profiling_factory()
+    if profiling is not None:
+        # outermost, so writing the profile is not counted as request latency
+        app.add_middleware(ProfilingMiddleware, settings=profiling)
+    app.get("/healthcheck")(healthcheck)
+    app.get("/metrics", include_in_schema=False)(metrics)
+    app.include_router(forms.router)
+    return app
 
 
-@app.get("/healthcheck")
 def healthcheck() -> dict:
     return {"status": "ok"}
 
 
-app.include_router(forms.router)
+app = create_app()
@@ -0,0 +1,94 @@
+from time import perf_counter
+
+from fastapi import Request, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.application.metrics import REGISTRY, Counter, Family, Gauge, HistogramFamily
+from presentation.api.resources import Resources
+
+REQUEST_SECONDS = REGISTRY.register(
+    HistogramFamily(
+        "custom_forms_http_request_seconds",
+        "Time from receiving a request until its response was sent.",
+        ("method", "route"),
+    )
+)
+RESPONSES = REGISTRY.register(
+    Counter(
+        "custom_forms_http_responses",
+        "Responses by status code.",
+        ("method", "route", "status"),
+    )
+)
+
+# requests no route matched share one label, so their paths cannot blow up
+# the number of series
+_UNMATCHED = "unmatched"
+
+
+# Pure ASGI, so a request only pays for two clock reads and a few dict lookups
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - started
+            # the router stores the matched route in the shared scope
+            route = scope.get("route")
+            path = getattr(route, "path", _UNMATCHED)
+            method = scope["method"]
+            REQUEST_SECONDS.labels(method, path).observe(elapsed)
+            RESPONSES.inc((method, path, str(status)))
+
+
+def collect(resources: Resources) -> list[Family]:
+    # counters kept by the resources themselves, read at scrape time
+    requests = Counter(
+        "custom_forms_cache_requests", "Cache lookups by result.", ("cache", "result")
+    )
+    evictions = Counter(
+        "custom_forms_cache_evictions", "Entries dropped from caches.", ("cache",)
+    )
+    entries = Gauge("custom_forms_cache_entries", "Entries held by caches.", ("cache",))
+    for name, cache in (
+        ("form", resources.form_cache),
+        ("idempotency", resources.submission_outcomes),
+    ):
+        requests.inc((name, "hit"), cache.hits)
+        requests.inc((name, "miss"), cache.misses)
+        evictions.inc((name,), cache.evictions)
+        entries.set((name,), len(cache))
+
+    writer = resources.response_writer
+    batches = Counter("custom_forms_writer_batches", "Batches saved by the writer.")
+    batches.inc((), writer.batches)
+    written = Counter("custom_forms_writer_responses", "Responses saved by the writer.")
+    written.inc((), writer.written)
+    pending = Gauge("custom_forms_writer_pending", "Responses waiting to be saved.")
+    pending.set((), writer.pending)
+    return [requests, evictions, entries, batches, written, pending]
+
+
+# async so the registry is rendered on the event loop thread, the only one
+# updating it
+async def metrics(request: Request) -> Response:
+    return Response(
+        content=REGISTRY.render(*collect(request.app.state.resources)),
+        media_type="text/plain; version=0.0.4",
+    )
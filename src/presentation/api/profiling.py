@@ -0,0 +1,95 @@
+import asyncio
+import os
+import random
+import re
+import time
+from cProfile import Profile
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+PROFILE_HEADER = b"x-custom-forms-profile"
+
+_UNSAFE_CHARACTERS = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+@dataclass(frozen=True)
+class ProfilingSettings:
+    directory: str
+    # fraction of requests profiled without being asked to, 0 turns sampling off
+    rate: float = 0.0
+    # requests sending this value in PROFILE_HEADER are always profiled,
+    # None turns the header off
+    token: str | None = None
+
+
+def load_profiling_settings() -> ProfilingSettings | None:
+    directory = os.environ.get("CUSTOM_FORMS_PROFILE_DIRECTORY")
+    if not directory:
+        return None
+    return ProfilingSettings(
+        directory=directory,
+        rate=float(os.environ.get("CUSTOM_FORMS_PROFILE_RATE", "0")),
+        token=os.environ.get("CUSTOM_FORMS_PROFILE_TOKEN") or None,
+    )
+
+
+# Runs chosen requests under cProfile and writes one pstats file per request.
+# cProfile sees everything the event loop runs meanwhile, including other
+# requests, but not the repository's worker threads. Only one profiler can be
+# active per thread, so a request chosen while another one is profiled runs
+# unprofiled. Not added to the app at all when profiling is off.
+class ProfilingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: ProfilingSettings,
+        sample: Callable[[], float] = random.random,
+    ) -> None:
+        self.app = app
+        self.settings = settings
+        self._sample = sample
+        self._token = None if settings.token is None else settings.token.encode()
+        self._active = False
+        self.profiles = 0
+        os.makedirs(settings.directory, exist_ok=True)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._active or not self._is_chosen(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # another tool, such as a debugger, already profiles this thread
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        started = time.time_ns()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            self._active = False
+            # the response is already sent, so writing does not delay it
+            path = os.path.join(self.settings.directory, _file_name(scope, started))
+            await asyncio.to_thread(profiler.dump_stats, path)
+            self.profiles += 1
+
+    def _is_chosen(self, scope: Scope) -> bool:
+        if self._token is not None:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return value == self._token
+        return self.settings.rate > 0 and self._sample() < self.settings.rate
+
+
+def _file_name(scope: Scope, started: int) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", scope["path"])
+    name = _UNSAFE_CHARACTERS.sub("_", path).strip("_") or "root"
+    return f"{started}-{scope['method']}-{name}.prof"
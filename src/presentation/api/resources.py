@@ -0,0 +1,119 @@
+import os
+import tempfile
+from dataclasses import dataclass, field
+
+from core.application.caches import SerializedFormCache
+from core.application.writers import ResponseWriter
+from core.domain.columns import ResponseColumns
+from core.domain.entities import Form
+from core.domain.idempotency import SubmissionOutcomes
+from core.domain.repositories import IAsyncRepository, IBlobStore, IRepository
+from core.domain.services import SubmitFormService, UploadFileService
+from core.domain.summaries import ResponseSummaries
+from core.domain.validation import SubmissionPlanCache
+from infrastructure.blobs import LocalBlobStore
+from infrastructure.repositories import (
+    InstrumentedRepository,
+    MockedRepository,
+    NotifyingRepository,
+    SqliteRepository,
+    ThreadPoolRepository,
+)
+
+DEFAULT_BLOB_DIRECTORY = os.path.join(tempfile.gettempdir(), "custom_forms_blobs")
+
+
+# Everything that lives for the whole application instead of a single request
+@dataclass
+class Resources:
+    repository: IAsyncRepository
+    submission_plans: SubmissionPlanCache = field(default_factory=SubmissionPlanCache)
+    response_summaries: ResponseSummaries = field(default_factory=ResponseSummaries)
+    response_columns: ResponseColumns = field(default_factory=ResponseColumns)
+    form_cache: SerializedFormCache = field(default_factory=SerializedFormCache)
+    submission_outcomes: SubmissionOutcomes = field(default_factory=SubmissionOutcomes)
+    response_writer: ResponseWriter | None = None
+    blob_store: IBlobStore = field(
+        default_factory=lambda: LocalBlobStore(DEFAULT_BLOB_DIRECTORY)
+    )
+    submit_form_service: SubmitFormService = field(init=False)
+    upload_file_service: UploadFileService = field(init=False)
+
+    def __post_init__(self) -> None:
+        listeners = [self.response_summaries, self.response_columns]
+        if self.response_writer is None:
+            self.response_writer = ResponseWriter(self.repository, listeners)
+        self.submit_form_service = SubmitFormService(
+            repository=self.repository,
+            plans=self.submission_plans,
+            listeners=listeners,
+            writer=self.response_writer,
+            outcomes=self.submission_outcomes,
+            blobs=self.blob_store,
+        )
+        self.upload_file_service = UploadFileService(
+            repository=self.repository, blobs=self.blob_store
+        )
+
+    async def start(self) -> None:
+        self.response_writer.start()
+
+    async def close(self) -> None:
+        # queued responses are saved before the repository goes away
+        await self.response_writer.stop()
+        await self.blob_store.close()
+        await self.repository.close()
+
+
+def create_resources() -> Resources:
+    database_path = os.environ.get("CUSTOM_FORMS_DATABASE")
+    repository: IRepository = (
+        SqliteRepository(database_path) if database_path else MockedRepository()
+    )
+    workers = int(os.environ.get("CUSTOM_FORMS_REPOSITORY_WORKERS", "8"))
+    form_cache = SerializedFormCache(
+        capacity=int(os.environ.get("CUSTOM_FORMS_FORM_CACHE_SIZE", "1024"))
+    )
+    submission_plans = SubmissionPlanCache()
+
+    def on_form_saved(form: Form) -> None:
+        # everything compiled from the previous revision is dropped right
+        # away instead of waiting for a version mismatch
+        form_cache.invalidate(form.uuid)
+        submission_plans.invalidate(form.uuid)
+
+    repository = InstrumentedRepository(
+        ThreadPoolRepository(
+            NotifyingRepository(
+                repository,
+                on_form_saved=on_form_saved,
+            ),
+            max_workers=workers,
+        )
+    )
+    response_summaries = ResponseSummaries()
+    response_columns = ResponseColumns()
+    response_writer = ResponseWriter(
+        repository,
+        listeners=[response_summaries, response_columns],
+        max_batch_size=int(os.environ.get("CUSTOM_FORMS_WRITE_BATCH_SIZE", "256")),
+        max_delay=float(os.environ.get("CUSTOM_FORMS_WRITE_DELAY_MS", "2")) / 1000,
+        max_pending=int(os.environ.get("CUSTOM_FORMS_WRITE_QUEUE_SIZE", "4096")),
+    )
+    submission_outcomes = SubmissionOutcomes(
+        capacity=int(os.environ.get("CUSTOM_FORMS_IDEMPOTENCY_CACHE_SIZE", "65536")),
+        ttl=float(os.environ.get("CUSTOM_FORMS_IDEMPOTENCY_TTL_S", "86400")),
+    )
+    blob_store = LocalBlobStore(
+        os.environ.get("CUSTOM_FORMS_BLOB_DIRECTORY", DEFAULT_BLOB_DIRECTORY)
+    )
+    return Resources(
+        repository=repository,
+        blob_store=blob_store,
+        submission_outcomes=submission_outcomes,
+        response_summaries=response_summaries,
+        response_columns=response_columns,
+        form_cache=form_cache,
+        submission_plans=submission_plans,
+        response_writer=response_writer,
+    )
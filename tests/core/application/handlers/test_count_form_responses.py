@@ -0,0 +1,36 @@
+import pytest
+
+from core.application.handlers import CountFormResponsesQueryHandler
+from core.application.queries import CountFormResponsesQuery
+from core.domain.columns import ResponseColumns
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+
+
+@pytest.fixture
+def handler(async_repository) -> CountFormResponsesQueryHandler:
+    return CountFormResponsesQueryHandler(async_repository, ResponseColumns())
+
+
+async def test_handler_counts_matching_stored_responses(handler, repository) -> None:
+    field = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(field)
+    repository.save_form(form)
+    for value in (True, True, False):
+        response = FormResponse.create(for_form_uuid=form.uuid)
+        response.add_field_response(FieldResponse.create(value, for_field=field.uuid))
+        repository.save_form_response(response)
+    query = CountFormResponsesQuery(
+        form_uuid=form.uuid.value,
+        where=[{"field_uuid": field.uuid.value, "value": True}],
+    )
+
+    result = await handler.handle(query)
+
+    assert result == CountFormResponsesQuery.ResultDTO(count=2)
+
+
+async def test_handler_returns_none_for_unknown_form(handler, faker) -> None:
+    query = CountFormResponsesQuery(form_uuid=faker.uuid4(), where=[])
+
+    assert await handler.handle(query) is None
@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+
+import pytest
+
+from core.application import exports
+from core.application.handlers import ExportFormResponsesQueryHandler
+from core.application.queries import ExportFormResponsesQuery
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+
+
+@pytest.fixture
+def handler(async_repository) -> ExportFormResponsesQueryHandler:
+    return ExportFormResponsesQueryHandler(async_repository)
+
+
+@pytest.fixture
+def fields() -> tuple[BooleanField, BooleanField]:
+    return BooleanField.create(), BooleanField.create()
+
+
+@pytest.fixture
+def form(repository, fields) -> Form:
+    form = Form.create(title="form")
+    for field in fields:
+        form.add_field(field)
+    repository.save_form(form)
+    return form
+
+
+@pytest.fixture
+def response(repository, form, fields) -> FormResponse:
+    first, _ = fields
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    response.add_field_response(FieldResponse.create(True, for_field=first.uuid))
+    repository.save_form_response(response)
+    return response
+
+
+async def _export(handler, query: ExportFormResponsesQuery) -> str:
+    chunks = await handler.handle(query)
+    return b"".join([chunk async for chunk in chunks]).decode()
+
+
+async def test_csv_columns_follow_form_fields(handler, form, fields, response) -> None:
+    first, second = fields
+    query = ExportFormResponsesQuery(form_uuid=form.uuid.value, format="csv")
+
+    rows = list(csv.reader(io.StringIO(await _export(handler, query))))
+
+    assert rows == [
+        ["uuid", str(first.uuid.value), str(second.uuid.value)],
+        [str(response.uuid.value), "true", ""],
+    ]
+
+
+async def test_ndjson_has_one_object_per_response(
+    handler, form, fields, response
+) -> None:
+    first, second = fields
+    query = ExportFormResponsesQuery(form_uuid=form.uuid.value, format="ndjson")
+
+    lines = (await _export(handler, query)).splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {
+            "uuid": str(response.uuid.value),
+            str(first.uuid.value): True,
+            str(second.uuid.value): None,
+        }
+    ]
+
+
+async def test_export_is_sent_in_chunks(
+    handler, form, fields, repository, monkeypatch
+) -> None:
+    monkeypatch.setattr(exports, "CHUNK_SIZE", 256)
+    first, _ = fields
+    for _ in range(20):
+        response = FormResponse.create(for_form_uuid=form.uuid)
+        response.add_field_response(FieldResponse.create(False, for_field=first.uuid))
+        repository.save_form_response(response)
+    query = ExportFormResponsesQuery(form_uuid=form.uuid.value, format="ndjson")
+
+    chunks = [chunk async for chunk in await handler.handle(query)]
+
+    assert len(chunks) > 1
+    assert sum(chunk.count(b"\n") for chunk in chunks) == 20
+
+
+async def test_handler_returns_none_for_unknown_form(handler, faker) -> None:
+    query = ExportFormResponsesQuery(form_uuid=faker.uuid4())
+
+    assert await handler.handle(query) is None
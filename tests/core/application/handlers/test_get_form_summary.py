@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from core.application.handlers import GetFormSummaryQueryHandler
+from core.application.queries import GetFormSummaryQuery
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+from core.domain.summaries import ResponseSummaries
+
+
+@pytest.fixture
+def summaries() -> ResponseSummaries:
+    return ResponseSummaries()
+
+
+@pytest.fixture
+def handler(async_repository, summaries) -> GetFormSummaryQueryHandler:
+    return GetFormSummaryQueryHandler(async_repository, summaries)
+
+
+async def test_handler_builds_summary_from_stored_responses(
+    handler, summaries, repository
+) -> None:
+    field = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(field)
+    repository.save_form(form)
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    response.add_field_response(FieldResponse.create(True, for_field=field.uuid))
+    repository.save_form_response(response)
+
+    result = await handler.handle(GetFormSummaryQuery(form_uuid=form.uuid.value))
+
+    assert result == GetFormSummaryQuery.ResultDTO(
+        form_uuid=form.uuid.value,
+        responses=1,
+        fields=[
+            {
+                "field_uuid": field.uuid.value,
+                "counts": [{"value": False, "count": 0}, {"value": True, "count": 1}],
+            }
+        ],
+    )
+    assert summaries.get(form) is not None
+
+
+async def test_handler_returns_none_for_unknown_form(handler, faker) -> None:
+    query = GetFormSummaryQuery(form_uuid=faker.uuid4())
+
+    assert await handler.handle(query) is None
+
+
+async def test_concurrent_first_requests_share_one_rebuild(handler, repository) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+    repository.save_form_response(FormResponse.create(for_form_uuid=form.uuid))
+    query = GetFormSummaryQuery(form_uuid=form.uuid.value)
+
+    results = await asyncio.gather(handler.handle(query), handler.handle(query))
+
+    assert [result.responses for result in results] == [1, 1]
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from core.application import mappers
+from core.application.caches import SerializedFormCache
+from core.application.handlers import GetSerializedFormQueryHandler
+from core.application.queries import GetFormQuery
+from core.domain.entities import BooleanField, Form
+
+
+@pytest.fixture
+def cache() -> SerializedFormCache:
+    return SerializedFormCache()
+
+
+@pytest.fixture
+def handler(async_repository, cache) -> GetSerializedFormQueryHandler:
+    return GetSerializedFormQueryHandler(async_repository, cache)
+
+
+@pytest.fixture
+def form(repository) -> Form:
+    form = Form.create(title="form")
+    repository.save_form(form)
+    return form
+
+
+async def test_handler_returns_serialized_form(handler, form) -> None:
+    result = await handler.handle(GetFormQuery(uuid=form.uuid.value))
+
+    assert result.version == form.version
+    assert json.loads(result.content) == {
+        "uuid": str(form.uuid.value),
+        "version": form.version,
+    }
+
+
+async def test_repeated_reads_are_served_from_cache(
+    handler, cache, form, monkeypatch
+) -> None:
+    first = await handler.handle(GetFormQuery(uuid=form.uuid.value))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the form should not be serialized")
+
+    monkeypatch.setattr(mappers, "to_form", fail)
+    second = await handler.handle(GetFormQuery(uuid=form.uuid.value))
+
+    assert second.content is first.content
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+async def test_changed_form_is_serialized_again(handler, form) -> None:
+    first = await handler.handle(GetFormQuery(uuid=form.uuid.value))
+    form.add_field(BooleanField.create())
+
+    second = await handler.handle(GetFormQuery(uuid=form.uuid.value))
+
+    assert second.version == first.version + 1
+    assert json.loads(second.content)["version"] == second.version
+
+
+async def test_handler_returns_none_for_unknown_form(handler, faker) -> None:
+    assert await handler.handle(GetFormQuery(uuid=faker.uuid4())) is None
+
+
+async def test_handler_skips_serializing_known_version(
+    handler, cache, form, monkeypatch
+) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("the form should not be serialized")
+
+    monkeypatch.setattr(cache, "get", fail)
+    query = GetFormQuery(uuid=form.uuid.value, known_versions={form.version})
+
+    result = await handler.handle(query)
+
+    assert result == GetFormQuery.NotModifiedDTO(version=form.version)
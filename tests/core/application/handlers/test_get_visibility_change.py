@@ -0,0 +1,65 @@
+import pytest
+
+from core.application.handlers import GetVisibilityChangeQueryHandler
+from core.application.queries import GetVisibilityChangeQuery
+from core.domain import exceptions
+from core.domain.entities import BooleanField, Form
+from core.domain.validation import SubmissionPlanCache
+from core.domain.value_objects import FieldEquals
+
+
+@pytest.fixture
+def handler(async_repository) -> GetVisibilityChangeQueryHandler:
+    return GetVisibilityChangeQueryHandler(async_repository, SubmissionPlanCache())
+
+
+@pytest.fixture
+def fields() -> tuple[BooleanField, BooleanField]:
+    trigger, conditional = BooleanField.create(), BooleanField.create()
+    conditional.set_condition(FieldEquals(trigger.uuid, True))
+    return trigger, conditional
+
+
+@pytest.fixture
+def form(repository, fields) -> Form:
+    form = Form.create(title="form")
+    for field in fields:
+        form.add_field(field)
+    repository.save_form(form)
+    return form
+
+
+async def test_handler_returns_visibility_change(handler, form, fields) -> None:
+    trigger, conditional = fields
+    query = GetVisibilityChangeQuery(
+        form_uuid=form.uuid.value,
+        answers=[],
+        changed={"field_uuid": trigger.uuid.value, "value": True},
+    )
+
+    result = await handler.handle(query)
+
+    assert result == GetVisibilityChangeQuery.ResultDTO(
+        shown=[conditional.uuid.value], hidden=[]
+    )
+
+
+async def test_handler_returns_none_for_unknown_form(handler, faker) -> None:
+    query = GetVisibilityChangeQuery(
+        form_uuid=faker.uuid4(),
+        answers=[],
+        changed={"field_uuid": faker.uuid4(), "value": True},
+    )
+
+    assert await handler.handle(query) is None
+
+
+async def test_handler_rejects_unknown_changed_field(handler, form, faker) -> None:
+    query = GetVisibilityChangeQuery(
+        form_uuid=form.uuid.value,
+        answers=[],
+        changed={"field_uuid": faker.uuid4(), "value": True},
+    )
+
+    with pytest.raises(exceptions.FormDoesNotHaveThisField):
+        await handler.handle(query)
@@ -6,8 +6,8 @@ from pytest_unordered import unordered
 
 
 @pytest.fixture
-def handler(repository) -> ListFormsQueryHandler:
-    return ListFormsQueryHandler(repository)
+def handler(async_repository) -> ListFormsQueryHandler:
+    return ListFormsQueryHandler(async_repository)
 
 
 async def test_handler_returns_empty_list_when_no_saved_forms(
@@ -16,7 +16,8 @@ async def test_handler_returns_empty_list_when_no_saved_forms(
     query = ListAllFormsQuery()
     result = await handler.handle(query)
 
-    assert result == []
+    assert result.items == []
+    assert result.next_after is None
 
 
 async def test_handler_returns_actual_forms(handler, repository) -> None:
@@ -29,7 +30,32 @@ async def test_handler_returns_actual_forms(handler, repository) -> None:
     result = await handler.handle(query)
 
     expected = [
-        ListAllFormsQuery.ResultDTO.model_validate(form1),
-        ListAllFormsQuery.ResultDTO.model_validate(form2),
+        ListAllFormsQuery.ResultDTO.model_validate(form1).model_dump(),
+        ListAllFormsQuery.ResultDTO.model_validate(form2).model_dump(),
     ]
-    assert result == unordered(expected)
+    assert result.items == unordered(expected)
+
+
+async def test_handler_pages_through_forms_by_uuid(handler, repository) -> None:
+    forms = [Form.create(title=f"form{i}") for i in range(5)]
+    for form in forms:
+        repository.save_form(form)
+
+    uuids, after = [], None
+    while True:
+        page = await handler.handle(ListAllFormsQuery(limit=2, after=after))
+        uuids += [item["uuid"] for item in page.items]
+        after = page.next_after
+        if after is None:
+            break
+
+    assert uuids == sorted(form.uuid.value for form in forms)
+
+
+async def test_handler_projects_requested_fields(handler, repository) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+
+    result = await handler.handle(ListAllFormsQuery(fields={"title"}))
+
+    assert result.items == [{"title": "form"}]
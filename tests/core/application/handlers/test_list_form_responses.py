@@ -0,0 +1,82 @@
+import pytest
+
+from core.application.handlers import ListFormResponsesQueryHandler
+from core.application.queries import ListFormResponsesQuery
+from core.domain import exceptions
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+
+
+@pytest.fixture
+def handler(async_repository) -> ListFormResponsesQueryHandler:
+    return ListFormResponsesQueryHandler(async_repository)
+
+
+@pytest.fixture
+def field() -> BooleanField:
+    return BooleanField.create()
+
+
+@pytest.fixture
+def form(repository, field) -> Form:
+    form = Form.create(title="form")
+    form.add_field(field)
+    repository.save_form(form)
+    return form
+
+
+async def test_handler_pages_responses_with_value(
+    handler, repository, form, field
+) -> None:
+    responses = []
+    for value in (True, False, True, True):
+        response = FormResponse.create(for_form_uuid=form.uuid)
+        response.add_field_response(FieldResponse.create(value, for_field=field.uuid))
+        repository.save_form_response(response)
+        responses.append(response)
+    query = ListFormResponsesQuery(
+        form_uuid=form.uuid.value, field_uuid=field.uuid.value, value=True, limit=2
+    )
+
+    page = await handler.handle(query)
+
+    assert [item["uuid"] for item in page.items] == [
+        responses[0].uuid.value,
+        responses[2].uuid.value,
+    ]
+    assert page.items[0]["field_responses"] == [
+        {"field_uuid": field.uuid.value, "value": True}
+    ]
+    assert page.next_after == responses[2].uuid.value
+
+
+async def test_handler_has_no_next_page_after_last_match(
+    handler, repository, form, field
+) -> None:
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    response.add_field_response(FieldResponse.create(True, for_field=field.uuid))
+    repository.save_form_response(response)
+    query = ListFormResponsesQuery(
+        form_uuid=form.uuid.value, field_uuid=field.uuid.value, value=True, limit=1
+    )
+
+    page = await handler.handle(query)
+
+    assert len(page.items) == 1
+    assert page.next_after is None
+
+
+async def test_handler_rejects_field_of_other_form(handler, form, faker) -> None:
+    query = ListFormResponsesQuery(
+        form_uuid=form.uuid.value, field_uuid=faker.uuid4(), value=True
+    )
+
+    with pytest.raises(exceptions.FormDoesNotHaveThisField):
+        await handler.handle(query)
+
+
+async def test_handler_returns_none_for_unknown_form(handler, faker) -> None:
+    query = ListFormResponsesQuery(
+        form_uuid=faker.uuid4(), field_uuid=faker.uuid4(), value=True
+    )
+
+    assert await handler.handle(query) is None
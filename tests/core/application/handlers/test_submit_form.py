@@ -0,0 +1,73 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from core.application.commands import SubmitFormCommand
+from core.application.handlers import SubmitFormCommandHandler
+from core.application.writers import ResponseWriter
+from core.domain import exceptions
+from core.domain.entities import BooleanField, Form
+from core.domain.services import SubmitFormService
+from core.domain.value_objects import FormResponseUUID
+
+
+@pytest.fixture
+async def writer(async_repository) -> AsyncIterator[ResponseWriter]:
+    writer = ResponseWriter(async_repository, max_delay=0)
+    writer.start()
+    yield writer
+    await writer.stop()
+
+
+@pytest.fixture
+def handler(async_repository, writer) -> SubmitFormCommandHandler:
+    return SubmitFormCommandHandler(SubmitFormService(async_repository, writer=writer))
+
+
+async def test_handler_returns_once_response_is_saved(handler, repository) -> None:
+    field = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(field)
+    repository.save_form(form)
+    command = SubmitFormCommand(
+        form_uuid=form.uuid.value,
+        field_responses=[{"field_uuid": field.uuid.value, "value": True}],
+    )
+
+    result = await handler.handle(command)
+
+    saved = repository.get_form_response_by_uuid(FormResponseUUID(result.uuid))
+    assert saved.get_response(field.uuid).value is True
+
+
+async def test_handler_does_not_queue_invalid_response(
+    handler, repository, writer
+) -> None:
+    field = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(field)
+    repository.save_form(form)
+    command = SubmitFormCommand(
+        form_uuid=form.uuid.value,
+        field_responses=[{"field_uuid": field.uuid.value, "value": "yes"}],
+    )
+
+    with pytest.raises(exceptions.InvalidFormSubmission):
+        await handler.handle(command)
+    assert writer.written == 0
+
+
+async def test_retry_with_same_response_uuid_is_written_once(
+    handler, repository, writer, faker
+) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+    command = SubmitFormCommand(
+        form_uuid=form.uuid.value, uuid=faker.uuid4(), field_responses=[]
+    )
+
+    first = await handler.handle(command)
+    retried = await handler.handle(command)
+
+    assert first == retried
+    assert writer.written == 1
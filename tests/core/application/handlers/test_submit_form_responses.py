@@ -0,0 +1,53 @@
+import pytest
+
+from core.application.commands import SubmitFormResponsesCommand
+from core.application.handlers import SubmitFormResponsesCommandHandler
+from core.domain.entities import BooleanField, Form
+from core.domain.services import SubmitFormService
+from core.domain.value_objects import FormResponseUUID
+
+
+@pytest.fixture
+def handler(async_repository) -> SubmitFormResponsesCommandHandler:
+    return SubmitFormResponsesCommandHandler(SubmitFormService(async_repository))
+
+
+@pytest.fixture
+def field() -> BooleanField:
+    field = BooleanField.create()
+    field.mark_required()
+    return field
+
+
+@pytest.fixture
+def form(repository, field) -> Form:
+    form = Form.create(title="form")
+    form.add_field(field)
+    repository.save_form(form)
+    return form
+
+
+async def test_handler_reports_outcome_of_each_response(
+    handler, repository, form, field, faker
+) -> None:
+    accepted_uuid = faker.uuid4(cast_to=None)
+    command = SubmitFormResponsesCommand(
+        form_uuid=form.uuid.value,
+        responses=[
+            {
+                "uuid": accepted_uuid,
+                "field_responses": [{"field_uuid": field.uuid.value, "value": True}],
+            },
+            {"field_responses": []},
+        ],
+    )
+
+    result = await handler.handle(command)
+
+    assert result[0] == SubmitFormResponsesCommand.ResultDTO(
+        uuid=accepted_uuid, accepted=True
+    )
+    assert result[1].accepted is False
+    assert result[1].error == "FormDoesNotHaveAllRequiredFields"
+    saved = repository.get_form_response_by_uuid(FormResponseUUID(accepted_uuid))
+    assert saved.get_response(field.uuid).value is True
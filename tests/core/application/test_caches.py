@@ -0,0 +1,37 @@
+from core.application.caches import SerializedFormCache
+from core.domain.value_objects import FormUUID
+
+
+def test_cached_content_is_returned_for_same_version() -> None:
+    cache = SerializedFormCache()
+    form_uuid = FormUUID()
+    cache.put(form_uuid, 1, b"{}")
+
+    assert cache.get(form_uuid, 1) == b"{}"
+    assert cache.get(form_uuid, 2) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_form_is_evicted() -> None:
+    cache = SerializedFormCache(capacity=2)
+    first, second, third = FormUUID(), FormUUID(), FormUUID()
+    cache.put(first, 0, b"1")
+    cache.put(second, 0, b"2")
+    cache.get(first, 0)
+
+    cache.put(third, 0, b"3")
+
+    assert cache.get(second, 0) is None
+    assert cache.get(first, 0) == b"1"
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_invalidated_form_is_not_returned() -> None:
+    cache = SerializedFormCache()
+    form_uuid = FormUUID()
+    cache.put(form_uuid, 0, b"{}")
+
+    cache.invalidate(form_uuid)
+
+    assert cache.get(form_uuid, 0) is None
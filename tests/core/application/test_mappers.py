@@ -0,0 +1,28 @@
+from pydantic_core import to_json
+
+from core.application import mappers
+from core.application.queries import GetFormQuery, ListAllFormsQuery
+from core.domain.entities import Form
+
+
+def test_form_list_item_matches_validated_dto() -> None:
+    form = Form.create(title="form")
+
+    item = mappers.to_form_list_item(form, {"uuid", "title"})
+
+    dto = ListAllFormsQuery.ResultDTO.model_validate(form)
+    assert item == dto.model_dump()
+    assert to_json(item) == dto.model_dump_json().encode()
+
+
+def test_form_list_item_only_has_projected_fields() -> None:
+    form = Form.create(title="form")
+
+    assert mappers.to_form_list_item(form, {"uuid"}) == {"uuid": form.uuid.value}
+
+
+def test_form_matches_validated_dto() -> None:
+    form = Form.create(title="form")
+
+    dto = GetFormQuery.ResultDTO.model_validate(form)
+    assert to_json(mappers.to_form(form)) == dto.model_dump_json().encode()
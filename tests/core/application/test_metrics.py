@@ -0,0 +1,55 @@
+import pytest
+
+from core.application import metrics
+from core.application.handlers import QueryHandler
+from core.application.metrics import Counter, Gauge, HistogramFamily, Registry
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    family = HistogramFamily("latency_seconds", "Latency.", ("route",), (0.1, 1.0))
+    histogram = family.labels("/forms")
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert list(family.render()) == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/forms",le="0.1"} 1',
+        'latency_seconds_bucket{route="/forms",le="1"} 3',
+        'latency_seconds_bucket{route="/forms",le="+Inf"} 4',
+        'latency_seconds_sum{route="/forms"} 4.05',
+        'latency_seconds_count{route="/forms"} 4',
+    ]
+
+
+def test_counters_and_gauges_render_escaped_labels() -> None:
+    counter = Counter("errors", "Errors.", ("error",))
+    counter.inc(('a"b\\c\nd',))
+    counter.inc(('a"b\\c\nd',), 2)
+    gauge = Gauge("pending", "Pending.")
+    gauge.set((), 7)
+    registry = Registry()
+    registry.register(counter)
+
+    assert registry.render(gauge).splitlines() == [
+        "# HELP errors_total Errors.",
+        "# TYPE errors_total counter",
+        r'errors_total{error="a\"b\\c\nd"} 3',
+        "# HELP pending Pending.",
+        "# TYPE pending gauge",
+        "pending 7",
+    ]
+
+
+async def test_handlers_are_timed_including_errors() -> None:
+    class FailingQueryHandler(QueryHandler):
+        async def handle(self, query: object) -> None:
+            raise LookupError()
+
+    histogram = metrics.HANDLER_SECONDS.labels("FailingQueryHandler")
+
+    with pytest.raises(LookupError):
+        await FailingQueryHandler().handle(None)
+
+    assert sum(histogram.counts) == 1
+    assert metrics.HANDLER_ERRORS.values[("FailingQueryHandler", "LookupError")] == 1
@@ -0,0 +1,169 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from core.application.writers import ResponseWriter, ResponseWriterClosed
+from core.domain import exceptions
+from core.domain.entities import Form, FormResponse
+from core.domain.services import ISubmissionListener
+
+
+class RecordingListener(ISubmissionListener):
+    def __init__(self) -> None:
+        self.accepted: list[FormResponse] = []
+
+    def on_accepted(self, form: Form, responses: list[FormResponse]) -> None:
+        self.accepted.extend(responses)
+
+
+@pytest.fixture
+def form() -> Form:
+    return Form.create(title="form")
+
+
+@pytest.fixture
+def listener() -> RecordingListener:
+    return RecordingListener()
+
+
+@pytest.fixture
+async def writer(async_repository, listener) -> AsyncIterator[ResponseWriter]:
+    writer = ResponseWriter(
+        async_repository, [listener], max_batch_size=10, max_delay=0.01
+    )
+    writer.start()
+    yield writer
+    await writer.stop()
+
+
+async def test_concurrent_writes_are_saved_in_one_batch(
+    writer, repository, listener, form
+) -> None:
+    responses = [FormResponse.create(for_form_uuid=form.uuid) for _ in range(5)]
+
+    await asyncio.gather(*(writer.write(form, response) for response in responses))
+
+    assert writer.batches == 1
+    assert all(repository.get_form_response_by_uuid(r.uuid) for r in responses)
+    assert listener.accepted == responses
+
+
+async def test_full_batch_is_saved_without_waiting_for_delay(
+    async_repository, form
+) -> None:
+    writer = ResponseWriter(async_repository, max_batch_size=2, max_delay=60)
+    writer.start()
+    responses = [FormResponse.create(for_form_uuid=form.uuid) for _ in range(4)]
+
+    async with asyncio.timeout(5):
+        await asyncio.gather(*(writer.write(form, response) for response in responses))
+
+    assert (writer.batches, writer.written) == (2, 4)
+    await writer.stop()
+
+
+async def test_queued_responses_are_saved_on_stop(
+    async_repository, repository, form
+) -> None:
+    writer = ResponseWriter(async_repository, max_delay=60)
+    writer.start()
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    write = asyncio.create_task(writer.write(form, response))
+    await asyncio.sleep(0)
+
+    await writer.stop()
+
+    await write
+    assert repository.get_form_response_by_uuid(response.uuid) == response
+
+
+async def test_writes_after_stop_are_refused(writer, form) -> None:
+    await writer.stop()
+
+    with pytest.raises(ResponseWriterClosed):
+        await writer.write(form, FormResponse.create(for_form_uuid=form.uuid))
+
+
+async def test_failed_save_is_raised_to_every_caller_of_batch(
+    async_repository, repository, listener, form, monkeypatch
+) -> None:
+    def fail(form_responses: list[FormResponse]) -> None:
+        raise OSError("disk is full")
+
+    monkeypatch.setattr(repository, "save_form_responses", fail)
+    writer = ResponseWriter(async_repository, [listener], max_delay=0.01)
+    writer.start()
+    responses = [FormResponse.create(for_form_uuid=form.uuid) for _ in range(2)]
+
+    results = await asyncio.gather(
+        *(writer.write(form, response) for response in responses),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [OSError, OSError]
+    assert listener.accepted == []
+    await writer.stop()
+
+
+async def test_responses_already_saved_are_refused(
+    writer, repository, listener, form
+) -> None:
+    saved = FormResponse.create(for_form_uuid=form.uuid)
+    repository.save_form_response(saved)
+    resubmitted = FormResponse(uuid=saved.uuid, form_uuid=form.uuid)
+    new = FormResponse.create(for_form_uuid=form.uuid)
+
+    results = await asyncio.gather(
+        writer.write(form, resubmitted),
+        writer.write(form, new),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [
+        exceptions.AlreadySubmitted,
+        type(None),
+    ]
+    assert repository.get_form_response_by_uuid(saved.uuid) is saved
+    assert listener.accepted == [new]
+
+
+async def test_failing_listener_does_not_stop_writer(
+    async_repository, repository, listener, form
+) -> None:
+    class FailingListener(ISubmissionListener):
+        def on_accepted(self, form: Form, responses: list[FormResponse]) -> None:
+            raise RuntimeError("listener is broken")
+
+    writer = ResponseWriter(
+        async_repository, [FailingListener(), listener], max_delay=0.01
+    )
+    writer.start()
+    responses = [FormResponse.create(for_form_uuid=form.uuid) for _ in range(2)]
+
+    async with asyncio.timeout(5):
+        for response in responses:
+            await writer.write(form, response)
+        await writer.stop()
+
+    assert all(repository.get_form_response_by_uuid(r.uuid) for r in responses)
+    assert listener.accepted == responses
+
+
+async def test_waiting_writes_are_refused_when_writer_fails(
+    async_repository, form, monkeypatch
+) -> None:
+    writer = ResponseWriter(async_repository, max_delay=0.01)
+
+    async def crash(batch) -> None:
+        raise RuntimeError("writer is broken")
+
+    monkeypatch.setattr(writer, "_flush", crash)
+    writer.start()
+
+    async with asyncio.timeout(5):
+        with pytest.raises(ResponseWriterClosed):
+            await writer.write(form, FormResponse.create(for_form_uuid=form.uuid))
+        with pytest.raises(ResponseWriterClosed):
+            await writer.write(form, FormResponse.create(for_form_uuid=form.uuid))
+        await writer.stop()
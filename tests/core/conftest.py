@@ -1,7 +1,11 @@
+from collections.abc import AsyncIterator
+
 import pytest
 from tests.mocks.core.domain.repositories import TestsRepository
 from faker import Faker
 
+from infrastructure.repositories import ThreadPoolRepository
+
 
 @pytest.fixture
 def faker() -> Faker:
@@ -11,3 +15,10 @@ def faker() -> Faker:
 @pytest.fixture()
 def repository() -> TestsRepository:
     return TestsRepository()
+
+
+@pytest.fixture()
+async def async_repository(repository) -> AsyncIterator[ThreadPoolRepository]:
+    async_repository = ThreadPoolRepository(repository, max_workers=1)
+    yield async_repository
+    await async_repository.close()
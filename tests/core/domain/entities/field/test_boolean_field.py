@@ -1,4 +1,5 @@
 from core.domain.entities import BooleanField
+from core.domain.entities.field import FieldType
 
 
 def test_wrong_type_value_is_invalid() -> None:
@@ -13,3 +14,10 @@ def test_boolean_type_value_is_valid(faker) -> None:
     boolean_type = faker.boolean()
 
     assert field.is_valid(boolean_type) is True
+
+
+def test_field_is_slotted() -> None:
+    field = BooleanField.create()
+
+    assert not hasattr(field, "__dict__")
+    assert field.type is FieldType.BOOLEAN
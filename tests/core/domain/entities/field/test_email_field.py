@@ -0,0 +1,23 @@
+import pytest
+
+from core.domain.entities import EmailField
+
+
+@pytest.mark.parametrize("value", ["user@example.com", "first.last+tag@mail.co.uk"])
+def test_email_address_is_valid(value: str) -> None:
+    assert EmailField.create().is_valid(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "user@example",
+        "user@@example.com",
+        "user name@example.com",
+        "user@example..com",
+        "a" * 250 + "@b.co",
+        ["user@example.com"],
+    ],
+)
+def test_anything_but_an_email_address_is_invalid(value: object) -> None:
+    assert not EmailField.create().is_valid(value)
@@ -1,4 +1,6 @@
 from core.domain.entities import BooleanField as Field
+from core.domain.entities.field import FieldType
+from core.domain.value_objects import FieldEquals
 
 
 def test_field_create_results_in_unique_forms() -> None:
@@ -37,3 +39,39 @@ def test_is_valid_fails_for_required_field_when_empty() -> None:
     empty_value = None
 
     assert field.is_valid(empty_value) is False
+
+
+def test_field_class_can_be_found_by_its_type() -> None:
+    assert Field.for_type(FieldType.BOOLEAN) is Field
+
+
+def test_no_condition_by_default() -> None:
+    field = Field.create()
+
+    assert field.condition is None
+
+
+def test_set_condition() -> None:
+    field = Field.create()
+    condition = FieldEquals(Field.create().uuid, True)
+
+    field.set_condition(condition)
+
+    assert field.condition == condition
+
+
+def test_is_valid_many_validates_each_value() -> None:
+    field = Field.create()
+    field.mark_required()
+
+    assert field.is_valid_many([True, None, "yes", False]) == [True, False, False, True]
+
+
+def test_validator_is_compiled_once_until_field_changes() -> None:
+    field = Field.create()
+    validator = field.compile_validator()
+
+    assert field.compile_validator() is validator
+    field.mark_required()
+    assert field.compile_validator() is not validator
+    assert not field.is_valid(None)
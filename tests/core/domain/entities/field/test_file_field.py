@@ -0,0 +1,52 @@
+from core.domain.entities import FileField
+from core.domain.entities.field import DEFAULT_MAX_FILE_SIZE, FieldType
+from core.domain.value_objects import BlobReference, FileLimits
+
+_REFERENCE = BlobReference("ab" * 32, 1024, "image/png")
+
+
+def test_blob_reference_is_valid() -> None:
+    field = FileField.create()
+
+    assert field.is_valid(_REFERENCE.to_value())
+    assert field.limits == FileLimits(DEFAULT_MAX_FILE_SIZE)
+    assert FileField.for_type(FieldType.FILE) is FileField
+
+
+def test_anything_but_a_blob_reference_is_invalid() -> None:
+    field = FileField.create()
+
+    assert not field.is_valid("ab" * 32)
+    assert not field.is_valid({**_REFERENCE.to_value(), "sha256": "not a digest"})
+    assert not field.is_valid({**_REFERENCE.to_value(), "path": "/etc/passwd"})
+
+
+def test_reference_breaking_limits_is_invalid() -> None:
+    field = FileField.create()
+    field.set_limits(FileLimits(max_size=1023, media_types=frozenset({"image/png"})))
+    other_type = BlobReference(_REFERENCE.sha256, 10, "application/pdf")
+
+    assert not field.is_valid(_REFERENCE.to_value())
+    assert not field.is_valid(other_type.to_value())
+
+
+def test_settings_restore_limits() -> None:
+    field = FileField.create()
+    field.set_limits(FileLimits(max_size=5, media_types=frozenset({"text/plain"})))
+    restored = FileField.create()
+
+    restored.configure(field.settings)
+
+    assert restored.limits == field.limits
+
+
+def test_changing_limits_notifies_listeners() -> None:
+    field = FileField.create()
+    changed = []
+    field.subscribe(changed.append)
+
+    field.set_limits(FileLimits(max_size=5))
+    field.set_limits(FileLimits(max_size=5))
+
+    assert changed == [field]
+    assert not hasattr(field, "__dict__")
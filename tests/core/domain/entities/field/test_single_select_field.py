@@ -0,0 +1,42 @@
+import pytest
+
+from core.domain.entities import SingleSelectField
+from core.domain.entities.field import FieldType
+
+
+def _select(*options: str) -> SingleSelectField:
+    field = SingleSelectField.create()
+    field.set_options(options)
+    return field
+
+
+def test_only_option_ids_are_valid() -> None:
+    field = _select("red", "green")
+
+    assert field.is_valid_many(["red", "green", "blue", ["red"], None]) == [
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_options_are_tally_keys_in_their_order() -> None:
+    field = _select("red", "green")
+
+    assert field.get_tally_keys() == ("red", "green")
+    assert SingleSelectField.for_type(FieldType.SINGLE_SELECT) is SingleSelectField
+
+
+def test_settings_restore_options() -> None:
+    restored = SingleSelectField.create()
+
+    restored.configure(_select("b", "a").settings)
+
+    assert restored.options == ("b", "a")
+
+
+def test_options_have_to_be_unique() -> None:
+    with pytest.raises(ValueError):
+        _select("red", "red")
@@ -0,0 +1,21 @@
+from core.domain.entities import TextField
+
+
+def test_text_up_to_max_length_is_valid() -> None:
+    field = TextField.create()
+    field.set_max_length(5)
+
+    assert field.is_valid("hello")
+    assert not field.is_valid("hello!")
+    assert not field.is_valid(5)
+
+
+def test_changing_max_length_replaces_validator() -> None:
+    field = TextField.create()
+    field.set_max_length(3)
+    assert not field.is_valid("hello")
+
+    field.configure({"max_length": 5})
+
+    assert field.is_valid("hello")
+    assert field.settings == {"max_length": 5}
@@ -36,3 +36,48 @@ def test_add_response_for_same_form_field_overwrites_response(
     response = form_response.get_response(field_uuid)
     assert response.value == "new_value"
     assert response.uuid == new_response.uuid
+
+
+def test_get_response_for_unanswered_field_is_none(form_uuid, field_uuid) -> None:
+    form_response = FormResponse.create(form_uuid)
+
+    assert form_response.get_response(field_uuid) is None
+
+
+def test_overwritten_response_is_no_longer_listed(form_uuid, field_uuid) -> None:
+    old_response = FieldResponse.create("value", for_field=field_uuid)
+    new_response = FieldResponse.create("new_value", for_field=field_uuid)
+    form_response = FormResponse(
+        uuid=FormResponse.create(form_uuid).uuid,
+        form_uuid=form_uuid,
+        field_responses=[old_response, new_response],
+    )
+
+    assert list(form_response.field_responses) == [new_response]
+
+
+def test_has_all_required_fields(form_uuid, field_uuid) -> None:
+    other_field_uuid = FieldUUID()
+    form_response = FormResponse.create(form_uuid)
+    form_response.add_field_response(FieldResponse.create(True, for_field=field_uuid))
+
+    assert form_response.has_all_required_fields(frozenset())
+    assert form_response.has_all_required_fields({field_uuid})
+    assert not form_response.has_all_required_fields({field_uuid, other_field_uuid})
+
+
+def test_get_values(form_uuid, field_uuid) -> None:
+    form_response = FormResponse.create(form_uuid)
+    form_response.add_field_response(FieldResponse.create(True, for_field=field_uuid))
+
+    assert form_response.get_values() == {field_uuid: True}
+
+
+def test_responses_are_slotted(form_uuid, field_uuid) -> None:
+    form_response = FormResponse.create(form_uuid)
+    response = FieldResponse.create(True, for_field=field_uuid)
+    form_response.add_field_response(response)
+
+    assert not hasattr(form_response, "__dict__")
+    assert not hasattr(response, "__dict__")
+    assert hash(response) == hash(response.uuid)
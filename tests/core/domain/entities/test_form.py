@@ -1,8 +1,15 @@
 import pytest
 
 from core.domain.entities import Form
+from core.domain.entities.form import MAX_CONDITION_DEPTH
+from core.domain.value_objects import AllOf, AnyOf, Condition, FieldEquals, FormUUID
 from core.domain.entities import BooleanField as Field
-from core.domain.exceptions import FormCanOnlyHaveUniqueFields
+from core.domain.exceptions import (
+    ConditionIsTooDeep,
+    FormCanOnlyHaveUniqueFields,
+    FormDoesNotHaveThisField,
+    FormHasCyclicConditions,
+)
 
 
 @pytest.fixture
@@ -59,3 +66,132 @@ def test_required_fields_returns_only_required_fields(form) -> None:
     assert required_fields == {
         required_field,
     }
+
+
+def test_required_fields_follow_field_requirement_changes(form) -> None:
+    some_field = Field.create()
+    form.add_field(some_field)
+
+    some_field.mark_required()
+    assert form.get_required_field_uuids() == {some_field.uuid}
+
+    some_field.mark_not_required()
+    assert form.get_required_field_uuids() == frozenset()
+    assert form.get_required_fields() == set()
+
+
+def test_form_created_with_fields_indexes_them(faker) -> None:
+    required_field = Field.create()
+    required_field.mark_required()
+    form = Form.create(title=faker.sentence())
+    form_with_fields = Form(uuid=form.uuid, title=form.title, fields={required_field})
+
+    assert form_with_fields.is_valid_input_for_field(True, required_field.uuid)
+    assert form_with_fields.get_required_field_uuids() == {required_field.uuid}
+
+
+def test_input_for_unknown_field_is_rejected(form) -> None:
+    with pytest.raises(FormDoesNotHaveThisField):
+        form.is_valid_input_for_field(True, Field.create().uuid)
+
+
+def test_version_changes_when_form_changes(form) -> None:
+    some_field = Field.create()
+    initial_version = form.version
+
+    form.add_field(some_field)
+    after_add = form.version
+    some_field.mark_required()
+    after_mark_required = form.version
+    some_field.mark_required()
+
+    assert initial_version < after_add < after_mark_required == form.version
+
+
+def test_ordered_fields_keep_insertion_order(form) -> None:
+    fields = [Field.create() for _ in range(5)]
+    for some_field in fields:
+        form.add_field(some_field)
+
+    assert form.get_ordered_fields() == fields
+
+
+def test_version_changes_when_field_condition_changes(form) -> None:
+    trigger, some_field = Field.create(), Field.create()
+    form.add_field(trigger)
+    form.add_field(some_field)
+    version = form.version
+
+    some_field.set_condition(FieldEquals(trigger.uuid, True))
+
+    assert form.version > version
+
+
+def test_condition_on_own_field_is_rejected(form) -> None:
+    some_field = Field.create()
+    some_field.set_condition(FieldEquals(some_field.uuid, True))
+
+    with pytest.raises(FormHasCyclicConditions):
+        form.add_field(some_field)
+
+
+def test_cycle_through_other_conditions_is_rejected(form) -> None:
+    first, second, third = (Field.create() for _ in range(3))
+    for some_field in (first, second, third):
+        form.add_field(some_field)
+    second.set_condition(FieldEquals(first.uuid, True))
+    third.set_condition(FieldEquals(second.uuid, True))
+    version = form.version
+
+    with pytest.raises(FormHasCyclicConditions):
+        first.set_condition(FieldEquals(third.uuid, True))
+
+    assert first.condition is None
+    assert form.version > version
+
+
+def test_form_created_with_cyclic_fields_is_rejected() -> None:
+    first, second = Field.create(), Field.create()
+    first.set_condition(FieldEquals(second.uuid, True))
+    second.set_condition(FieldEquals(first.uuid, True))
+
+    with pytest.raises(FormHasCyclicConditions):
+        Form(uuid=FormUUID(), title="form", fields={first, second})
+
+
+def test_fields_added_together_may_read_each_other_in_any_order(form) -> None:
+    first, second = Field.create(), Field.create()
+    first.set_condition(FieldEquals(second.uuid, True))
+
+    form.add_fields([first, second])
+
+    assert form.get_ordered_fields() == [first, second]
+
+
+def _nested(condition: Condition, depth: int) -> Condition:
+    # alternates AllOf and AnyOf, so flattening does not undo the nesting
+    for level in range(depth - 1):
+        condition = (AllOf if level % 2 else AnyOf)((condition,))
+    return condition
+
+
+def test_too_deep_condition_is_rejected(form) -> None:
+    trigger, some_field = Field.create(), Field.create()
+    form.add_fields([trigger, some_field])
+    deepest = _nested(FieldEquals(trigger.uuid, True), MAX_CONDITION_DEPTH)
+
+    with pytest.raises(ConditionIsTooDeep):
+        some_field.set_condition(AllOf((deepest,)))
+
+    some_field.set_condition(deepest)
+    assert some_field.condition == deepest
+
+
+def test_field_added_with_too_deep_condition_is_rejected(form) -> None:
+    trigger, some_field = Field.create(), Field.create()
+    form.add_field(trigger)
+    # far deeper than Python could parse or recurse through
+    some_field.set_condition(_nested(FieldEquals(trigger.uuid, True), 5000))
+
+    with pytest.raises(ConditionIsTooDeep):
+        form.add_field(some_field)
@@ -1,15 +1,19 @@
+import asyncio
+from collections.abc import AsyncIterator
+
 import pytest
 
 from core.domain import exceptions
 from core.domain.entities import BooleanField as Field
-from core.domain.entities import FormResponse, Form, FieldResponse
-from core.domain.services import SubmitFormService
-from core.domain.value_objects import FormUUID
+from core.domain.entities import FileField, FormResponse, Form, FieldResponse
+from core.domain.services import ISubmissionListener, SubmitFormService
+from core.domain.value_objects import FieldEquals, FormUUID
+from infrastructure.blobs import LocalBlobStore
 
 
 @pytest.fixture
-def service(repository) -> SubmitFormService:
-    return SubmitFormService(repository)
+def service(async_repository) -> SubmitFormService:
+    return SubmitFormService(async_repository)
 
 
 @pytest.fixture
@@ -19,15 +23,15 @@ def existing_form(repository, faker) -> Form:
     return form
 
 
-def test_if_form_does_not_exist_submission_fails(service) -> None:
+async def test_if_form_does_not_exist_submission_fails(service) -> None:
     unknown_form_uuid = FormUUID()
     response_for_unknown_form = FormResponse.create(for_form_uuid=unknown_form_uuid)
 
     with pytest.raises(exceptions.NotFound):
-        service.submit(response_for_unknown_form)
+        await service.submit(response_for_unknown_form)
 
 
-def test_if_form_does_not_have_all_required_fields_submission_fails(
+async def test_if_form_does_not_have_all_required_fields_submission_fails(
     service, existing_form
 ) -> None:
     field1 = Field.create()
@@ -42,10 +46,10 @@ def test_if_form_does_not_have_all_required_fields_submission_fails(
     response.add_field_response(field_response)
 
     with pytest.raises(exceptions.FormDoesNotHaveAllRequiredFields):
-        service.submit(response)
+        await service.submit(response)
 
 
-def test_invalid_inputs_are_not_accepted(service, existing_form) -> None:
+async def test_invalid_inputs_are_not_accepted(service, existing_form) -> None:
     field1 = Field.create()
     existing_form.add_field(field1)
 
@@ -54,10 +58,10 @@ def test_invalid_inputs_are_not_accepted(service, existing_form) -> None:
     response.add_field_response(field_response)
 
     with pytest.raises(exceptions.InvalidFormSubmission):
-        service.submit(response)
+        await service.submit(response)
 
 
-def test_valid_submission_is_saved(service, existing_form, repository) -> None:
+async def test_valid_submission_is_saved(service, existing_form, repository) -> None:
     response_value = True
     field1 = Field.create()
     existing_form.add_field(field1)
@@ -65,7 +69,7 @@ def test_valid_submission_is_saved(service, existing_form, repository) -> None:
     response = FormResponse.create(for_form_uuid=existing_form.uuid)
     field_response = FieldResponse.create(value=response_value, for_field=field1.uuid)
     response.add_field_response(field_response)
-    service.submit(response)
+    await service.submit(response)
 
     saved_response = repository.get_form_response_by_uuid(response.uuid)
 
@@ -73,3 +77,253 @@ def test_valid_submission_is_saved(service, existing_form, repository) -> None:
     assert field_response in saved_response.field_responses
     field_response_from_repository = saved_response.get_response(for_field=field1.uuid)
     assert field_response_from_repository.value == response_value
+
+
+async def test_submit_many_returns_result_per_response(
+    service, existing_form, repository
+) -> None:
+    field1 = Field.create()
+    existing_form.add_field(field1)
+    valid = FormResponse.create(for_form_uuid=existing_form.uuid)
+    valid.add_field_response(FieldResponse.create(value=True, for_field=field1.uuid))
+    invalid = FormResponse.create(for_form_uuid=existing_form.uuid)
+    invalid.add_field_response(FieldResponse.create(value="no", for_field=field1.uuid))
+    for_unknown_form = FormResponse.create(for_form_uuid=FormUUID())
+
+    results = await service.submit_many([valid, invalid, for_unknown_form])
+
+    assert [result.response for result in results] == [
+        valid,
+        invalid,
+        for_unknown_form,
+    ]
+    assert results[0].is_accepted
+    assert isinstance(results[1].error, exceptions.InvalidFormSubmission)
+    assert isinstance(results[2].error, exceptions.FormNotFound)
+    assert repository.get_form_response_by_uuid(valid.uuid) is valid
+    assert repository.get_form_response_by_uuid(invalid.uuid) is None
+
+
+async def test_submit_many_loads_each_form_once(
+    service, existing_form, repository, monkeypatch
+) -> None:
+    loaded = []
+    get_form_by_uuid = repository.get_form_by_uuid
+
+    def spy(form_uuid: FormUUID) -> Form | None:
+        loaded.append(form_uuid)
+        return get_form_by_uuid(form_uuid)
+
+    monkeypatch.setattr(repository, "get_form_by_uuid", spy)
+    responses = [
+        FormResponse.create(for_form_uuid=existing_form.uuid) for _ in range(3)
+    ]
+
+    results = await service.submit_many(responses)
+
+    assert all(result.is_accepted for result in results)
+    assert loaded == [existing_form.uuid]
+
+
+async def test_hidden_required_field_may_be_left_empty(
+    service, existing_form, repository
+) -> None:
+    trigger = Field.create()
+    existing_form.add_field(trigger)
+    conditional = Field.create()
+    conditional.mark_required()
+    conditional.set_condition(FieldEquals(trigger.uuid, True))
+    existing_form.add_field(conditional)
+
+    response = FormResponse.create(for_form_uuid=existing_form.uuid)
+    response.add_field_response(FieldResponse.create(False, for_field=trigger.uuid))
+    await service.submit(response)
+
+    assert repository.get_form_response_by_uuid(response.uuid) is response
+
+
+async def test_answer_for_hidden_field_is_rejected(service, existing_form) -> None:
+    trigger = Field.create()
+    existing_form.add_field(trigger)
+    conditional = Field.create()
+    conditional.set_condition(FieldEquals(trigger.uuid, True))
+    existing_form.add_field(conditional)
+
+    response = FormResponse.create(for_form_uuid=existing_form.uuid)
+    response.add_field_response(FieldResponse.create(False, for_field=trigger.uuid))
+    response.add_field_response(FieldResponse.create(True, for_field=conditional.uuid))
+
+    with pytest.raises(exceptions.AnswerForHiddenField):
+        await service.submit(response)
+
+
+async def test_listeners_are_notified_of_accepted_responses(
+    async_repository, existing_form
+) -> None:
+    notified = []
+
+    class Listener(ISubmissionListener):
+        def on_accepted(self, form: Form, responses: list[FormResponse]) -> None:
+            notified.append((form, responses))
+
+    service = SubmitFormService(async_repository, listeners=[Listener()])
+    field1 = Field.create()
+    existing_form.add_field(field1)
+    valid = FormResponse.create(for_form_uuid=existing_form.uuid)
+    invalid = FormResponse.create(for_form_uuid=existing_form.uuid)
+    invalid.add_field_response(FieldResponse.create(value="no", for_field=field1.uuid))
+
+    await service.submit_many([valid, invalid])
+
+    assert notified == [(existing_form, [valid])]
+
+
+async def test_submit_many_refuses_responses_already_saved(
+    service, existing_form, repository
+) -> None:
+    other_form = Form.create(title="other")
+    repository.add("form", other_form)
+    saved = FormResponse.create(for_form_uuid=existing_form.uuid)
+    await service.submit_many([saved])
+    resubmitted = FormResponse(uuid=saved.uuid, form_uuid=other_form.uuid)
+    new = FormResponse.create(for_form_uuid=other_form.uuid)
+
+    results = await service.submit_many([resubmitted, new, new])
+
+    assert [type(result.error) for result in results] == [
+        exceptions.AlreadySubmitted,
+        type(None),
+        exceptions.AlreadySubmitted,
+    ]
+    assert repository.get_form_response_by_uuid(saved.uuid) is saved
+
+
+async def test_submit_refuses_response_already_saved(service, existing_form) -> None:
+    response = FormResponse.create(for_form_uuid=existing_form.uuid)
+    await service.submit(response)
+
+    with pytest.raises(exceptions.AlreadySubmitted):
+        await service.submit(
+            FormResponse(uuid=response.uuid, form_uuid=existing_form.uuid)
+        )
+
+
+async def test_concurrent_submissions_of_same_uuid_save_once(
+    service, existing_form, repository
+) -> None:
+    response = FormResponse.create(for_form_uuid=existing_form.uuid)
+
+    results = await asyncio.gather(
+        service.submit(response),
+        service.submit_many([response]),
+        return_exceptions=True,
+    )
+
+    assert results[0] == response.uuid
+    assert isinstance(results[1][0].error, exceptions.AlreadySubmitted)
+
+
+@pytest.mark.parametrize(
+    "forge",
+    [
+        lambda reference: {**reference, "sha256": "0" * 64},
+        lambda reference: {**reference, "size": 1},
+        lambda reference: {**reference, "media_type": "image/png"},
+    ],
+)
+async def test_file_answers_must_match_an_uploaded_blob(
+    async_repository, existing_form, tmp_path, forge
+) -> None:
+    blobs = LocalBlobStore(str(tmp_path), max_workers=1)
+    service = SubmitFormService(async_repository, blobs=blobs)
+    field = FileField.create()
+    existing_form.add_field(field)
+
+    async def content() -> AsyncIterator[bytes]:
+        yield b"hello"
+
+    reference = (await blobs.save(content(), field.limits)).to_value()
+    uploaded = FormResponse.create(for_form_uuid=existing_form.uuid)
+    uploaded.add_field_response(FieldResponse.create(reference, for_field=field.uuid))
+    forged = FormResponse.create(for_form_uuid=existing_form.uuid)
+    forged.add_field_response(
+        FieldResponse.create(forge(reference), for_field=field.uuid)
+    )
+
+    results = await service.submit_many([uploaded, forged])
+    await blobs.close()
+
+    assert results[0].is_accepted
+    assert isinstance(results[1].error, exceptions.FileNotUploaded)
+
+
+async def test_concurrent_retries_of_same_key_save_once(
+    service, existing_form, repository, monkeypatch
+) -> None:
+    saved = []
+    monkeypatch.setattr(repository, "save_form_response", saved.append)
+    responses = [
+        FormResponse.create(for_form_uuid=existing_form.uuid) for _ in range(5)
+    ]
+
+    uuids = await asyncio.gather(
+        *(service.submit(response, idempotency_key="key") for response in responses)
+    )
+
+    assert len(saved) == 1
+    assert uuids == [saved[0].uuid] * 5
+
+
+async def test_retry_of_rejected_submission_is_not_validated_again(
+    service, existing_form, repository, monkeypatch
+) -> None:
+    field1 = Field.create()
+    field1.mark_required()
+    existing_form.add_field(field1)
+    loaded = []
+    get_form_by_uuid = repository.get_form_by_uuid
+
+    def spy(form_uuid: FormUUID) -> Form | None:
+        loaded.append(form_uuid)
+        return get_form_by_uuid(form_uuid)
+
+    monkeypatch.setattr(repository, "get_form_by_uuid", spy)
+    response = FormResponse.create(for_form_uuid=existing_form.uuid)
+
+    for _ in range(2):
+        with pytest.raises(exceptions.FormDoesNotHaveAllRequiredFields):
+            await service.submit(response, idempotency_key="key")
+
+    assert loaded == [existing_form.uuid]
+
+
+async def test_retry_after_failed_save_saves_again(
+    service, existing_form, repository, monkeypatch
+) -> None:
+    response = FormResponse.create(for_form_uuid=existing_form.uuid)
+    save_form_response = repository.save_form_response
+
+    def fail(form_response: FormResponse) -> None:
+        raise OSError("disk is full")
+
+    monkeypatch.setattr(repository, "save_form_response", fail)
+    with pytest.raises(OSError):
+        await service.submit(response, idempotency_key="key")
+    monkeypatch.setattr(repository, "save_form_response", save_form_response)
+
+    assert await service.submit(response, idempotency_key="key") == response.uuid
+    assert repository.get_form_response_by_uuid(response.uuid) is response
+
+
+async def test_same_key_for_other_form_is_another_submission(
+    service, existing_form, repository, faker
+) -> None:
+    other_form = Form.create(title=faker.sentence())
+    repository.add("form", other_form)
+    response = FormResponse.create(for_form_uuid=existing_form.uuid)
+    other_response = FormResponse.create(for_form_uuid=other_form.uuid)
+
+    await service.submit(response, idempotency_key="key")
+    await service.submit(other_response, idempotency_key="key")
+
+    assert repository.get_form_response_by_uuid(other_response.uuid) is other_response
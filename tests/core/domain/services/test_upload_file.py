@@ -0,0 +1,48 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from core.domain import exceptions
+from core.domain.entities import BooleanField, FileField, Form
+from core.domain.services import UploadFileService
+from core.domain.value_objects import FieldUUID, FormUUID
+from infrastructure.blobs import LocalBlobStore
+
+
+async def stream(content: bytes) -> AsyncIterator[bytes]:
+    yield content
+
+
+@pytest.fixture
+async def service(async_repository, tmp_path) -> AsyncIterator[UploadFileService]:
+    store = LocalBlobStore(str(tmp_path), max_workers=1)
+    yield UploadFileService(async_repository, store)
+    await store.close()
+
+
+@pytest.fixture
+def form(repository) -> Form:
+    form = Form.create(title="form")
+    repository.add("form", form)
+    return form
+
+
+async def test_upload_to_file_field_returns_reference(service, form) -> None:
+    field = FileField.create()
+    form.add_field(field)
+
+    reference = await service.upload(form.uuid, field.uuid, stream(b"hello"))
+
+    assert field.is_valid(reference.to_value())
+
+
+async def test_upload_to_other_field_types_is_rejected(service, form) -> None:
+    field = BooleanField.create()
+    form.add_field(field)
+
+    with pytest.raises(exceptions.FieldDoesNotAcceptFiles):
+        await service.upload(form.uuid, field.uuid, stream(b"hello"))
+    with pytest.raises(exceptions.FormDoesNotHaveThisField):
+        await service.upload(form.uuid, FieldUUID(), stream(b"hello"))
+    with pytest.raises(exceptions.FormNotFound):
+        await service.upload(FormUUID(), field.uuid, stream(b"hello"))
@@ -0,0 +1,122 @@
+import pytest
+
+from core.domain import exceptions
+from core.domain.columns import BitColumn, CodeColumn, FormColumns
+from core.domain.entities import (
+    BooleanField,
+    FieldResponse,
+    Form,
+    FormResponse,
+    SingleSelectField,
+)
+from core.domain.value_objects import AllOf, AnyOf, FieldEquals, FieldUUID
+
+
+def _response_for(form: Form, *answers) -> FormResponse:
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    for field, value in answers:
+        response.add_field_response(FieldResponse.create(value, for_field=field.uuid))
+    return response
+
+
+@pytest.fixture
+def fields() -> tuple[BooleanField, BooleanField]:
+    return BooleanField.create(), BooleanField.create()
+
+
+@pytest.fixture
+def form(fields) -> Form:
+    form = Form.create(title="form")
+    for field in fields:
+        form.add_field(field)
+    return form
+
+
+def test_filters_combine_columns(form, fields) -> None:
+    a, b = fields
+    columns = FormColumns(form)
+    # more than eight rows, so the bitmaps span several bytes
+    responses = [
+        _response_for(form, (a, i % 2 == 0), (b, i % 3 == 0)) for i in range(20)
+    ]
+    responses.append(_response_for(form))
+    for response in responses:
+        columns.add(response)
+
+    a_and_not_b = AllOf((FieldEquals(a.uuid, True), FieldEquals(b.uuid, False)))
+    a_or_b = AnyOf((FieldEquals(a.uuid, True), FieldEquals(b.uuid, True)))
+
+    assert columns.filter(a_and_not_b) == [
+        responses[i].uuid for i in range(20) if i % 2 == 0 and i % 3 != 0
+    ]
+    assert columns.count(a_or_b) == sum(
+        1 for i in range(20) if i % 2 == 0 or i % 3 == 0
+    )
+    assert columns.filter(FieldEquals(a.uuid, None)) == [responses[20].uuid]
+
+
+def test_column_of_new_field_has_no_answers_for_earlier_rows(form, fields) -> None:
+    a, _ = fields
+    columns = FormColumns(form)
+    columns.add(_response_for(form, (a, True)))
+
+    added = BooleanField.create()
+    form.add_field(added)
+    columns.reconcile(form)
+    columns.add(_response_for(form, (added, False)))
+
+    assert columns.count(FieldEquals(added.uuid, None)) == 1
+    assert columns.count(FieldEquals(added.uuid, False)) == 1
+
+
+def test_unknown_field_cannot_be_filtered(form) -> None:
+    columns = FormColumns(form)
+
+    with pytest.raises(exceptions.FormDoesNotHaveThisField):
+        columns.count(FieldEquals(FieldUUID(), True))
+
+
+def test_code_column_matches_encoded_answers() -> None:
+    column = CodeColumn(("red", "green", "blue"), capacity=8)
+    for row, value in enumerate(["blue", None, "red", "blue", "purple"]):
+        column.set(row, value)
+
+    assert column.mask("blue") == 0b01001
+    assert column.mask(None) == 0b11110010
+    assert column.mask("purple") == 0
+
+
+@pytest.mark.parametrize("value", [["red"], {"red": 1}, 1])
+def test_code_column_matches_no_rows_for_values_of_other_types(value) -> None:
+    column = CodeColumn(("red", "green", "blue"), capacity=8)
+    column.set(0, "red")
+
+    assert column.mask(value) == 0
+
+
+@pytest.mark.parametrize("value", [1, 0, [True], {}])
+def test_bit_column_matches_no_rows_for_values_of_other_types(value) -> None:
+    column = BitColumn((False, True), capacity=8)
+    column.set(0, True)
+    column.set(1, False)
+    column.set(2, value)
+
+    assert column.mask(value) == 0
+    assert column.mask(None) & 0b111 == 0b100
+
+
+def test_select_answers_can_be_filtered() -> None:
+    field = SingleSelectField.create()
+    field.set_options(["red", "green", "blue"])
+    form = Form.create(title="form")
+    form.add_field(field)
+    columns = FormColumns(form)
+    responses = [_response_for(form, (field, value)) for value in ("red", "blue")]
+    responses.append(_response_for(form))
+    for response in responses:
+        columns.add(response)
+
+    assert columns.count(FieldEquals(field.uuid, "blue")) == 1
+    assert columns.filter(AnyOf((FieldEquals(field.uuid, "red"),))) == [
+        responses[0].uuid
+    ]
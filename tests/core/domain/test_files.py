@@ -0,0 +1,18 @@
+import pytest
+
+from core.domain.files import sniff_media_type
+
+
+@pytest.mark.parametrize(
+    ("head", "media_type"),
+    [
+        (b"\x89PNG\r\n\x1a\n\x00\x00", "image/png"),
+        (b"%PDF-1.7\n", "application/pdf"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "image/webp"),
+        ("zażółć".encode()[:-1], "text/plain"),
+        (b"\x00\x01\x02", "application/octet-stream"),
+        (b"", "application/octet-stream"),
+    ],
+)
+def test_media_type_is_sniffed_from_content(head: bytes, media_type: str) -> None:
+    assert sniff_media_type(head) == media_type
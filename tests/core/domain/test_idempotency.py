@@ -0,0 +1,51 @@
+from core.domain.idempotency import SubmissionOutcomes
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_second_claim_of_key_gets_first_outcome() -> None:
+    outcomes = SubmissionOutcomes()
+
+    first, is_first = outcomes.claim("key")
+    second, is_second_first = outcomes.claim("key")
+
+    assert (is_first, is_second_first) == (True, False)
+    assert second is first
+    assert (outcomes.hits, outcomes.misses) == (1, 1)
+
+
+async def test_key_expires_after_ttl() -> None:
+    clock = Clock()
+    outcomes = SubmissionOutcomes(ttl=10, clock=clock)
+    outcomes.claim("key")
+
+    clock.now = 10
+    _, is_first = outcomes.claim("key")
+
+    assert is_first
+    assert outcomes.evictions == 1
+
+
+async def test_oldest_key_is_dropped_over_capacity() -> None:
+    outcomes = SubmissionOutcomes(capacity=2)
+    for key in ("first", "second", "third"):
+        outcomes.claim(key)
+
+    assert len(outcomes) == 2
+    assert outcomes.claim("first")[1]
+    assert not outcomes.claim("third")[1]
+
+
+async def test_forgotten_key_is_claimed_again() -> None:
+    outcomes = SubmissionOutcomes()
+    outcome, _ = outcomes.claim("key")
+
+    outcomes.forget("key", outcome)
+
+    assert outcomes.claim("key")[1]
@@ -0,0 +1,160 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from core.domain.entities import (
+    BooleanField,
+    FieldResponse,
+    Form,
+    FormResponse,
+    SingleSelectField,
+)
+from core.domain.summaries import ResponseSummaries
+
+
+def _response_for(form: Form, *answers) -> FormResponse:
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    for field, value in answers:
+        response.add_field_response(FieldResponse.create(value, for_field=field.uuid))
+    return response
+
+
+async def _iterate(responses: list[FormResponse]) -> AsyncIterator[FormResponse]:
+    for response in responses:
+        yield response
+
+
+async def test_rebuild_counts_stored_responses() -> None:
+    field = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(field)
+    stored = [
+        _response_for(form, (field, True)),
+        _response_for(form, (field, True)),
+        _response_for(form, (field, False)),
+        _response_for(form),
+    ]
+
+    summary = await ResponseSummaries().rebuild(form, _iterate(stored))
+
+    assert summary.responses == 4
+    assert list(summary.tallies[field.uuid].items()) == [(False, 1), (True, 2)]
+
+
+async def test_accepted_responses_update_existing_summary() -> None:
+    field = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(field)
+    summaries = ResponseSummaries()
+    await summaries.rebuild(form, _iterate([]))
+
+    summaries.on_accepted(form, [_response_for(form, (field, True))])
+
+    summary = summaries.get(form)
+    assert summary.responses == 1
+    assert list(summary.tallies[field.uuid].items()) == [(False, 0), (True, 1)]
+
+
+def test_accepted_responses_without_summary_are_ignored() -> None:
+    form = Form.create(title="form")
+    summaries = ResponseSummaries()
+
+    summaries.on_accepted(form, [_response_for(form)])
+
+    assert summaries.get(form) is None
+
+
+async def test_responses_accepted_during_rebuild_are_counted_once() -> None:
+    field = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(field)
+    summaries = ResponseSummaries()
+    stored = _response_for(form, (field, True))
+    late = _response_for(form, (field, False))
+
+    async def scan() -> AsyncIterator[FormResponse]:
+        summaries.on_accepted(form, [stored, late])
+        yield stored
+
+    summary = await summaries.rebuild(form, scan())
+
+    assert summary.responses == 2
+    assert list(summary.tallies[field.uuid].items()) == [(False, 1), (True, 1)]
+
+
+async def test_responses_scanned_before_being_accepted_are_counted_once() -> None:
+    field = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(field)
+    summaries = ResponseSummaries()
+    response = _response_for(form, (field, True))
+
+    async def scan() -> AsyncIterator[FormResponse]:
+        # saved and read by the scan before the submitter reports it
+        yield response
+        summaries.on_accepted(form, [response])
+
+    summary = await summaries.rebuild(form, scan())
+
+    assert summary.responses == 1
+    assert list(summary.tallies[field.uuid].items()) == [(False, 0), (True, 1)]
+
+
+async def test_concurrent_rebuilds_share_one_scan() -> None:
+    field = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(field)
+    summaries = ResponseSummaries()
+    stored = _response_for(form, (field, True))
+    late = _response_for(form, (field, False))
+    scans = []
+
+    async def scan() -> AsyncIterator[FormResponse]:
+        scans.append(form.uuid)
+        await asyncio.sleep(0)
+        summaries.on_accepted(form, [late])
+        await asyncio.sleep(0)
+        yield stored
+
+    first, second = await asyncio.gather(
+        summaries.rebuild(form, scan()), summaries.rebuild(form, scan())
+    )
+
+    assert first is second is summaries.get(form)
+    assert scans == [form.uuid]
+    assert list(first.tallies[field.uuid].items()) == [(False, 1), (True, 1)]
+
+
+async def test_summary_follows_form_changes() -> None:
+    kept = BooleanField.create()
+    form = Form.create(title="form")
+    form.add_field(kept)
+    summaries = ResponseSummaries()
+    await summaries.rebuild(form, _iterate([_response_for(form, (kept, True))]))
+
+    added = BooleanField.create()
+    form.add_field(added)
+    summary = summaries.get(form)
+
+    assert list(summary.tallies) == [kept.uuid, added.uuid]
+    assert list(summary.tallies[kept.uuid].items()) == [(False, 0), (True, 1)]
+    assert list(summary.tallies[added.uuid].items()) == [(False, 0), (True, 0)]
+
+
+async def test_select_answers_are_counted_per_option() -> None:
+    field = SingleSelectField.create()
+    field.set_options(["red", "green", "blue"])
+    form = Form.create(title="form")
+    form.add_field(field)
+    stored = [
+        _response_for(form, (field, "blue")),
+        _response_for(form, (field, "red")),
+        _response_for(form, (field, "blue")),
+    ]
+
+    summary = await ResponseSummaries().rebuild(form, _iterate(stored))
+
+    assert list(summary.tallies[field.uuid].items()) == [
+        ("red", 1),
+        ("green", 0),
+        ("blue", 2),
+    ]
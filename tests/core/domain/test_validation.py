@@ -0,0 +1,89 @@
+from typing import Any
+
+import pytest
+
+from core.domain import exceptions
+from core.domain.entities import BooleanField as Field
+from core.domain.entities import FieldResponse, Form, FormResponse
+from core.domain.validation import SubmissionPlan, SubmissionPlanCache
+
+
+@pytest.fixture
+def form(faker) -> Form:
+    return Form.create(title=faker.sentence())
+
+
+@pytest.fixture
+def cache() -> SubmissionPlanCache:
+    return SubmissionPlanCache()
+
+
+def _response_for(form: Form, *answers: tuple[Field, Any]) -> FormResponse:
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    for form_field, value in answers:
+        field_response = FieldResponse.create(value, for_field=form_field.uuid)
+        response.add_field_response(field_response)
+    return response
+
+
+def test_plan_accepts_valid_response(form) -> None:
+    field1 = Field.create()
+    field1.mark_required()
+    form.add_field(field1)
+
+    plan = SubmissionPlan.compile(form)
+
+    plan.validate(_response_for(form, (field1, True)))
+
+
+def test_plan_rejects_missing_required_field(form) -> None:
+    field1 = Field.create()
+    field1.mark_required()
+    form.add_field(field1)
+
+    plan = SubmissionPlan.compile(form)
+
+    with pytest.raises(exceptions.FormDoesNotHaveAllRequiredFields):
+        plan.validate(_response_for(form))
+
+
+def test_plan_rejects_unknown_field(form) -> None:
+    plan = SubmissionPlan.compile(form)
+
+    with pytest.raises(exceptions.FormDoesNotHaveThisField):
+        plan.validate(_response_for(form, (Field.create(), True)))
+
+
+def test_plan_rejects_invalid_value(form) -> None:
+    field1 = Field.create()
+    form.add_field(field1)
+
+    plan = SubmissionPlan.compile(form)
+
+    with pytest.raises(exceptions.InvalidFormSubmission):
+        plan.validate(_response_for(form, (field1, "invalid")))
+
+
+def test_cache_reuses_plan_for_unchanged_form(form, cache) -> None:
+    assert cache.get(form) is cache.get(form)
+
+
+def test_cache_recompiles_plan_when_field_is_added(form, cache) -> None:
+    plan = cache.get(form)
+    field1 = Field.create()
+
+    form.add_field(field1)
+
+    assert cache.get(form) is not plan
+    assert field1.uuid in cache.get(form).validators
+
+
+def test_cache_recompiles_plan_when_field_becomes_required(form, cache) -> None:
+    field1 = Field.create()
+    form.add_field(field1)
+    cache.get(form).validate(_response_for(form))
+
+    field1.mark_required()
+
+    with pytest.raises(exceptions.FormDoesNotHaveAllRequiredFields):
+        cache.get(form).validate(_response_for(form))
@@ -32,3 +32,12 @@ def test_form_response_uuid_is_unique() -> None:
     uuid2 = FormResponseUUID()
 
     assert uuid1 != uuid2
+
+
+def test_uuids_are_slotted_and_compare_by_value() -> None:
+    uuid = FormUUID()
+    same_uuid = FormUUID(uuid.value)
+
+    assert not hasattr(uuid, "__dict__")
+    assert uuid == same_uuid
+    assert hash(uuid) == hash(same_uuid)
@@ -0,0 +1,275 @@
+import random
+
+import pytest
+
+from core.domain import exceptions, visibility
+from core.domain.entities import BooleanField as Field
+from core.domain.entities import Form
+from core.domain.entities.form import MAX_CONDITION_DEPTH
+from core.domain.value_objects import AllOf, AnyOf, FieldEquals
+from core.domain.visibility import VisibilityRules
+
+
+@pytest.fixture
+def form(faker) -> Form:
+    return Form.create(title=faker.sentence())
+
+
+@pytest.fixture
+def brunch_form(form) -> tuple[Form, list[Field]]:
+    # 4 is visible iff 1 == Y AND (2 == Y OR 3 == Y)
+    lunch, toast, pancakes, brunch = (Field.create() for _ in range(4))
+    brunch.set_condition(
+        AllOf(
+            (
+                FieldEquals(lunch.uuid, True),
+                AnyOf(
+                    (FieldEquals(toast.uuid, True), FieldEquals(pancakes.uuid, True))
+                ),
+            )
+        )
+    )
+    for form_field in (lunch, toast, pancakes, brunch):
+        form.add_field(form_field)
+    return form, [lunch, toast, pancakes, brunch]
+
+
+@pytest.mark.parametrize(
+    "lunch, toast, pancakes, is_visible",
+    [
+        (True, True, False, True),
+        (True, False, True, True),
+        (True, False, False, False),
+        (False, True, True, False),
+        (None, None, None, False),
+    ],
+)
+def test_and_or_condition(brunch_form, lunch, toast, pancakes, is_visible) -> None:
+    form, fields = brunch_form
+    values = {
+        field.uuid: value
+        for field, value in zip(fields, (lunch, toast, pancakes))
+        if value is not None
+    }
+
+    hidden = VisibilityRules.compile(form).get_hidden_fields(values)
+
+    assert (fields[3].uuid not in hidden) is is_visible
+
+
+def test_fields_without_condition_are_always_visible(form) -> None:
+    form.add_field(Field.create())
+
+    rules = VisibilityRules.compile(form)
+
+    assert rules.get_hidden_fields({}) == set()
+
+
+def test_answer_of_hidden_field_does_not_reveal_dependants(form) -> None:
+    first, second, third = (Field.create() for _ in range(3))
+    for form_field in (third, second, first):
+        form.add_field(form_field)
+    third.set_condition(FieldEquals(second.uuid, True))
+    second.set_condition(FieldEquals(first.uuid, True))
+
+    hidden = VisibilityRules.compile(form).get_hidden_fields(
+        {first.uuid: False, second.uuid: True}
+    )
+
+    assert hidden == {second.uuid, third.uuid}
+
+
+def test_cyclic_conditions_are_rejected_by_form(form) -> None:
+    first, second = Field.create(), Field.create()
+    form.add_field(first)
+    form.add_field(second)
+    first.set_condition(FieldEquals(second.uuid, True))
+
+    with pytest.raises(exceptions.FormHasCyclicConditions):
+        second.set_condition(FieldEquals(first.uuid, True))
+
+    assert second.condition is None
+    assert VisibilityRules.compile(form).order == [first.uuid]
+
+
+def test_condition_on_field_outside_of_form_is_rejected_by_form(form) -> None:
+    some_field = Field.create()
+    some_field.set_condition(FieldEquals(Field.create().uuid, True))
+
+    with pytest.raises(exceptions.FormDoesNotHaveThisField):
+        form.add_field(some_field)
+
+    assert not form.has_field(some_field.uuid)
+
+
+def test_empty_all_of_is_true_and_empty_any_of_is_false(form) -> None:
+    always, never = Field.create(), Field.create()
+    always.set_condition(AllOf(()))
+    never.set_condition(AnyOf(()))
+    form.add_field(always)
+    form.add_field(never)
+
+    hidden = VisibilityRules.compile(form).get_hidden_fields({})
+
+    assert hidden == {never.uuid}
+
+
+@pytest.fixture
+def chain_form(form) -> tuple[Form, list[Field]]:
+    # every field is only visible if the previous one is answered with True
+    fields = [Field.create() for _ in range(4)]
+    for previous, current in zip(fields, fields[1:]):
+        current.set_condition(FieldEquals(previous.uuid, True))
+    for form_field in fields:
+        form.add_field(form_field)
+    return form, fields
+
+
+def test_downstream_fields_are_in_evaluation_order(chain_form) -> None:
+    form, fields = chain_form
+
+    rules = VisibilityRules.compile(form)
+
+    assert rules.get_downstream(fields[1].uuid) == [fields[2].uuid, fields[3].uuid]
+    assert rules.get_downstream(fields[3].uuid) == []
+
+
+def test_visibility_change_reports_fields_that_appear(chain_form) -> None:
+    form, fields = chain_form
+    rules = VisibilityRules.compile(form)
+
+    change = rules.get_visibility_change({}, fields[0].uuid, True)
+
+    assert change.shown == {fields[1].uuid}
+    assert change.hidden == set()
+
+
+def test_visibility_change_hides_whole_chain(chain_form) -> None:
+    form, fields = chain_form
+    rules = VisibilityRules.compile(form)
+    answers = {fields[0].uuid: True, fields[1].uuid: True, fields[2].uuid: True}
+
+    change = rules.get_visibility_change(answers, fields[0].uuid, False)
+
+    assert change.shown == set()
+    assert change.hidden == {fields[1].uuid, fields[2].uuid, fields[3].uuid}
+
+
+def test_visibility_change_matches_full_evaluation(brunch_form) -> None:
+    form, (lunch, toast, pancakes, brunch) = brunch_form
+    rules = VisibilityRules.compile(form)
+    answers = {lunch.uuid: True, toast.uuid: False}
+
+    change = rules.get_visibility_change(answers, pancakes.uuid, True)
+
+    before = rules.get_hidden_fields(answers)
+    after = rules.get_hidden_fields({**answers, pancakes.uuid: True})
+    assert change.shown == before - after
+    assert change.hidden == after - before
+
+
+@pytest.mark.parametrize("value", [True, False])
+def test_visibility_change_matches_full_evaluation_on_long_chain(form, value) -> None:
+    fields = [Field.create() for _ in range(40)]
+    for previous, current in zip(fields, fields[1:]):
+        current.set_condition(FieldEquals(previous.uuid, True))
+    for form_field in fields:
+        form.add_field(form_field)
+    rules = VisibilityRules.compile(form)
+    answers = {form_field.uuid: True for form_field in fields[:20]}
+
+    for changed in fields[:21]:
+        change = rules.get_visibility_change(answers, changed.uuid, value)
+
+        before = rules.get_hidden_fields(answers)
+        after = rules.get_hidden_fields({**answers, changed.uuid: value})
+        assert change.shown == before - after
+        assert change.hidden == after - before
+
+
+def test_visibility_change_on_wide_form_is_incremental(form) -> None:
+    # a short chain among many independent conditional fields, so a change
+    # at its start reaches too few conditions for the full evaluator
+    trigger, *chain = (Field.create() for _ in range(4))
+    others = [Field.create() for _ in range(40)]
+    for form_field in [trigger, *chain, *others]:
+        form.add_field(form_field)
+    for previous, current in zip([trigger, *chain], chain):
+        current.set_condition(FieldEquals(previous.uuid, True))
+    for other in others:
+        other.set_condition(FieldEquals(trigger.uuid, None))
+    answers = {trigger.uuid: True, chain[0].uuid: True, chain[1].uuid: True}
+    expected = VisibilityRules.compile(form)
+    rules = VisibilityRules.compile(form)
+
+    def fail(values: dict) -> set:
+        raise AssertionError("evaluated the whole form")
+
+    rules._evaluate = fail
+    change = rules.get_visibility_change(answers, chain[0].uuid, False)
+
+    before = expected.get_hidden_fields(answers)
+    after = expected.get_hidden_fields({**answers, chain[0].uuid: False})
+    assert change.shown == before - after == set()
+    assert change.hidden == after - before == {chain[1].uuid, chain[2].uuid}
+
+
+def _random_condition(generator: random.Random, fields: list[Field], depth: int = 0):
+    if depth == 2 or generator.random() < 0.5:
+        return FieldEquals(generator.choice(fields).uuid, generator.choice(_VALUES))
+    children = tuple(
+        _random_condition(generator, fields, depth + 1)
+        for _ in range(generator.randint(0, 3))
+    )
+    return (AllOf if generator.random() < 0.5 else AnyOf)(children)
+
+
+_VALUES = (True, False, None)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_incremental_visibility_change_matches_full_evaluation(
+    form, monkeypatch, seed
+) -> None:
+    # no change reaches enough conditions for the full evaluator
+    monkeypatch.setattr(visibility, "_INCREMENTAL_COST_RATIO", 0)
+    generator = random.Random(seed)
+    fields = [Field.create() for _ in range(12)]
+    for position, form_field in enumerate(fields):
+        form.add_field(form_field)
+        if position >= 2 and generator.random() < 0.7:
+            form_field.set_condition(_random_condition(generator, fields[:position]))
+    rules = VisibilityRules.compile(form)
+
+    for _ in range(20):
+        # answers only ever hold visible fields, as callers keep them
+        answers = {
+            form_field.uuid: generator.choice(_VALUES)
+            for form_field in fields
+            if generator.random() < 0.7
+        }
+        hidden = rules.get_hidden_fields(answers)
+        answers = {uuid: value for uuid, value in answers.items() if uuid not in hidden}
+        changed = generator.choice([f.uuid for f in fields if f.uuid not in hidden])
+        value = generator.choice(_VALUES)
+
+        change = rules.get_visibility_change(answers, changed, value)
+
+        after = rules.get_hidden_fields({**answers, changed: value})
+        assert change.shown == hidden - after
+        assert change.hidden == after - hidden
+
+
+def test_conditions_as_deep_as_allowed_compile() -> None:
+    trigger, some_field = Field.create(), Field.create()
+    condition = FieldEquals(trigger.uuid, True)
+    for level in range(MAX_CONDITION_DEPTH - 1):
+        condition = (AllOf if level % 2 else AnyOf)((condition,))
+    some_field.set_condition(condition)
+    form = Form.create(title="form")
+    form.add_fields([trigger, some_field])
+
+    rules = VisibilityRules.compile(form)
+
+    assert rules.get_hidden_fields({trigger.uuid: False}) == {some_field.uuid}
+    assert rules.get_hidden_fields({trigger.uuid: True}) == set()
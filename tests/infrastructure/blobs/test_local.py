@@ -0,0 +1,68 @@
+import hashlib
+from collections.abc import AsyncIterator
+
+import pytest
+
+from core.domain import exceptions
+from core.domain.value_objects import FileLimits
+from infrastructure.blobs import LocalBlobStore
+
+_PNG = b"\x89PNG\r\n\x1a\n" + bytes(2000)
+
+
+async def stream(content: bytes, chunk_size: int = 300) -> AsyncIterator[bytes]:
+    for start in range(0, len(content), chunk_size):
+        yield content[start : start + chunk_size]
+
+
+@pytest.fixture
+async def store(tmp_path) -> AsyncIterator[LocalBlobStore]:
+    store = LocalBlobStore(str(tmp_path), max_workers=1)
+    yield store
+    await store.close()
+
+
+async def test_streamed_content_is_stored_by_its_hash(store) -> None:
+    reference = await store.save(stream(_PNG), FileLimits(max_size=len(_PNG)))
+
+    assert reference.sha256 == hashlib.sha256(_PNG).hexdigest()
+    assert reference.size == len(_PNG)
+    assert reference.media_type == "image/png"
+    assert store.get_path(reference).read_bytes() == _PNG
+
+
+async def test_stored_blob_is_described_by_its_content(store) -> None:
+    reference = await store.save(stream(_PNG), FileLimits(max_size=len(_PNG)))
+
+    assert await store.get(reference.sha256) == reference
+    assert await store.get(hashlib.sha256(b"other").hexdigest()) is None
+
+
+async def test_too_large_upload_is_stopped_and_discarded(store, tmp_path) -> None:
+    received = []
+
+    async def chunks() -> AsyncIterator[bytes]:
+        async for chunk in stream(_PNG):
+            received.append(chunk)
+            yield chunk
+
+    with pytest.raises(exceptions.FileTooLarge):
+        await store.save(chunks(), FileLimits(max_size=1000))
+
+    assert len(received) == 4
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+async def test_disallowed_type_is_rejected_once_sniffed(store, tmp_path) -> None:
+    limits = FileLimits(max_size=len(_PNG), media_types=frozenset({"application/pdf"}))
+
+    with pytest.raises(exceptions.FileTypeNotAllowed):
+        await store.save(stream(_PNG), limits)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["uploads"]
+
+
+async def test_small_file_is_sniffed_when_complete(store) -> None:
+    reference = await store.save(stream(b"hello"), FileLimits(max_size=5))
+
+    assert reference.media_type == "text/plain"
@@ -0,0 +1,169 @@
+import threading
+import time
+
+import pytest
+
+from core.domain.entities import BooleanField, FieldResponse, Form, FormResponse
+from core.domain.value_objects import FormUUID, FormResponseUUID
+from infrastructure.repositories import InMemoryRepository
+
+
+@pytest.fixture
+def repository() -> InMemoryRepository:
+    return InMemoryRepository()
+
+
+@pytest.fixture
+def form(repository) -> Form:
+    form = Form.create(title="form")
+    repository.save_form(form)
+    return form
+
+
+def test_get_form_by_uuid_returns_saved_form(repository, form) -> None:
+    assert repository.get_form_by_uuid(form.uuid) is form
+
+
+def test_get_form_by_uuid_returns_none_for_unknown_form(repository) -> None:
+    assert repository.get_form_by_uuid(FormUUID()) is None
+
+
+def test_get_all_forms(repository, form) -> None:
+    other_form = Form.create(title="other")
+    repository.save_form(other_form)
+
+    assert repository.get_all_forms() == {form, other_form}
+
+
+def test_save_form_replaces_form_with_same_uuid(repository, form) -> None:
+    same_form = Form(uuid=form.uuid, title="renamed")
+    repository.save_form(same_form)
+
+    assert repository.get_form_by_uuid(form.uuid) is same_form
+    assert len(repository.get_all_forms()) == 1
+
+
+def test_replacing_form_gets_greater_version(repository, form) -> None:
+    previous_version = form.version
+    repository.save_form(Form(uuid=form.uuid, title="renamed"))
+
+    assert repository.get_form_by_uuid(form.uuid).version == previous_version + 1
+
+
+def test_get_saved_response_uuids(repository, form) -> None:
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    repository.save_form_response(response)
+
+    assert repository.get_saved_response_uuids([response.uuid, FormResponseUUID()]) == {
+        response.uuid
+    }
+
+
+def test_get_form_response_by_uuid(repository, form) -> None:
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    repository.save_form_response(response)
+
+    assert repository.get_form_response_by_uuid(response.uuid) is response
+    assert repository.get_form_response_by_uuid(FormResponseUUID()) is None
+
+
+def test_get_responses_for_form_only_returns_responses_of_that_form(
+    repository, form
+) -> None:
+    response1 = FormResponse.create(for_form_uuid=form.uuid)
+    response2 = FormResponse.create(for_form_uuid=form.uuid)
+    other_response = FormResponse.create(for_form_uuid=FormUUID())
+    for response in (response1, response2, other_response):
+        repository.save_form_response(response)
+
+    assert list(repository.get_responses_for_form(form.uuid)) == [
+        response1,
+        response2,
+    ]
+    assert list(repository.get_responses_for_form(FormUUID())) == []
+
+
+def test_get_forms_page_continues_after_given_form(repository, form) -> None:
+    other_forms = [Form.create(title="other") for _ in range(3)]
+    for other_form in other_forms:
+        repository.save_form(other_form)
+    ordered = sorted([form, *other_forms], key=lambda form: form.uuid.value)
+
+    assert repository.get_forms_page(None, 2) == ordered[:2]
+    assert repository.get_forms_page(ordered[1].uuid, 5) == ordered[2:]
+
+
+def test_get_responses_by_value_pages_in_insertion_order(repository, form) -> None:
+    field = BooleanField.create()
+    form.add_field(field)
+    responses = []
+    for value in (True, False, True, True):
+        response = FormResponse.create(for_form_uuid=form.uuid)
+        response.add_field_response(FieldResponse.create(value, for_field=field.uuid))
+        repository.save_form_response(response)
+        responses.append(response)
+    matching = [responses[0], responses[2], responses[3]]
+
+    first_page = repository.get_responses_by_value(form.uuid, field.uuid, True, None, 2)
+    second_page = repository.get_responses_by_value(
+        form.uuid, field.uuid, True, first_page[-1].uuid, 2
+    )
+
+    assert first_page == matching[:2]
+    assert second_page == matching[2:]
+    assert repository.get_responses_by_value(form.uuid, field.uuid, 1, None, 5) == []
+
+
+def test_saving_response_again_moves_it_to_its_new_value(repository, form) -> None:
+    field = BooleanField.create()
+    form.add_field(field)
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    response.add_field_response(FieldResponse.create(True, for_field=field.uuid))
+    repository.save_form_response(response)
+    updated = FormResponse.create(for_form_uuid=form.uuid)
+    updated.uuid = response.uuid
+    updated.add_field_response(FieldResponse.create(False, for_field=field.uuid))
+
+    repository.save_form_response(updated)
+
+    assert repository.get_responses_by_value(form.uuid, field.uuid, True, None, 5) == []
+    assert repository.get_responses_by_value(form.uuid, field.uuid, False, None, 5) == [
+        updated
+    ]
+
+
+def test_concurrent_saves_index_every_response(repository, form) -> None:
+    field = BooleanField.create()
+    form.add_field(field)
+
+    class SlowList(list):
+        # widens the gap between reading the next sequence number and using it
+        def __len__(self) -> int:
+            length = super().__len__()
+            time.sleep(0.001)
+            return length
+
+    repository._responses_by_sequence = SlowList()
+    batches = []
+    for _ in range(4):
+        batch = []
+        for _ in range(10):
+            response = FormResponse.create(for_form_uuid=form.uuid)
+            response.add_field_response(
+                FieldResponse.create(True, for_field=field.uuid)
+            )
+            batch.append(response)
+        batches.append(batch)
+
+    def save(batch: list[FormResponse]) -> None:
+        for response in batch:
+            repository.save_form_response(response)
+
+    threads = [threading.Thread(target=save, args=(batch,)) for batch in batches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    found = repository.get_responses_by_value(form.uuid, field.uuid, True, None, 100)
+    assert len({response.uuid for response in found}) == 40
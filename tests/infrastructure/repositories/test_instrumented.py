@@ -0,0 +1,26 @@
+from core.domain.entities import Form, FormResponse
+from infrastructure.repositories import (
+    InMemoryRepository,
+    InstrumentedRepository,
+    ThreadPoolRepository,
+)
+from infrastructure.repositories.instrumented import REPOSITORY_SECONDS
+
+
+async def test_every_call_is_timed() -> None:
+    repository = InstrumentedRepository(ThreadPoolRepository(InMemoryRepository()))
+    form = Form.create(title="form")
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    saves = REPOSITORY_SECONDS.labels("save_form_response")
+    scans = REPOSITORY_SECONDS.labels("get_responses_for_form")
+    saves_before, scans_before = sum(saves.counts), sum(scans.counts)
+
+    await repository.save_form(form)
+    await repository.save_form_response(response)
+    streamed = [r async for r in repository.get_responses_for_form(form.uuid)]
+
+    assert await repository.get_form_by_uuid(form.uuid) is form
+    assert streamed == [response]
+    assert sum(saves.counts) == saves_before + 1
+    assert sum(scans.counts) == scans_before + 1
+    await repository.close()
@@ -0,0 +1,17 @@
+from core.domain.entities import Form
+from infrastructure.repositories import InMemoryRepository, NotifyingRepository
+
+
+def test_saved_forms_are_reported_after_saving() -> None:
+    inner = InMemoryRepository()
+    saved = []
+    repository = NotifyingRepository(
+        inner,
+        on_form_saved=lambda form: saved.append(inner.get_form_by_uuid(form.uuid)),
+    )
+    form = Form.create(title="form")
+
+    repository.save_form(form)
+
+    assert saved == [form]
+    assert repository.get_form_by_uuid(form.uuid) is form
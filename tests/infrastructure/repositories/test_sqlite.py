@@ -0,0 +1,252 @@
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from core.domain.entities import (
+    BooleanField,
+    FieldResponse,
+    FileField,
+    Form,
+    FormResponse,
+    SingleSelectField,
+)
+from core.domain.value_objects import (
+    AllOf,
+    AnyOf,
+    FieldEquals,
+    FileLimits,
+    FormResponseUUID,
+    FormUUID,
+)
+from infrastructure.repositories import SqliteRepository
+
+
+@pytest.fixture
+def database_path(tmp_path) -> str:
+    return str(tmp_path / "forms.sqlite3")
+
+
+@pytest.fixture
+def repository(database_path) -> Iterator[SqliteRepository]:
+    repository = SqliteRepository(database_path, pool_size=2)
+    yield repository
+    repository.close()
+
+
+@pytest.fixture
+def form(repository) -> Form:
+    form = Form.create(title="form")
+    for _ in range(3):
+        form.add_field(BooleanField.create())
+    form.get_ordered_fields()[1].mark_required()
+    repository.save_form(form)
+    return form
+
+
+def _response_for(form: Form, value: bool = True) -> FormResponse:
+    response = FormResponse.create(for_form_uuid=form.uuid)
+    for form_field in form.get_ordered_fields():
+        response.add_field_response(
+            FieldResponse.create(value, for_field=form_field.uuid)
+        )
+    return response
+
+
+def test_saved_form_is_read_back_with_its_fields(repository, form) -> None:
+    saved = repository.get_form_by_uuid(form.uuid)
+
+    assert saved == form
+    assert saved.version == form.version
+    assert saved.get_ordered_fields() == form.get_ordered_fields()
+    assert saved.get_required_field_uuids() == form.get_required_field_uuids()
+
+
+def test_field_conditions_are_read_back(repository, form) -> None:
+    first, second, third = form.get_ordered_fields()
+    condition = AllOf(
+        (
+            FieldEquals(first.uuid, True),
+            AnyOf((FieldEquals(second.uuid, True), FieldEquals(second.uuid, False))),
+        )
+    )
+    third.set_condition(condition)
+    repository.save_form(form)
+
+    saved = repository.get_form_by_uuid(form.uuid)
+
+    assert saved.get_ordered_fields()[2].condition == condition
+    assert saved.get_ordered_fields()[0].condition is None
+
+
+def test_unknown_form_is_none(repository) -> None:
+    assert repository.get_form_by_uuid(FormUUID()) is None
+
+
+def test_get_all_forms(repository, form) -> None:
+    empty_form = Form.create(title="empty")
+    repository.save_form(empty_form)
+
+    assert repository.get_all_forms() == {form, empty_form}
+
+
+def test_get_forms_page_continues_after_given_form(repository, form) -> None:
+    other_forms = [Form.create(title="other") for _ in range(3)]
+    for other_form in other_forms:
+        repository.save_form(other_form)
+    ordered = sorted([form, *other_forms], key=lambda form: form.uuid.value)
+
+    first_page = repository.get_forms_page(None, 2)
+    second_page = repository.get_forms_page(ordered[1].uuid, 5)
+
+    assert first_page == ordered[:2]
+    assert second_page == ordered[2:]
+    loaded_form = next(
+        page_form
+        for page_form in first_page + second_page
+        if page_form.uuid == form.uuid
+    )
+    assert loaded_form.get_ordered_fields() == form.get_ordered_fields()
+
+
+def test_saving_form_again_replaces_its_fields(repository, form) -> None:
+    form.get_ordered_fields()[0].mark_required()
+    form.add_field(BooleanField.create())
+    repository.save_form(form)
+
+    saved = repository.get_form_by_uuid(form.uuid)
+
+    assert saved.get_ordered_fields() == form.get_ordered_fields()
+    assert saved.get_required_field_uuids() == form.get_required_field_uuids()
+    assert saved.version == form.version
+
+
+def test_replacing_form_gets_greater_version(repository, form) -> None:
+    replacement = Form(uuid=form.uuid, title="renamed", version=form.version)
+    repository.save_form(replacement)
+
+    assert replacement.version == form.version + 1
+    assert repository.get_form_by_uuid(form.uuid).version == form.version + 1
+
+
+def test_condition_on_later_field_is_read_back(repository, form) -> None:
+    first, _, last = form.get_ordered_fields()
+    first.set_condition(FieldEquals(last.uuid, True))
+    repository.save_form(form)
+
+    saved = repository.get_form_by_uuid(form.uuid)
+
+    assert saved.get_ordered_fields()[0].condition == FieldEquals(last.uuid, True)
+
+
+def test_field_settings_are_read_back(repository, form) -> None:
+    file_field = FileField.create()
+    file_field.set_limits(FileLimits(max_size=5, media_types=frozenset({"image/png"})))
+    form.add_field(file_field)
+    select_field = SingleSelectField.create()
+    select_field.set_options(["b", "a"])
+    form.add_field(select_field)
+    repository.save_form(form)
+
+    saved = repository.get_form_by_uuid(form.uuid)
+
+    assert saved.get_field(file_field.uuid).limits == file_field.limits
+    assert saved.get_field(select_field.uuid).options == ("b", "a")
+
+
+def test_saved_response_is_read_back(repository, form) -> None:
+    response = _response_for(form)
+
+    repository.save_form_response(response)
+
+    assert repository.get_form_response_by_uuid(response.uuid) == response
+    assert repository.get_form_response_by_uuid(FormResponseUUID()) is None
+
+
+def test_saving_response_again_replaces_its_answers(repository, form) -> None:
+    response = _response_for(form)
+    repository.save_form_response(response)
+    updated = _response_for(form, value=False)
+    updated.uuid = response.uuid
+
+    repository.save_form_response(updated)
+
+    assert repository.get_form_response_by_uuid(response.uuid) == updated
+
+
+def test_responses_for_form_are_streamed_in_insertion_order(repository, form) -> None:
+    responses = [_response_for(form) for _ in range(3)]
+    empty_response = FormResponse.create(for_form_uuid=form.uuid)
+    repository.save_form_responses([*responses, empty_response])
+    repository.save_form_response(_response_for(Form.create(title="other")))
+
+    assert list(repository.get_responses_for_form(form.uuid)) == [
+        *responses,
+        empty_response,
+    ]
+
+
+def test_responses_for_form_are_read_page_by_page(database_path) -> None:
+    repository = SqliteRepository(database_path, pool_size=1, page_size=2)
+    form = Form.create(title="form")
+    form.add_field(BooleanField.create())
+    repository.save_form(form)
+    responses = [_response_for(form) for _ in range(5)]
+    repository.save_form_responses(responses)
+
+    streamed = repository.get_responses_for_form(form.uuid)
+    first = next(streamed)
+    # the only connection is free again while the caller holds the stream
+    loaded = []
+    reader = threading.Thread(
+        target=lambda: loaded.append(repository.get_form_by_uuid(form.uuid)),
+        daemon=True,
+    )
+    reader.start()
+    reader.join(timeout=5)
+    assert loaded == [form]
+    late = _response_for(form)
+    repository.save_form_response(late)
+
+    assert [first, *streamed] == [*responses, late]
+    repository.close()
+
+
+def test_responses_by_value_are_paged_in_insertion_order(repository, form) -> None:
+    field_uuid = form.get_ordered_fields()[0].uuid
+    matching = [_response_for(form) for _ in range(3)]
+    repository.save_form_responses([matching[0], _response_for(form, value=False)])
+    repository.save_form_responses(matching[1:])
+
+    first_page = repository.get_responses_by_value(form.uuid, field_uuid, True, None, 2)
+    second_page = repository.get_responses_by_value(
+        form.uuid, field_uuid, True, first_page[-1].uuid, 2
+    )
+
+    assert first_page == matching[:2]
+    assert second_page == matching[2:]
+    assert repository.get_responses_by_value(form.uuid, field_uuid, "x", None, 2) == []
+
+
+def test_data_survives_reopening_the_database(repository, database_path, form) -> None:
+    response = _response_for(form)
+    repository.save_form_response(response)
+    repository.close()
+
+    reopened = SqliteRepository(database_path)
+
+    assert reopened.get_form_by_uuid(form.uuid) == form
+    assert reopened.get_form_response_by_uuid(response.uuid) == response
+    reopened.close()
+
+
+def test_saved_response_uuids_are_found_in_chunks(repository, form) -> None:
+    responses = [FormResponse.create(for_form_uuid=form.uuid) for _ in range(600)]
+    repository.save_form_responses(responses)
+    unknown = FormResponseUUID()
+
+    saved = repository.get_saved_response_uuids(
+        [unknown] + [response.uuid for response in responses]
+    )
+
+    assert saved == {response.uuid for response in responses}
@@ -0,0 +1,67 @@
+import threading
+from collections.abc import AsyncIterator
+
+import pytest
+
+from core.domain.entities import Form, FormResponse
+from infrastructure.repositories import InMemoryRepository, ThreadPoolRepository
+
+
+@pytest.fixture
+def repository() -> InMemoryRepository:
+    return InMemoryRepository()
+
+
+@pytest.fixture
+async def async_repository(repository) -> AsyncIterator[ThreadPoolRepository]:
+    async_repository = ThreadPoolRepository(repository, max_workers=2, batch_size=2)
+    yield async_repository
+    await async_repository.close()
+
+
+async def test_saved_form_can_be_read_back(async_repository) -> None:
+    form = Form.create(title="form")
+
+    await async_repository.save_form(form)
+
+    assert await async_repository.get_form_by_uuid(form.uuid) is form
+    assert await async_repository.get_all_forms() == {form}
+
+
+async def test_calls_run_outside_of_event_loop_thread(
+    async_repository, repository, monkeypatch
+) -> None:
+    threads = []
+
+    def get_all_forms() -> set[Form]:
+        threads.append(threading.current_thread())
+        return set()
+
+    monkeypatch.setattr(repository, "get_all_forms", get_all_forms)
+
+    await async_repository.get_all_forms()
+
+    assert threads[0] is not threading.current_thread()
+
+
+async def test_responses_for_form_are_streamed_in_batches(async_repository) -> None:
+    form = Form.create(title="form")
+    responses = [FormResponse.create(for_form_uuid=form.uuid) for _ in range(5)]
+    await async_repository.save_form_responses(responses)
+
+    streamed = [
+        response
+        async for response in async_repository.get_responses_for_form(form.uuid)
+    ]
+
+    assert streamed == responses
+
+
+async def test_close_closes_wrapped_repository(repository, monkeypatch) -> None:
+    closed = []
+    monkeypatch.setattr(repository, "close", lambda: closed.append(True))
+    async_repository = ThreadPoolRepository(repository)
+
+    await async_repository.close()
+
+    assert closed == [True]
@@ -0,0 +1,27 @@
+import sqlite3
+
+from infrastructure.sqlite.migrations import MIGRATIONS, migrate
+
+
+def test_migrate_brings_schema_to_latest_version(tmp_path) -> None:
+    connection = sqlite3.connect(tmp_path / "db.sqlite3")
+
+    migrate(connection)
+
+    (version,) = connection.execute("PRAGMA user_version").fetchone()
+    assert version == len(MIGRATIONS)
+
+
+def test_migrate_is_idempotent(tmp_path) -> None:
+    connection = sqlite3.connect(tmp_path / "db.sqlite3")
+    migrate(connection)
+
+    migrate(connection)
+
+    tables = {
+        name
+        for (name,) in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )
+    }
+    assert {"forms", "fields", "form_responses", "field_responses"} <= tables
@@ -1,3 +1,6 @@
+import json
+from collections.abc import Iterator
+from typing import Any
 from uuid import UUID
 
 from core.domain.entities import Form, FormResponse
@@ -5,25 +8,18 @@ from core.domain.entities.base import Aggregate
 from core.domain.repositories import IRepository
 from collections import defaultdict
 
-from core.domain.value_objects import FormUUID, FormResponseUUID
+from core.domain.value_objects import FieldUUID, FormUUID, FormResponseUUID
 
 
 class TestsRepository(IRepository):
     def __init__(self) -> None:
-        self._tables = defaultdict(set)
+        self._tables = defaultdict(dict)
 
     def add(self, table_name: str, record: Aggregate) -> None:
-        self._tables[table_name].add(record)
+        self._tables[table_name][record.uuid.value] = record
 
     def _get_by_id(self, table_name: str, uuid: UUID) -> Aggregate | None:
-        maybe_record = next(
-            filter(
-                lambda r: r.uuid.value == uuid,
-                self._tables[table_name],
-            ),
-            None,
-        )
-        return maybe_record
+        return self._tables[table_name].get(uuid)
 
     def get_form_by_uuid(self, form_uuid: FormUUID) -> Form | None:
         return self._get_by_id("form", form_uuid.value)
@@ -33,11 +29,52 @@ class TestsRepository(IRepository):
     ) -> FormResponse | None:
         return self._get_by_id("form_response", form_uuid.value)
 
+    def get_responses_for_form(self, form_uuid: FormUUID) -> Iterator[FormResponse]:
+        return (
+            response
+            for response in list(self._tables["form_response"].values())
+            if response.form_uuid == form_uuid
+        )
+
+    def get_responses_by_value(
+        self,
+        form_uuid: FormUUID,
+        field_uuid: FieldUUID,
+        value: Any,
+        after: FormResponseUUID | None,
+        limit: int,
+    ) -> list[FormResponse]:
+        responses = list(self.get_responses_for_form(form_uuid))
+        if after is not None:
+            uuids = [response.uuid for response in responses]
+            responses = responses[uuids.index(after) + 1 :] if after in uuids else []
+        return [
+            response
+            for response in responses
+            if (answer := response.get_response(field_uuid)) is not None
+            and json.dumps(answer.value) == json.dumps(value)
+        ][:limit]
+
+    def get_saved_response_uuids(
+        self, uuids: list[FormResponseUUID]
+    ) -> set[FormResponseUUID]:
+        return {uuid for uuid in uuids if uuid.value in self._tables["form_response"]}
+
     def save_form_response(self, form_response: FormResponse) -> None:
         self.add("form_response", form_response)
 
+    def save_form_responses(self, form_responses: list[FormResponse]) -> None:
+        for form_response in form_responses:
+            self.save_form_response(form_response)
+
+    def get_forms_page(self, after: FormUUID | None, limit: int) -> list[Form]:
+        forms = sorted(self._tables["form"].values(), key=lambda form: form.uuid.value)
+        if after is not None:
+            forms = [form for form in forms if form.uuid.value > after.value]
+        return forms[:limit]
+
     def get_all_forms(self) -> set[Form]:
-        return self._tables["form"]
+        return set(self._tables["form"].values())
 
     def save_form(self, form: Form) -> None:
         self.add("form", form)
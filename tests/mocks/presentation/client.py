@@ -0,0 +1,104 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import FastAPI
+
+
+@dataclass
+class Response:
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+# Minimal in-process ASGI client, so API tests do not need an HTTP library
+class TestsClient:
+    def __init__(self, app: FastAPI) -> None:
+        self._app = app
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json_body: Any = None,
+        headers: dict[str, str] | None = None,
+        query_string: str = "",
+        chunks: list[bytes] | None = None,
+    ) -> Response:
+        # `chunks` are sent as a raw body, one ASGI message each
+        if chunks is None:
+            body = b"" if json_body is None else json.dumps(json_body).encode()
+            chunks = [body]
+            raw_headers = [(b"content-type", b"application/json")]
+        else:
+            raw_headers = [(b"content-type", b"application/octet-stream")]
+        raw_headers += [
+            (name.lower().encode(), value.encode())
+            for name, value in (headers or {}).items()
+        ]
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": query_string.encode(),
+            "headers": raw_headers,
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+        messages = [
+            {"type": "http.request", "body": chunk, "more_body": True}
+            for chunk in chunks
+        ]
+        messages[-1]["more_body"] = False
+        sent: list[dict] = []
+        finished = asyncio.Event()
+
+        # the client only disconnects once the whole response was sent, so
+        # streaming responses are not cut short
+        async def receive() -> dict:
+            if messages:
+                return messages.pop(0)
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict) -> None:
+            sent.append(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                finished.set()
+
+        await self._app(scope, receive, send)
+
+        start = next(m for m in sent if m["type"] == "http.response.start")
+        return Response(
+            status_code=start["status"],
+            headers={name.decode(): value.decode() for name, value in start["headers"]},
+            content=b"".join(
+                m.get("body", b"") for m in sent if m["type"] == "http.response.body"
+            ),
+        )
+
+    async def get(self, path: str, **kwargs: Any) -> Response:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> Response:
+        return await self.request("POST", path, **kwargs)
+
+
+@asynccontextmanager
+async def running(app: FastAPI) -> AsyncIterator[TestsClient]:
+    async with app.router.lifespan_context(app):
+        yield TestsClient(app)
@@ -0,0 +1,28 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from infrastructure.blobs import LocalBlobStore
+from infrastructure.repositories import InMemoryRepository, ThreadPoolRepository
+from presentation.api.main import create_app
+from presentation.api.resources import Resources
+from tests.mocks.presentation.client import TestsClient, running
+
+
+@pytest.fixture
+def repository() -> InMemoryRepository:
+    return InMemoryRepository()
+
+
+@pytest.fixture
+def resources(repository, tmp_path) -> Resources:
+    return Resources(
+        repository=ThreadPoolRepository(repository, max_workers=1),
+        blob_store=LocalBlobStore(str(tmp_path / "blobs"), max_workers=1),
+    )
+
+
+@pytest.fixture
+async def client(resources) -> AsyncIterator[TestsClient]:
+    async with running(create_app(lambda: resources)) as client:
+        yield client
@@ -0,0 +1,426 @@
+from uuid import UUID
+
+from core.domain.entities import BooleanField, FileField, Form, SingleSelectField
+from core.domain.value_objects import FieldEquals, FileLimits, FormResponseUUID
+
+
+async def test_list_all_forms_reads_from_app_repository(client, repository) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+
+    response = await client.get("/forms")
+
+    assert response.status_code == 200
+    assert response.json() == [{"uuid": str(form.uuid.value), "title": "form"}]
+
+
+async def test_list_all_forms_links_to_next_page(client, repository) -> None:
+    forms = [Form.create(title="form") for _ in range(3)]
+    for form in forms:
+        repository.save_form(form)
+    first, second, _ = sorted(form.uuid.value for form in forms)
+
+    response = await client.get("/forms", query_string="limit=2&fields=uuid")
+
+    assert response.json() == [{"uuid": str(first)}, {"uuid": str(second)}]
+    assert response.headers["link"] == (
+        f'<http://testserver/forms?limit=2&fields=uuid&after={second}>; rel="next"'
+    )
+
+
+async def test_list_all_forms_rejects_too_large_page(client) -> None:
+    response = await client.get("/forms", query_string="limit=100000")
+
+    assert response.status_code == 422
+
+
+async def test_get_form_is_not_modified_while_version_is_unchanged(
+    client, repository
+) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+
+    first = await client.get(f"/forms/{form.uuid.value}")
+    etag = first.headers["etag"]
+    cached = await client.get(
+        f"/forms/{form.uuid.value}", headers={"If-None-Match": f"W/{etag}"}
+    )
+    form.add_field(BooleanField.create())
+    changed = await client.get(
+        f"/forms/{form.uuid.value}", headers={"If-None-Match": etag}
+    )
+
+    assert first.status_code == 200
+    assert first.json() == {"uuid": str(form.uuid.value), "version": 0}
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+async def test_replaced_form_is_modified_even_at_same_version(
+    client, repository
+) -> None:
+    form = Form.create(title="form")
+    form.add_field(BooleanField.create())
+    repository.save_form(form)
+    first = await client.get(f"/forms/{form.uuid.value}")
+
+    repository.save_form(
+        Form(
+            uuid=form.uuid,
+            title="renamed",
+            fields={BooleanField.create()},
+            version=form.version,
+        )
+    )
+    response = await client.get(
+        f"/forms/{form.uuid.value}", headers={"If-None-Match": first.headers["etag"]}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != first.headers["etag"]
+
+
+async def test_get_unknown_form_is_not_found(client, faker) -> None:
+    response = await client.get(f"/forms/{faker.uuid4()}")
+
+    assert response.status_code == 404
+
+
+async def test_submitted_batch_is_saved_in_app_repository(client, repository) -> None:
+    form = Form.create(title="form")
+    field = BooleanField.create()
+    form.add_field(field)
+    repository.save_form(form)
+
+    response = await client.post(
+        f"/forms/{form.uuid.value}/responses:batch",
+        json_body=[
+            {"field_responses": [{"field_uuid": str(field.uuid.value), "value": True}]}
+        ],
+    )
+
+    assert response.status_code == 200
+    [result] = response.json()
+    assert result["accepted"] is True
+    assert len(list(repository.get_responses_for_form(form.uuid))) == 1
+
+
+async def test_resubmitted_response_uuid_is_not_saved_again(client, repository) -> None:
+    form, other_form = Form.create(title="form"), Form.create(title="other")
+    repository.save_form(form)
+    repository.save_form(other_form)
+    answer = {"uuid": str(FormResponseUUID().value), "field_responses": []}
+
+    await client.post(f"/forms/{form.uuid.value}/responses:batch", json_body=[answer])
+    batch = await client.post(
+        f"/forms/{other_form.uuid.value}/responses:batch", json_body=[answer]
+    )
+    single = await client.post(
+        f"/forms/{other_form.uuid.value}/responses", json_body=answer
+    )
+    summary = await client.get(f"/forms/{form.uuid.value}/summary")
+
+    assert batch.json()[0]["error"] == "AlreadySubmitted"
+    assert single.status_code == 409
+    assert summary.json()["responses"] == 1
+    assert len(list(repository.get_responses_for_form(form.uuid))) == 1
+
+
+async def test_visibility_change(client, repository) -> None:
+    trigger, conditional = BooleanField.create(), BooleanField.create()
+    conditional.set_condition(FieldEquals(trigger.uuid, True))
+    form = Form.create(title="form")
+    form.add_field(trigger)
+    form.add_field(conditional)
+    repository.save_form(form)
+
+    response = await client.post(
+        f"/forms/{form.uuid.value}/visibility",
+        json_body={
+            "answers": [{"field_uuid": str(trigger.uuid.value), "value": True}],
+            "changed": {"field_uuid": str(trigger.uuid.value), "value": False},
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"shown": [], "hidden": [str(conditional.uuid.value)]}
+
+
+async def test_visibility_change_for_unknown_field_is_unprocessable(
+    client, repository, faker
+) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+
+    response = await client.post(
+        f"/forms/{form.uuid.value}/visibility",
+        json_body={"changed": {"field_uuid": faker.uuid4(), "value": True}},
+    )
+
+    assert response.status_code == 422
+
+
+async def test_summary_counts_submitted_responses(client, repository) -> None:
+    form = Form.create(title="form")
+    field = BooleanField.create()
+    form.add_field(field)
+    repository.save_form(form)
+    answer = {"field_responses": [{"field_uuid": str(field.uuid.value), "value": True}]}
+
+    await client.get(f"/forms/{form.uuid.value}/summary")
+    await client.post(
+        f"/forms/{form.uuid.value}/responses:batch", json_body=[answer, answer]
+    )
+    response = await client.get(f"/forms/{form.uuid.value}/summary")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "form_uuid": str(form.uuid.value),
+        "responses": 2,
+        "fields": [
+            {
+                "field_uuid": str(field.uuid.value),
+                "counts": [{"value": False, "count": 0}, {"value": True, "count": 2}],
+            }
+        ],
+    }
+
+
+async def test_summary_of_unknown_form_is_not_found(client, faker) -> None:
+    response = await client.get(f"/forms/{faker.uuid4()}/summary")
+
+    assert response.status_code == 404
+
+
+async def test_export_streams_responses_as_csv(client, repository) -> None:
+    form = Form.create(title="form")
+    field = BooleanField.create()
+    form.add_field(field)
+    repository.save_form(form)
+    answer = {"field_responses": [{"field_uuid": str(field.uuid.value), "value": True}]}
+    await client.post(f"/forms/{form.uuid.value}/responses:batch", json_body=[answer])
+
+    response = await client.get(
+        f"/forms/{form.uuid.value}/responses/export", query_string="format=csv"
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    header, row = response.content.decode().splitlines()
+    assert header == f"uuid,{field.uuid.value}"
+    assert row.endswith(",true")
+
+
+async def test_export_of_unknown_form_is_not_found(client, faker) -> None:
+    response = await client.get(f"/forms/{faker.uuid4()}/responses/export")
+
+    assert response.status_code == 404
+
+
+async def test_export_in_unknown_format_is_unprocessable(client, faker) -> None:
+    response = await client.get(
+        f"/forms/{faker.uuid4()}/responses/export", query_string="format=xml"
+    )
+
+    assert response.status_code == 422
+
+
+async def test_count_includes_submitted_responses(client, repository) -> None:
+    form = Form.create(title="form")
+    field = BooleanField.create()
+    form.add_field(field)
+    repository.save_form(form)
+    where = {"where": [{"field_uuid": str(field.uuid.value), "value": False}]}
+    answer = {
+        "field_responses": [{"field_uuid": str(field.uuid.value), "value": False}]
+    }
+
+    before = await client.post(
+        f"/forms/{form.uuid.value}/responses:count", json_body=where
+    )
+    await client.post(f"/forms/{form.uuid.value}/responses:batch", json_body=[answer])
+    after = await client.post(
+        f"/forms/{form.uuid.value}/responses:count", json_body=where
+    )
+
+    assert before.json() == {"count": 0}
+    assert after.json() == {"count": 1}
+
+
+async def test_count_by_value_no_answer_can_have_is_zero(client, repository) -> None:
+    form = Form.create(title="form")
+    field = SingleSelectField.create()
+    field.set_options(["a", "b", "c"])
+    form.add_field(field)
+    repository.save_form(form)
+    answer = {"field_responses": [{"field_uuid": str(field.uuid.value), "value": "a"}]}
+    await client.post(f"/forms/{form.uuid.value}/responses:batch", json_body=[answer])
+
+    counts = [
+        await client.post(
+            f"/forms/{form.uuid.value}/responses:count",
+            json_body={
+                "where": [{"field_uuid": str(field.uuid.value), "value": value}]
+            },
+        )
+        for value in (["a"], {"a": 1}, 1)
+    ]
+
+    assert [count.status_code for count in counts] == [200, 200, 200]
+    assert [count.json() for count in counts] == [{"count": 0}] * 3
+
+
+async def test_count_by_unknown_field_is_unprocessable(
+    client, repository, faker
+) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+
+    response = await client.post(
+        f"/forms/{form.uuid.value}/responses:count",
+        json_body={"where": [{"field_uuid": faker.uuid4(), "value": True}]},
+    )
+
+    assert response.status_code == 422
+
+
+async def test_responses_with_value_link_to_next_page(client, repository) -> None:
+    form = Form.create(title="form")
+    field = BooleanField.create()
+    form.add_field(field)
+    repository.save_form(form)
+    answer = {"field_responses": [{"field_uuid": str(field.uuid.value), "value": True}]}
+    await client.post(
+        f"/forms/{form.uuid.value}/responses:batch", json_body=[answer, answer]
+    )
+    query_string = f"field={field.uuid.value}&value=true&limit=1"
+
+    response = await client.get(
+        f"/forms/{form.uuid.value}/responses", query_string=query_string
+    )
+
+    [item] = response.json()
+    assert item["field_responses"] == answer["field_responses"]
+    assert response.headers["link"] == (
+        f"<http://testserver/forms/{form.uuid.value}/responses?{query_string}"
+        f'&after={item["uuid"]}>; rel="next"'
+    )
+
+
+async def test_responses_with_value_of_unknown_field_is_unprocessable(
+    client, repository, faker
+) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+
+    response = await client.get(
+        f"/forms/{form.uuid.value}/responses",
+        query_string=f"field={faker.uuid4()}&value=true",
+    )
+
+    assert response.status_code == 422
+
+
+async def test_submitted_response_is_saved_and_counted(client, repository) -> None:
+    form = Form.create(title="form")
+    field = BooleanField.create()
+    form.add_field(field)
+    repository.save_form(form)
+    answer = {"field_responses": [{"field_uuid": str(field.uuid.value), "value": True}]}
+
+    response = await client.post(
+        f"/forms/{form.uuid.value}/responses", json_body=answer
+    )
+    summary = await client.get(f"/forms/{form.uuid.value}/summary")
+
+    assert response.status_code == 201
+    assert list(repository.get_responses_for_form(form.uuid))[0].uuid.value == UUID(
+        response.json()["uuid"]
+    )
+    assert summary.json()["responses"] == 1
+
+
+async def test_submitting_to_unknown_form_is_not_found(client, faker) -> None:
+    response = await client.post(
+        f"/forms/{faker.uuid4()}/responses", json_body={"field_responses": []}
+    )
+
+    assert response.status_code == 404
+
+
+async def test_retried_submission_with_idempotency_key_is_saved_once(
+    client, repository
+) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+    url = f"/forms/{form.uuid.value}/responses"
+    headers = {"Idempotency-Key": "retry-me"}
+
+    first = await client.post(url, json_body={"field_responses": []}, headers=headers)
+    retried = await client.post(url, json_body={"field_responses": []}, headers=headers)
+
+    assert retried.json() == first.json()
+    assert len(list(repository.get_responses_for_form(form.uuid))) == 1
+
+
+async def test_uploaded_file_is_submitted_by_reference(client, repository) -> None:
+    form = Form.create(title="form")
+    field = FileField.create()
+    form.add_field(field)
+    repository.save_form(form)
+
+    upload = await client.post(
+        f"/forms/{form.uuid.value}/fields/{field.uuid.value}/files",
+        chunks=[b"%PDF-1.7\n", b"x" * 1000],
+    )
+    answer = {
+        "field_responses": [
+            {"field_uuid": str(field.uuid.value), "value": upload.json()}
+        ]
+    }
+    submitted = await client.post(
+        f"/forms/{form.uuid.value}/responses", json_body=answer
+    )
+
+    assert upload.status_code == 201
+    assert upload.json()["media_type"] == "application/pdf"
+    assert upload.json()["size"] == 1009
+    assert submitted.status_code == 201
+
+
+async def test_file_never_uploaded_is_not_accepted(client, repository) -> None:
+    form = Form.create(title="form")
+    field = FileField.create()
+    form.add_field(field)
+    repository.save_form(form)
+    reference = {"sha256": "0" * 64, "size": 10, "media_type": "application/pdf"}
+
+    response = await client.post(
+        f"/forms/{form.uuid.value}/responses",
+        json_body={
+            "field_responses": [
+                {"field_uuid": str(field.uuid.value), "value": reference}
+            ]
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == [{"msg": "FileNotUploaded"}]
+
+
+async def test_upload_over_field_limit_is_too_large(client, repository) -> None:
+    form = Form.create(title="form")
+    field = FileField.create()
+    field.set_limits(FileLimits(max_size=100))
+    form.add_field(field)
+    repository.save_form(form)
+
+    response = await client.post(
+        f"/forms/{form.uuid.value}/fields/{field.uuid.value}/files",
+        chunks=[b"x" * 80, b"x" * 80],
+    )
+
+    assert response.status_code == 413
@@ -0,0 +1,34 @@
+from presentation.api.main import create_app
+from presentation.api.resources import Resources
+from tests.mocks.presentation.client import running
+
+
+async def test_healthcheck(client) -> None:
+    response = await client.get("/healthcheck")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+async def test_resources_are_created_once_and_closed_on_shutdown(
+    resources, monkeypatch
+) -> None:
+    created: list[Resources] = []
+    closed: list[Resources] = []
+
+    def factory() -> Resources:
+        created.append(resources)
+        return resources
+
+    async def close() -> None:
+        closed.append(resources)
+
+    monkeypatch.setattr(resources, "close", close)
+
+    async with running(create_app(factory)) as client:
+        await client.get("/forms")
+        await client.get("/forms")
+        assert closed == []
+
+    assert created == [resources]
+    assert closed == [resources]
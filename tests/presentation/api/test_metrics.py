@@ -0,0 +1,32 @@
+import inspect
+
+from core.domain.entities import Form
+from presentation.api.metrics import metrics
+
+
+async def test_requests_are_exposed_per_route(client, repository) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+    await client.get(f"/forms/{form.uuid.value}")
+    await client.get("/no-such-route")
+
+    response = await client.get("/metrics")
+
+    lines = response.content.decode().splitlines()
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'custom_forms_http_request_seconds_count{method="GET",route="/forms/{form_uuid}"}'
+        in {line.rsplit(" ", 1)[0] for line in lines}
+    )
+    assert any(
+        line.startswith(
+            'custom_forms_http_responses_total{method="GET",route="unmatched",status="404"}'
+        )
+        for line in lines
+    )
+    assert 'custom_forms_cache_requests_total{cache="form",result="miss"} 1' in lines
+
+
+def test_metrics_are_rendered_on_the_event_loop() -> None:
+    assert inspect.iscoroutinefunction(metrics)
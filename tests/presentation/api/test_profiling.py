@@ -0,0 +1,117 @@
+import asyncio
+import pstats
+
+import pytest
+
+from core.domain.entities import Form
+from presentation.api.main import create_app
+from presentation.api.profiling import (
+    ProfilingMiddleware,
+    ProfilingSettings,
+    load_profiling_settings,
+)
+from tests.mocks.presentation.client import running
+
+
+def _functions(path) -> set[str]:
+    return {function for _, _, function in pstats.Stats(str(path)).stats}
+
+
+async def test_requests_with_the_token_are_profiled(
+    resources, repository, tmp_path
+) -> None:
+    form = Form.create(title="form")
+    repository.save_form(form)
+    settings = ProfilingSettings(directory=str(tmp_path / "profiles"), token="secret")
+
+    async with running(create_app(lambda: resources, lambda: settings)) as client:
+        await client.get(f"/forms/{form.uuid.value}")
+        await client.get(
+            f"/forms/{form.uuid.value}", headers={"x-custom-forms-profile": "wrong"}
+        )
+        response = await client.get(
+            f"/forms/{form.uuid.value}", headers={"x-custom-forms-profile": "secret"}
+        )
+
+    (profile,) = (tmp_path / "profiles").iterdir()
+    assert response.status_code == 200
+    assert profile.name.endswith("-GET-forms_form_uuid.prof")
+    assert "handle" in _functions(profile)
+
+
+async def test_requests_are_sampled_at_the_rate(resources, tmp_path) -> None:
+    samples = iter([0.5, 0.05, 0.2])
+    settings = ProfilingSettings(directory=str(tmp_path), rate=0.1)
+    app = create_app(lambda: resources, lambda: None)
+    app.add_middleware(
+        ProfilingMiddleware, settings=settings, sample=lambda: next(samples)
+    )
+
+    async with running(app) as client:
+        for _ in range(3):
+            await client.get("/healthcheck")
+
+    (profile,) = tmp_path.iterdir()
+    assert profile.name.endswith("-GET-healthcheck.prof")
+
+
+async def test_concurrent_requests_are_profiled_one_at_a_time(tmp_path) -> None:
+    release = asyncio.Event()
+
+    async def app(scope, receive, send) -> None:
+        await release.wait()
+
+    middleware = ProfilingMiddleware(
+        app, ProfilingSettings(directory=str(tmp_path), rate=1.0)
+    )
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+    requests = [asyncio.create_task(middleware(scope, None, None)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*requests)
+
+    assert middleware.profiles == 1
+    assert [path.name.split("-", 1)[1] for path in tmp_path.iterdir()] == [
+        "GET-root.prof"
+    ]
+
+
+async def test_profiling_is_not_installed_when_off(resources) -> None:
+    app = create_app(lambda: resources, lambda: None)
+
+    assert all(
+        middleware.cls is not ProfilingMiddleware for middleware in app.user_middleware
+    )
+
+
+@pytest.mark.parametrize(
+    ("environment", "expected"),
+    [
+        ({}, None),
+        (
+            {"CUSTOM_FORMS_PROFILE_DIRECTORY": "/tmp/profiles"},
+            ProfilingSettings(directory="/tmp/profiles"),
+        ),
+        (
+            {
+                "CUSTOM_FORMS_PROFILE_DIRECTORY": "/tmp/profiles",
+                "CUSTOM_FORMS_PROFILE_RATE": "0.01",
+                "CUSTOM_FORMS_PROFILE_TOKEN": "secret",
+            },
+            ProfilingSettings(directory="/tmp/profiles", rate=0.01, token="secret"),
+        ),
+    ],
+)
+def test_settings_are_loaded_from_the_environment(
+    monkeypatch, environment, expected
+) -> None:
+    for name in (
+        "CUSTOM_FORMS_PROFILE_DIRECTORY",
+        "CUSTOM_FORMS_PROFILE_RATE",
+        "CUSTOM_FORMS_PROFILE_TOKEN",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in environment.items():
+        monkeypatch.setenv(name, value)
+
+    assert load_profiling_settings() == expected
@@ -0,0 +1,35 @@
+import pytest
+
+from core.domain import exceptions
+from core.domain.entities import BooleanField, Form, FormResponse
+from presentation.api.resources import create_resources
+
+
+@pytest.mark.parametrize("database", [None, "forms.db"])
+async def test_replaced_form_is_checked_against_its_new_fields(
+    monkeypatch, tmp_path, database
+) -> None:
+    if database is None:
+        monkeypatch.delenv("CUSTOM_FORMS_DATABASE", raising=False)
+    else:
+        monkeypatch.setenv("CUSTOM_FORMS_DATABASE", str(tmp_path / database))
+    monkeypatch.setenv("CUSTOM_FORMS_BLOB_DIRECTORY", str(tmp_path / "blobs"))
+    resources = create_resources()
+    await resources.start()
+    service = resources.submit_form_service
+    try:
+        form = Form.create(title="form")
+        await resources.repository.save_form(form)
+        await service.submit(FormResponse.create(for_form_uuid=form.uuid))
+
+        required = BooleanField.create()
+        required.mark_required()
+        # a new object with the same uuid, its version starts over
+        await resources.repository.save_form(
+            Form(uuid=form.uuid, title="form", fields={required})
+        )
+
+        with pytest.raises(exceptions.FormDoesNotHaveAllRequiredFields):
+            await service.submit(FormResponse.create(for_form_uuid=form.uuid))
+    finally:
+        await resources.close()